@@ -0,0 +1,90 @@
+using System;
+using System.IO;
+using System.Text;
+using UnityEngine;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP.Editor.Services
+{
+    /// <summary>
+    /// Same-host bulk transfer: large responses are written to a temp file that the
+    /// Python client memory-maps, and only a small handle goes over the socket
+    /// </summary>
+    public static class BulkTransferService
+    {
+        // Constants for bulk file management
+        public const string FilePrefix = "unity-mcp-bulk-";
+        public const long MaxBulkBytes = 512L * 1024 * 1024;
+        private static readonly TimeSpan StaleFileAge = TimeSpan.FromMinutes(10);
+
+        /// <summary>
+        /// Directory holding pending bulk payloads
+        /// </summary>
+        public static string BulkDirectory => Path.Combine(Path.GetTempPath(), "UnityMCP", "bulk");
+
+        /// <summary>
+        /// Write the response to a bulk file if it exceeds the client's threshold
+        /// </summary>
+        /// <param name="responseJson">Serialized response</param>
+        /// <param name="requestId">Request id to echo in the handle</param>
+        /// <param name="threshold">Client threshold in bytes (0 disables bulk transfer)</param>
+        /// <returns>Handle response JSON, or null to send the response inline</returns>
+        public static string TryCreateHandle(string responseJson, string requestId, int threshold)
+        {
+            if (threshold <= 0 || responseJson.Length < threshold)
+                return null;
+
+            var bytes = Encoding.UTF8.GetBytes(responseJson);
+            if (bytes.Length < threshold || bytes.Length > MaxBulkBytes)
+                return null;
+
+            try
+            {
+                Directory.CreateDirectory(BulkDirectory);
+                var path = Path.Combine(BulkDirectory, $"{FilePrefix}{Guid.NewGuid():N}.json");
+                File.WriteAllBytes(path, bytes);
+
+                var handle = new JObject
+                {
+                    ["id"] = requestId,
+                    ["bulk"] = new JObject
+                    {
+                        ["path"] = path,
+                        ["size"] = bytes.Length,
+                        ["encoding"] = "utf-8"
+                    }
+                };
+                return handle.ToString(Newtonsoft.Json.Formatting.None);
+            }
+            catch (Exception e)
+            {
+                // Fall back to an inline frame if the temp file cannot be written
+                Debug.LogWarning($"[UnityMCPBridge] Bulk transfer failed, sending inline: {e.Message}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Delete bulk files the client never picked up
+        /// </summary>
+        public static void CleanupStaleFiles()
+        {
+            try
+            {
+                if (!Directory.Exists(BulkDirectory)) return;
+
+                foreach (var file in Directory.GetFiles(BulkDirectory, FilePrefix + "*"))
+                {
+                    if (DateTime.UtcNow - File.GetLastWriteTimeUtc(file) > StaleFileAge)
+                    {
+                        File.Delete(file);
+                    }
+                }
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning($"[UnityMCPBridge] Bulk cleanup failed: {e.Message}");
+            }
+        }
+    }
+}
@@ -18,16 +18,34 @@ namespace UnityMCP.Editor.Services
             public string Message { get; set; }
             public string StackTrace { get; set; }
             public LogType Type { get; set; }
+            // Timestamp of the latest occurrence; FirstTimestamp of the first one
             public DateTime Timestamp { get; set; }
+            public DateTime FirstTimestamp { get; set; }
+            public string Fingerprint { get; set; }
+            public string Template { get; set; }
+            public string TopFrame { get; set; }
+            public int Count { get; set; }
         }
 
         // Constants for log management
         private const int MaxLogEntries = 1000;
         private const int CleanupThreshold = 200;
 
+        /// <summary>
+        /// Duplicates (same fingerprint) within this many seconds of the previous occurrence are collapsed
+        /// into one entry with a count; consecutive duplicates are always collapsed
+        /// </summary>
+        public static double CollapseWindowSeconds = 10.0;
+
         // Collection to store all log messages
         private readonly List<LogEntry> _logEntries = new List<LogEntry>();
 
+        // Latest entry per fingerprint, for windowed collapsing
+        private readonly Dictionary<string, LogEntry> _recentByFingerprint = new Dictionary<string, LogEntry>();
+
+        // Bounded top-fingerprint index over every captured message
+        private readonly FingerprintIndex _fingerprintIndex = new FingerprintIndex();
+
         // Singleton instance
         private static ConsoleLogsService _instance;
         public static ConsoleLogsService Instance => _instance ??= new ConsoleLogsService();
@@ -78,12 +96,14 @@ namespace UnityMCP.Editor.Services
             JArray logsArray = new JArray();
             bool filter = !string.IsNullOrEmpty(logType) && !string.Equals(logType, "all", StringComparison.OrdinalIgnoreCase);
             int totalCount = 0;
+            long totalMessages = 0;
             int filteredCount = 0;
             int currentIndex = 0;
 
             lock (_logEntries)
             {
                 totalCount = _logEntries.Count;
+                totalMessages = _fingerprintIndex.Total;
 
                 // Single pass: count filtered entries and collect the requested page (newest first)
                 for (int i = _logEntries.Count - 1; i >= 0; i--)
@@ -104,9 +124,19 @@ namespace UnityMCP.Editor.Services
                         {
                             ["message"] = entry.Message,
                             ["type"] = entry.Type.ToString(),
-                            ["timestamp"] = entry.Timestamp.ToString("yyyy-MM-dd HH:mm:ss.fff")
+                            ["timestamp"] = entry.Timestamp.ToString("yyyy-MM-dd HH:mm:ss.fff"),
+                            ["fingerprint"] = entry.Fingerprint,
+                            ["template"] = entry.Template,
+                            ["topFrame"] = entry.TopFrame,
+                            ["count"] = entry.Count
                         };
 
+                        if (entry.Count > 1)
+                        {
+                            logObject["firstTimestamp"] = entry.FirstTimestamp.ToString("yyyy-MM-dd HH:mm:ss.fff");
+                            logObject["lastTimestamp"] = logObject["timestamp"];
+                        }
+
                         if (includeStackTrace)
                         {
                             logObject["stackTrace"] = entry.StackTrace;
@@ -126,6 +156,7 @@ namespace UnityMCP.Editor.Services
             {
                 ["logs"] = logsArray,
                 ["totalCount"] = totalCount,
+                ["totalMessages"] = totalMessages,
                 ["filteredCount"] = filteredCount,
                 ["returnedCount"] = logsArray.Count,
                 ["success"] = true,
@@ -135,6 +166,28 @@ namespace UnityMCP.Editor.Services
             };
         }
 
+        /// <summary>
+        /// Get the most frequent log fingerprints since the last clear
+        /// </summary>
+        /// <param name="logType">Filter by log type (empty for all)</param>
+        /// <param name="limit">Maximum number of fingerprints to return</param>
+        public JObject GetFingerprintsAsJson(string logType = "", int limit = 20)
+        {
+            lock (_logEntries)
+            {
+                var fingerprints = _fingerprintIndex.Top(limit, logType);
+                return new JObject
+                {
+                    ["fingerprints"] = fingerprints,
+                    ["tracked"] = _fingerprintIndex.Count,
+                    ["capacity"] = _fingerprintIndex.Capacity,
+                    ["totalMessages"] = _fingerprintIndex.Total,
+                    ["success"] = true,
+                    ["message"] = $"Top {fingerprints.Count} of {_fingerprintIndex.Count} fingerprints ({_fingerprintIndex.Total} messages)"
+                };
+            }
+        }
+
         /// <summary>
         /// Clear all stored logs
         /// </summary>
@@ -143,6 +196,8 @@ namespace UnityMCP.Editor.Services
             lock (_logEntries)
             {
                 _logEntries.Clear();
+                _recentByFingerprint.Clear();
+                _fingerprintIndex.Clear();
             }
         }
 
@@ -202,21 +257,56 @@ namespace UnityMCP.Editor.Services
                 logString.StartsWith("[UnityMCPAutoStarter]"))
                 return;
 
+            var now = DateTime.Now;
+            var typeName = type.ToString();
+            var template = LogFingerprint.NormalizeMessage(logString);
+            var topFrame = LogFingerprint.TopFrame(stackTrace);
+            var fingerprint = LogFingerprint.Compute(typeName, template, topFrame);
+
             // Add the log entry to our collection
             lock (_logEntries)
             {
-                _logEntries.Add(new LogEntry
+                _fingerprintIndex.Add(fingerprint, template, topFrame, typeName, logString, now);
+
+                // Collapse consecutive duplicates, and duplicates within the window, into one counted entry
+                bool isLast = _logEntries.Count > 0 && _logEntries[_logEntries.Count - 1].Fingerprint == fingerprint;
+                if (_recentByFingerprint.TryGetValue(fingerprint, out var recent) &&
+                    (isLast || (now - recent.Timestamp).TotalSeconds <= CollapseWindowSeconds))
+                {
+                    recent.Count++;
+                    recent.Timestamp = now;
+                    recent.Message = logString;
+                    recent.StackTrace = stackTrace;
+                    if (!isLast)
+                    {
+                        // Keep list order by latest occurrence so newest-first paging sees the entry first
+                        _logEntries.RemoveAt(_logEntries.LastIndexOf(recent));
+                        _logEntries.Add(recent);
+                    }
+                    return;
+                }
+
+                var entry = new LogEntry
                 {
                     Message = logString,
                     StackTrace = stackTrace,
                     Type = type,
-                    Timestamp = DateTime.Now
-                });
+                    Timestamp = now,
+                    FirstTimestamp = now,
+                    Fingerprint = fingerprint,
+                    Template = template,
+                    TopFrame = topFrame,
+                    Count = 1
+                };
+                _logEntries.Add(entry);
+                _recentByFingerprint[fingerprint] = entry;
 
                 // Clean up old entries if we exceed the maximum
                 if (_logEntries.Count > MaxLogEntries)
                 {
                     _logEntries.RemoveRange(0, CleanupThreshold);
+                    // Evicted entries must not keep absorbing duplicates
+                    _recentByFingerprint.Clear();
                 }
 
                 // Debug output for capturing activity (temporarily enabled)
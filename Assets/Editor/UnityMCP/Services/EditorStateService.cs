@@ -0,0 +1,175 @@
+using System;
+using UnityEditor;
+using UnityEditor.Compilation;
+using UnityEngine;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP.Editor.Services
+{
+    /// <summary>
+    /// Tracks whether the editor can serve requests (ready, compiling, reloading, playmode)
+    /// and raises StateChanged so the bridge can push status frames to clients
+    /// </summary>
+    [InitializeOnLoad]
+    public static class EditorStateService
+    {
+        public const string Ready = "ready";
+        public const string Compiling = "compiling";
+        public const string Reloading = "reloading";
+        public const string PlayMode = "playmode";
+
+        // Session keys survive the domain reload, so reload time can be measured across it
+        private const string ReloadStartKey = "UnityMCP.ReloadStartTicks";
+        private const string LastReloadMsKey = "UnityMCP.LastReloadMs";
+        private const string LastCompileMsKey = "UnityMCP.LastCompileMs";
+
+        private static volatile string state = Ready;
+        private static DateTime stateSinceUtc = DateTime.UtcNow;
+
+        // Cached for BuildStatus, which also runs on WebSocket threads
+        private static int lastCompileMs = 5000;
+        private static int lastReloadMs = 3000;
+
+        /// <summary>
+        /// Raised on the main thread with the new status frame
+        /// </summary>
+        public static event Action<JObject> StateChanged;
+
+        public static string State => state;
+
+        static EditorStateService()
+        {
+            lastCompileMs = SessionState.GetInt(LastCompileMsKey, lastCompileMs);
+            RecordReloadDuration();
+            lastReloadMs = SessionState.GetInt(LastReloadMsKey, lastReloadMs);
+
+            CompilationPipeline.compilationStarted += _ => SetState(Compiling);
+            CompilationPipeline.compilationFinished += _ => Poll();
+            AssemblyReloadEvents.beforeAssemblyReload += NotifyReloading;
+            EditorApplication.playModeStateChanged += OnPlayModeStateChanged;
+            EditorApplication.update += Poll;
+
+            Poll();
+        }
+
+        /// <summary>
+        /// Mark the domain reload before the bridge socket goes away
+        /// </summary>
+        public static void NotifyReloading()
+        {
+            if (state == Reloading) return;
+
+            SessionState.SetString(ReloadStartKey, DateTime.UtcNow.Ticks.ToString());
+            SetState(Reloading);
+        }
+
+        /// <summary>
+        /// Mark a play mode transition before the bridge is stopped for it
+        /// </summary>
+        public static void NotifyPlayModeTransition()
+        {
+            SetState(PlayMode);
+        }
+
+        /// <summary>
+        /// Status frame pushed to clients and returned by unity.get_editor_state
+        /// </summary>
+        public static JObject BuildStatus()
+        {
+            string current = state;
+            return new JObject
+            {
+                ["type"] = "status",
+                ["state"] = current,
+                ["busy"] = current != Ready,
+                ["retryAfterMs"] = EstimateRetryAfterMs(current),
+                ["timestamp"] = DateTime.Now.ToString("yyyy-MM-dd HH:mm:ss.fff")
+            };
+        }
+
+        private static void OnPlayModeStateChanged(PlayModeStateChange change)
+        {
+            if (change == PlayModeStateChange.ExitingEditMode || change == PlayModeStateChange.ExitingPlayMode)
+            {
+                SetState(PlayMode);
+            }
+            else
+            {
+                Poll();
+            }
+        }
+
+        private static void Poll()
+        {
+            // A reload ends with a fresh domain, which starts out ready
+            if (state == Reloading) return;
+
+            if (EditorApplication.isCompiling)
+            {
+                SetState(Compiling);
+            }
+            else if (EditorApplication.isPlayingOrWillChangePlaymode != EditorApplication.isPlaying)
+            {
+                SetState(PlayMode);
+            }
+            else
+            {
+                SetState(Ready);
+            }
+        }
+
+        private static void SetState(string newState)
+        {
+            if (state == newState) return;
+
+            if (state == Compiling)
+            {
+                lastCompileMs = (int)(DateTime.UtcNow - stateSinceUtc).TotalMilliseconds;
+                SessionState.SetInt(LastCompileMsKey, lastCompileMs);
+            }
+
+            state = newState;
+            stateSinceUtc = DateTime.UtcNow;
+
+            try
+            {
+                StateChanged?.Invoke(BuildStatus());
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning($"[UnityMCPBridge] Failed to publish editor state: {e.Message}");
+            }
+        }
+
+        private static int EstimateRetryAfterMs(string current)
+        {
+            int estimate;
+            switch (current)
+            {
+                case Compiling:
+                    estimate = lastCompileMs + lastReloadMs;
+                    break;
+                case Reloading:
+                    estimate = lastReloadMs;
+                    break;
+                case PlayMode:
+                    estimate = 2000;
+                    break;
+                default:
+                    return 0;
+            }
+
+            int elapsed = (int)(DateTime.UtcNow - stateSinceUtc).TotalMilliseconds;
+            return Math.Max(500, estimate - elapsed);
+        }
+
+        private static void RecordReloadDuration()
+        {
+            string startTicks = SessionState.GetString(ReloadStartKey, "");
+            if (string.IsNullOrEmpty(startTicks) || !long.TryParse(startTicks, out var ticks)) return;
+
+            SessionState.EraseString(ReloadStartKey);
+            SessionState.SetInt(LastReloadMsKey, (int)(DateTime.UtcNow - new DateTime(ticks)).TotalMilliseconds);
+        }
+    }
+}
@@ -0,0 +1,149 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.RegularExpressions;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP.Editor.Services
+{
+    /// <summary>
+    /// Log fingerprints: message template (numbers, hex and GUIDs replaced) plus the top user stack frame.
+    /// Mirrors unity_log_fingerprint.py so both sides produce the same keys.
+    /// </summary>
+    public static class LogFingerprint
+    {
+        private static readonly Regex Guid = new Regex(@"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b", RegexOptions.Compiled);
+        private static readonly Regex Hex = new Regex(@"\b0x[0-9a-fA-F]+\b", RegexOptions.Compiled);
+        // Digits not directly after a letter/underscore, so names like Enemy_12 or Player2 stay intact
+        private static readonly Regex Number = new Regex(@"(?<![A-Za-z_\d])[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?", RegexOptions.Compiled);
+        private static readonly Regex Spaces = new Regex(@"\s+", RegexOptions.Compiled);
+
+        private static readonly string[] LoggingFrames = { "UnityEngine.Debug:", "UnityEngine.Logger:", "UnityEngine.DebugLogHandler:" };
+
+        public static string NormalizeMessage(string message)
+        {
+            string template = Guid.Replace(message ?? "", "<guid>");
+            template = Hex.Replace(template, "<hex>");
+            template = Number.Replace(template, "<n>");
+            return Spaces.Replace(template, " ").Trim();
+        }
+
+        public static string TopFrame(string stackTrace)
+        {
+            if (string.IsNullOrEmpty(stackTrace)) return "";
+            foreach (var rawLine in stackTrace.Split('\n'))
+            {
+                var line = rawLine.Trim();
+                if (line.Length > 0 && !LoggingFrames.Any(prefix => line.StartsWith(prefix, StringComparison.Ordinal)))
+                    return line;
+            }
+            return "";
+        }
+
+        // One hasher per thread instead of one per log; HashAlgorithm instances are not thread-safe
+        [ThreadStatic] private static SHA1 hasher;
+
+        public static string Compute(string logType, string template, string topFrame)
+        {
+            hasher ??= SHA1.Create();
+            var hash = hasher.ComputeHash(Encoding.UTF8.GetBytes($"{logType}\0{template}\0{topFrame}"));
+            var builder = new StringBuilder(16);
+            for (int i = 0; i < 8; i++) builder.Append(hash[i].ToString("x2"));
+            return builder.ToString();
+        }
+    }
+
+    /// <summary>
+    /// Bounded index of the most frequent fingerprints (Space-Saving). When full, a new fingerprint
+    /// replaces the least frequent one and inherits its count as an overestimate ("error").
+    /// Not thread-safe; ConsoleLogsService guards it with its own lock.
+    /// </summary>
+    public class FingerprintIndex
+    {
+        private class Entry
+        {
+            public string Fingerprint;
+            public string Template;
+            public string TopFrame;
+            public string Type;
+            public string Sample;
+            public long Count;
+            public long Error;
+            public DateTime FirstTimestamp;
+            public DateTime LastTimestamp;
+        }
+
+        private readonly Dictionary<string, Entry> entries = new Dictionary<string, Entry>();
+
+        public int Capacity { get; }
+        public long Total { get; private set; }
+        public int Count => entries.Count;
+
+        public FingerprintIndex(int capacity = 256)
+        {
+            Capacity = capacity;
+        }
+
+        public void Add(string fingerprint, string template, string topFrame, string type, string message, DateTime timestamp)
+        {
+            Total++;
+            if (!entries.TryGetValue(fingerprint, out var entry))
+            {
+                long error = 0;
+                if (entries.Count >= Capacity)
+                {
+                    var evicted = entries.Values.OrderBy(e => e.Count).First();
+                    entries.Remove(evicted.Fingerprint);
+                    error = evicted.Count;
+                }
+                entry = new Entry
+                {
+                    Fingerprint = fingerprint,
+                    Template = template,
+                    TopFrame = topFrame,
+                    Type = type,
+                    Sample = message,
+                    Count = error,
+                    Error = error,
+                    FirstTimestamp = timestamp
+                };
+                entries[fingerprint] = entry;
+            }
+            entry.Count++;
+            entry.LastTimestamp = timestamp;
+        }
+
+        public JArray Top(int limit, string logType)
+        {
+            bool filter = !string.IsNullOrEmpty(logType) && !string.Equals(logType, "all", StringComparison.OrdinalIgnoreCase);
+            var result = new JArray();
+            foreach (var entry in entries.Values
+                         .Where(e => !filter || string.Equals(e.Type, logType, StringComparison.OrdinalIgnoreCase))
+                         .OrderByDescending(e => e.Count)
+                         .Take(limit))
+            {
+                result.Add(new JObject
+                {
+                    ["fingerprint"] = entry.Fingerprint,
+                    ["template"] = entry.Template,
+                    ["topFrame"] = entry.TopFrame,
+                    ["type"] = entry.Type,
+                    ["count"] = entry.Count,
+                    ["error"] = entry.Error,
+                    ["sample"] = entry.Sample,
+                    ["firstTimestamp"] = entry.FirstTimestamp.ToString("yyyy-MM-dd HH:mm:ss.fff"),
+                    ["lastTimestamp"] = entry.LastTimestamp.ToString("yyyy-MM-dd HH:mm:ss.fff")
+                });
+            }
+            return result;
+        }
+
+        public void Clear()
+        {
+            entries.Clear();
+            Total = 0;
+        }
+    }
+}
@@ -9,6 +9,7 @@ using System.Net;
 using System.Net.Sockets;
 using System.Text;
 using System.Threading;
+using Newtonsoft.Json.Linq;
 
 namespace UnityMCP.Editor
 {
@@ -19,6 +20,7 @@ namespace UnityMCP.Editor
         private Thread tcpListenerThread;
         private bool isServerRunning = false;
         private int serverPort = 8765;
+        private const int MaxFrameBytes = 64 * 1024 * 1024;
         private List<string> logs = new List<string>();
         private UnityEngine.Vector2 scrollPosition;
 
@@ -81,7 +83,7 @@ namespace UnityMCP.Editor
             EditorGUILayout.EndScrollView();
 
             EditorGUILayout.Space();
-            EditorGUILayout.HelpBox($"Connect to: http://localhost:{serverPort}", MessageType.Info);
+            EditorGUILayout.HelpBox($"Connect to: tcp://localhost:{serverPort}", MessageType.Info);
         }
 
         private void StartServer()
@@ -136,79 +138,120 @@ namespace UnityMCP.Editor
             }
         }
 
+        /// <summary>
+        /// Length-prefixed framing: 4-byte big-endian length followed by UTF-8 JSON.
+        /// Requests are answered in order, so clients may pipeline several at once.
+        /// </summary>
         private void HandleClientComm(object client)
         {
             TcpClient tcpClient = (TcpClient)client;
             NetworkStream clientStream = tcpClient.GetStream();
-
-            byte[] message = new byte[4096];
-            int bytesRead;
+            byte[] header = new byte[4];
 
             while (true)
             {
-                bytesRead = 0;
-
                 try
                 {
-                    bytesRead = clientStream.Read(message, 0, 4096);
+                    if (!ReadExactly(clientStream, header, 4))
+                    {
+                        break;
+                    }
+
+                    int length = (header[0] << 24) | (header[1] << 16) | (header[2] << 8) | header[3];
+                    if (length <= 0 || length > MaxFrameBytes)
+                    {
+                        AddLog($"Invalid frame length: {length}");
+                        break;
+                    }
+
+                    byte[] payload = new byte[length];
+                    if (!ReadExactly(clientStream, payload, length))
+                    {
+                        break;
+                    }
+
+                    string jsonMessage = Encoding.UTF8.GetString(payload);
+                    AddLog($"Received: {jsonMessage}");
+
+                    // Process the message and send response
+                    WriteFrame(clientStream, ProcessMCPCommand(jsonMessage));
                 }
                 catch
                 {
                     break;
                 }
+            }
+
+            tcpClient.Close();
+        }
 
-                if (bytesRead == 0)
+        private static bool ReadExactly(NetworkStream stream, byte[] buffer, int count)
+        {
+            int offset = 0;
+            while (offset < count)
+            {
+                int read = stream.Read(buffer, offset, count - offset);
+                if (read == 0)
                 {
-                    break;
+                    return false;
                 }
-
-                string jsonMessage = Encoding.UTF8.GetString(message, 0, bytesRead);
-                AddLog($"Received: {jsonMessage}");
-
-                // Process the message and send response
-                string response = ProcessMCPCommand(jsonMessage);
-                byte[] data = Encoding.UTF8.GetBytes(response);
-                clientStream.Write(data, 0, data.Length);
+                offset += read;
             }
+            return true;
+        }
 
-            tcpClient.Close();
+        private static void WriteFrame(NetworkStream stream, string json)
+        {
+            byte[] data = Encoding.UTF8.GetBytes(json);
+            byte[] header =
+            {
+                (byte)(data.Length >> 24), (byte)(data.Length >> 16),
+                (byte)(data.Length >> 8), (byte)data.Length
+            };
+            stream.Write(header, 0, 4);
+            stream.Write(data, 0, data.Length);
         }
 
         private string ProcessMCPCommand(string jsonMessage)
         {
+            string id = null;
+            JObject result;
+
             try
             {
-                // Simple JSON parsing without external dependencies
-                if (jsonMessage.Contains("unity.create_scene"))
-                {
-                    return ExecuteOnMainThreadSync(() => CreateScene());
-                }
-                else if (jsonMessage.Contains("unity.create_gameobject"))
-                {
-                    return ExecuteOnMainThreadSync(() => CreateGameObject());
-                }
-                else if (jsonMessage.Contains("unity.create_ui_canvas"))
-                {
-                    return ExecuteOnMainThreadSync(() => CreateUICanvas());
-                }
-                else if (jsonMessage.Contains("unity.get_scene_info"))
-                {
-                    return ExecuteOnMainThreadSync(() => GetSceneInfo());
-                }
-                else
+                var message = JObject.Parse(jsonMessage);
+                id = message["id"]?.ToString();
+
+                switch (message["method"]?.ToString())
                 {
-                    return "{\"success\": false, \"error\": \"Unknown command\"}";
+                    case "unity.create_scene":
+                        result = ExecuteOnMainThreadSync(() => CreateScene());
+                        break;
+                    case "unity.create_gameobject":
+                        result = ExecuteOnMainThreadSync(() => CreateGameObject());
+                        break;
+                    case "unity.create_ui_canvas":
+                        result = ExecuteOnMainThreadSync(() => CreateUICanvas());
+                        break;
+                    case "unity.get_scene_info":
+                        result = ExecuteOnMainThreadSync(() => GetSceneInfo());
+                        break;
+                    default:
+                        result = new JObject { ["success"] = false, ["error"] = "Unknown command" };
+                        break;
                 }
             }
             catch (System.Exception e)
             {
-                return $"{{\"success\": false, \"error\": \"{e.Message}\"}}";
+                result = new JObject { ["success"] = false, ["error"] = e.Message };
             }
+
+            return new JObject { ["id"] = id, ["result"] = result }.ToString(Newtonsoft.Json.Formatting.None);
         }
 
-        private string ExecuteOnMainThreadSync(System.Func<string> action)
+        private JObject ExecuteOnMainThreadSync(System.Func<JObject> action)
         {
-            string result = null;
+            JObject result = null;
             bool completed = false;
 
             EditorApplication.delayCall += () =>
@@ -219,7 +262,7 @@ namespace UnityMCP.Editor
                 }
                 catch (System.Exception e)
                 {
-                    result = $"{{\"success\": false, \"error\": \"{e.Message}\"}}";
+                    result = new JObject { ["success"] = false, ["error"] = e.Message };
                 }
                 finally
                 {
@@ -238,19 +281,29 @@ namespace UnityMCP.Editor
 
         #region Unity Operations
 
-        private string CreateScene()
+        private JObject CreateScene()
         {
             var scene = EditorSceneManager.NewScene(NewSceneSetup.DefaultGameObjects, NewSceneMode.Single);
-            return $"{{\"success\": true, \"sceneName\": \"{scene.name}\", \"scenePath\": \"{scene.path}\"}}";
+            return new JObject
+            {
+                ["success"] = true,
+                ["sceneName"] = scene.name,
+                ["scenePath"] = scene.path
+            };
         }
 
-        private string CreateGameObject()
+        private JObject CreateGameObject()
         {
             var go = new GameObject("NewGameObject");
-            return $"{{\"success\": true, \"objectName\": \"{go.name}\", \"instanceId\": {go.GetInstanceID()}}}";
+            return new JObject
+            {
+                ["success"] = true,
+                ["objectName"] = go.name,
+                ["instanceId"] = go.GetInstanceID()
+            };
         }
 
-        private string CreateUICanvas()
+        private JObject CreateUICanvas()
         {
             var canvasGO = new GameObject("Canvas");
             var canvas = canvasGO.AddComponent<Canvas>();
@@ -267,23 +320,38 @@ namespace UnityMCP.Editor
                 eventSystemGO.AddComponent<UnityEngine.EventSystems.StandaloneInputModule>();
             }
 
-            return $"{{\"success\": true, \"canvasName\": \"{canvasGO.name}\", \"instanceId\": {canvasGO.GetInstanceID()}}}";
+            return new JObject
+            {
+                ["success"] = true,
+                ["canvasName"] = canvasGO.name,
+                ["instanceId"] = canvasGO.GetInstanceID()
+            };
         }
 
-        private string GetSceneInfo()
+        private JObject GetSceneInfo()
         {
             var scene = EditorSceneManager.GetActiveScene();
-            var gameObjects = scene.GetRootGameObjects();
+            var gameObjects = new JArray();
 
-            var objectNames = new List<string>();
-            foreach (var go in gameObjects)
+            foreach (var go in scene.GetRootGameObjects())
             {
-                objectNames.Add($"\\\"{go.name}\\\"");
+                gameObjects.Add(new JObject
+                {
+                    ["name"] = go.name,
+                    ["instanceId"] = go.GetInstanceID(),
+                    ["activeInHierarchy"] = go.activeInHierarchy
+                });
             }
 
-            string objectList = string.Join(",", objectNames.ToArray());
-
-            return $"{{\"success\": true, \"sceneName\": \"{scene.name}\", \"scenePath\": \"{scene.path}\", \"gameObjects\": [{objectList}]}}";
+            return new JObject
+            {
+                ["success"] = true,
+                ["sceneName"] = scene.name,
+                ["scenePath"] = scene.path,
+                ["isLoaded"] = scene.isLoaded,
+                ["isDirty"] = scene.isDirty,
+                ["gameObjects"] = gameObjects
+            };
         }
 
         #endregion
@@ -17,6 +17,13 @@ namespace UnityMCP.Tools
             Name = "add_component";
             Description = "Adds a component to a GameObject by instance ID or name";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["componentType"] = Property("string", "Component type name, e.g. 'Rigidbody' or 'BoxCollider'"),
+                ["gameObjectName"] = Property("string", "Target GameObject name"),
+                ["instanceId"] = Property("integer", "Target GameObject instance ID"),
+                ["componentData"] = Property("object", "Field values to set on the new component")
+            }, "componentType");
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -18,6 +18,12 @@ namespace UnityMCP.Tools
             Name = "apply_ui_style";
             Description = "Applies modern UI styles and themes to UI elements (modern_flat, classic, game_style)";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["canvasName"] = Property("string", "Canvas to style", "Canvas"),
+                ["theme"] = Property("string", "Style theme: modern_flat, classic or game_style", "modern_flat"),
+                ["applyToAll"] = Property("boolean", "Apply to every UI element under the canvas", true)
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -17,6 +17,16 @@ namespace UnityMCP.Tools
             Name = "unity.create_gameobject";
             Description = "Creates a GameObject in Unity with optional primitive type, position, rotation, and scale";
             IsAsync = true; // Execute asynchronously to handle main thread requirements
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["name"] = Property("string", "GameObject name", "GameObject"),
+                ["objectPath"] = Property("string", "Hierarchy path to create, e.g. 'Level/Enemies/Boss'"),
+                ["primitiveType"] = Property("string", "Primitive to create: Cube, Sphere, Capsule, Cylinder, Plane or Quad"),
+                ["parent"] = Property("string", "Parent GameObject name"),
+                ["position"] = NumbersProperty("World position", "x", "y", "z"),
+                ["rotation"] = NumbersProperty("Euler rotation", "x", "y", "z"),
+                ["scale"] = NumbersProperty("Local scale", "x", "y", "z")
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -16,6 +16,18 @@ namespace UnityMCP.Tools
             Name = "create_material";
             Description = "Creates materials with specified properties and optionally applies them to GameObjects";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["materialName"] = Property("string", "Material name", "NewMaterial"),
+                ["materialPath"] = Property("string", "Asset path to save the material to"),
+                ["shaderName"] = Property("string", "Shader name", "Universal Render Pipeline/Lit"),
+                ["color"] = NumbersProperty("Base color (0-1)", "r", "g", "b", "a"),
+                ["metallic"] = Property("number", "Metallic value", 0f),
+                ["smoothness"] = Property("number", "Smoothness value", 0.5f),
+                ["emission"] = Property("number", "Emission intensity", 0f),
+                ["targetObjectName"] = Property("string", "GameObject to apply the material to"),
+                ["targetInstanceId"] = Property("integer", "Instance ID of the GameObject to apply the material to")
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -17,6 +17,14 @@ namespace UnityMCP.Tools
             Name = "create_prefab";
             Description = "Creates a prefab from an existing GameObject";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["gameObjectName"] = Property("string", "Source GameObject name"),
+                ["objectPath"] = Property("string", "Source GameObject hierarchy path"),
+                ["instanceId"] = Property("integer", "Source GameObject instance ID"),
+                ["prefabPath"] = Property("string", "Asset path of the prefab"),
+                ["prefabName"] = Property("string", "Prefab name")
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -18,6 +18,13 @@ namespace UnityMCP.Tools
             Name = "create_scene";
             Description = "Creates a new Unity scene and optionally saves it to a specified path";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["sceneName"] = Property("string", "Scene name", "NewScene"),
+                ["savePath"] = Property("string", "Asset path to save the scene to"),
+                ["setAsActiveScene"] = Property("boolean", "Make the new scene active", true),
+                ["additive"] = Property("boolean", "Open the scene additively", false)
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -19,6 +19,15 @@ namespace UnityMCP.Tools
             Name = "create_ui_element";
             Description = "Creates UI elements like Canvas, Button, Text, Image, InputField etc. in the Unity scene with proper components";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["elementType"] = Property("string", "Canvas, Button, Text, Image, Panel, InputField or ScrollView", "Canvas"),
+                ["name"] = Property("string", "Element name (defaults to the element type)"),
+                ["parentPath"] = Property("string", "Parent hierarchy path, created if missing"),
+                ["text"] = Property("string", "Text for Button and Text elements"),
+                ["position"] = NumbersProperty("Anchored position", "x", "y"),
+                ["size"] = NumbersProperty("Size delta", "width", "height")
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
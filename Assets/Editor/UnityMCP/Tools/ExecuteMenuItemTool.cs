@@ -16,6 +16,10 @@ namespace UnityMCP.Tools
             Name = "execute_menu_item";
             Description = "Executes a Unity menu item by path (e.g. 'GameObject/Create Empty', 'File/New Scene')";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["menuPath"] = Property("string", "Menu path, e.g. 'GameObject/Create Empty'")
+            }, "menuPath");
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
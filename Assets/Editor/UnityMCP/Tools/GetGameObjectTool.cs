@@ -17,6 +17,13 @@ namespace UnityMCP.Tools
             Name = "get_gameobject";
             Description = "Gets GameObject information by name, instance ID, or object path";
             IsAsync = true;
+            IsReadOnly = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["name"] = Property("string", "GameObject name"),
+                ["objectPath"] = Property("string", "GameObject hierarchy path"),
+                ["instanceId"] = Property("integer", "GameObject instance ID")
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -28,6 +28,16 @@ namespace UnityMCP.Tools
         /// </summary>
         public bool IsAsync { get; protected set; } = false;
 
+        /// <summary>
+        /// JSON Schema of the tool's parameters, published in the capability manifest
+        /// </summary>
+        public JObject InputSchema { get; protected set; } = ObjectSchema(new JObject());
+
+        /// <summary>
+        /// True if the tool never modifies the scene or assets
+        /// </summary>
+        public bool IsReadOnly { get; protected set; } = false;
+
         /// <summary>
         /// Execute the tool asynchronously with the provided parameters.
         /// This should be overridden by tools that need to run on the Unity main thread
@@ -59,6 +69,70 @@ namespace UnityMCP.Tools
             );
         }
 
+        /// <summary>
+        /// Build an object schema from property schemas
+        /// </summary>
+        /// <param name="properties">Property name to schema</param>
+        /// <param name="required">Names of required properties</param>
+        /// <returns>A JSON Schema object</returns>
+        protected static JObject ObjectSchema(JObject properties, params string[] required)
+        {
+            var schema = new JObject
+            {
+                ["type"] = "object",
+                ["properties"] = properties
+            };
+
+            if (required.Length > 0)
+            {
+                schema["required"] = new JArray(required);
+            }
+
+            return schema;
+        }
+
+        /// <summary>
+        /// Build a property schema
+        /// </summary>
+        /// <param name="type">JSON Schema type</param>
+        /// <param name="description">Property description</param>
+        /// <param name="defaultValue">Optional default value</param>
+        /// <returns>A JSON Schema property</returns>
+        protected static JObject Property(string type, string description, JToken defaultValue = null)
+        {
+            var property = new JObject
+            {
+                ["type"] = type,
+                ["description"] = description
+            };
+
+            if (defaultValue != null)
+            {
+                property["default"] = defaultValue;
+            }
+
+            return property;
+        }
+
+        /// <summary>
+        /// Build an object property whose fields are all numbers, e.g. x/y/z or r/g/b/a
+        /// </summary>
+        /// <param name="description">Property description</param>
+        /// <param name="fields">Numeric field names</param>
+        /// <returns>A JSON Schema property</returns>
+        protected static JObject NumbersProperty(string description, params string[] fields)
+        {
+            var properties = new JObject();
+            foreach (var field in fields)
+            {
+                properties[field] = new JObject { ["type"] = "number" };
+            }
+
+            var property = ObjectSchema(properties);
+            property["description"] = description;
+            return property;
+        }
+
         /// <summary>
         /// Create a standardized error response
         /// </summary>
@@ -19,6 +19,13 @@ namespace UnityMCP.Tools
             Name = "update_component";
             Description = "Updates component fields on a GameObject or adds it to the GameObject if it does not contain the component";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["instanceId"] = Property("integer", "Target GameObject instance ID"),
+                ["objectPath"] = Property("string", "Target GameObject hierarchy path"),
+                ["componentName"] = Property("string", "Component type name"),
+                ["componentData"] = Property("object", "Field values to set")
+            }, "componentName");
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -17,6 +17,26 @@ namespace UnityMCP.Tools
             Name = "update_gameobject";
             Description = "Updates or creates a GameObject and its properties (name, tag, layer, active state, static state) based on instance ID or object path.";
             IsAsync = true; // Execute on main thread
+            var gameObjectData = ObjectSchema(new JObject
+            {
+                ["name"] = Property("string", "New name"),
+                ["tag"] = Property("string", "Tag"),
+                ["layer"] = Property("integer", "Layer index"),
+                ["isActiveSelf"] = Property("boolean", "Active state"),
+                ["isStatic"] = Property("boolean", "Static state")
+            });
+            gameObjectData["description"] = "Properties to update";
+
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["instanceId"] = Property("integer", "Target GameObject instance ID"),
+                ["objectPath"] = Property("string", "Target GameObject hierarchy path, created if missing"),
+                ["name"] = Property("string", "Target GameObject name (legacy)"),
+                ["gameObjectData"] = gameObjectData,
+                ["position"] = NumbersProperty("World position", "x", "y", "z"),
+                ["rotation"] = NumbersProperty("Euler rotation", "x", "y", "z"),
+                ["scale"] = NumbersProperty("Local scale", "x", "y", "z")
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
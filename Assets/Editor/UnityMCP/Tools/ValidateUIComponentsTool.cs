@@ -19,6 +19,11 @@ namespace UnityMCP.Tools
             Name = "validate_ui_components";
             Description = "Validates UI components and auto-fixes common issues like missing Canvas components";
             IsAsync = true;
+            InputSchema = ObjectSchema(new JObject
+            {
+                ["canvasName"] = Property("string", "Canvas to validate (all canvases if omitted)"),
+                ["autoFix"] = Property("boolean", "Fix common issues automatically", true)
+            });
         }
 
         public override void ExecuteAsync(JObject parameters, TaskCompletionSource<JObject> tcs)
@@ -1,6 +1,7 @@
 using UnityEngine;
 using UnityEditor;
 using System;
+using UnityMCP.Editor.Services;
 
 namespace UnityMCP.Editor
 {
@@ -126,6 +127,8 @@ namespace UnityMCP.Editor
         private static void OnBeforeAssemblyReload()
         {
             Debug.Log("[UnityMCPAutoStarter] Before assembly reload, stopping MCP Bridge");
+            // Let clients know this is a reload, not a crash, before the socket closes
+            EditorStateService.NotifyReloading();
             _bridgeInstance?.StopServerIfRunning();
         }
 
@@ -151,6 +154,7 @@ namespace UnityMCP.Editor
             {
                 case PlayModeStateChange.ExitingEditMode:
                     Debug.Log("[UnityMCPAutoStarter] Exiting edit mode, stopping MCP Bridge");
+                    EditorStateService.NotifyPlayModeTransition();
                     _bridgeInstance?.StopServerIfRunning();
                     break;
 
@@ -6,6 +6,7 @@ using UnityEngine.UI;
 using UnityEngine.EventSystems;
 using System;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
 using System.Text;
 using System.Threading;
@@ -27,6 +28,9 @@ namespace UnityMCP.Editor
 
         // GameLovers-style tool registry
         private Dictionary<string, McpToolBase> mcpTools = new Dictionary<string, McpToolBase>();
+        private const int CapabilityManifestVersion = 1;
+        private JArray capabilityTools;
+        private string capabilityHash;
         private ConsoleLogsService consoleLogsService;
         private int connectedClients = 0;
         private double lastHeartbeat = 0;
@@ -129,6 +133,9 @@ namespace UnityMCP.Editor
         {
             try
             {
+                // 清理上次未被客户端取走的bulk文件
+                BulkTransferService.CleanupStaleFiles();
+
                 webSocketServer = new WebSocketSharpServer(serverPort);
                 await webSocketServer.StartAsync();
                 isServerRunning = webSocketServer.IsRunning;
@@ -351,6 +358,82 @@ namespace UnityMCP.Editor
             });
         }
 
+        /// <summary>
+        /// Columnar dump of the active scene hierarchy in preorder, for the client-side scene store
+        /// </summary>
+        private async Task<object> GetSceneHierarchy()
+        {
+            return await ExecuteOnMainThread<object>(() =>
+            {
+                var scene = EditorSceneManager.GetActiveScene();
+                var ids = new JArray();
+                var names = new JArray();
+                var parents = new JArray();
+                var active = new JArray();
+                var componentTypes = new JArray();
+                var componentOffsets = new JArray { 0 };
+                var componentIds = new JArray();
+                var typeIndex = new Dictionary<Type, int>();
+                var components = new List<Component>();
+
+                // Iterative preorder walk: every subtree ends up contiguous
+                var stack = new Stack<(Transform transform, int parent)>();
+                var roots = scene.GetRootGameObjects();
+                for (int i = roots.Length - 1; i >= 0; i--)
+                {
+                    stack.Push((roots[i].transform, -1));
+                }
+
+                while (stack.Count > 0)
+                {
+                    var (transform, parent) = stack.Pop();
+                    var go = transform.gameObject;
+                    int index = ids.Count;
+
+                    ids.Add(go.GetInstanceID());
+                    names.Add(go.name);
+                    parents.Add(parent);
+                    active.Add(go.activeInHierarchy ? 1 : 0);
+
+                    go.GetComponents(components);
+                    foreach (var component in components)
+                    {
+                        if (component == null) continue;
+
+                        var type = component.GetType();
+                        if (!typeIndex.TryGetValue(type, out var typeId))
+                        {
+                            typeId = typeIndex.Count;
+                            typeIndex[type] = typeId;
+                            componentTypes.Add(type.Name);
+                        }
+                        componentIds.Add(typeId);
+                    }
+                    componentOffsets.Add(componentIds.Count);
+
+                    for (int c = transform.childCount - 1; c >= 0; c--)
+                    {
+                        stack.Push((transform.GetChild(c), index));
+                    }
+                }
+
+                return new JObject
+                {
+                    ["success"] = true,
+                    ["sceneName"] = scene.name,
+                    ["scenePath"] = scene.path,
+                    ["count"] = ids.Count,
+                    ["ids"] = ids,
+                    ["names"] = names,
+                    ["parents"] = parents,
+                    ["active"] = active,
+                    ["componentTypes"] = componentTypes,
+                    ["componentOffsets"] = componentOffsets,
+                    ["componentIds"] = componentIds
+                };
+            });
+        }
+
         private async Task<object> GetConsoleLogs(MCPMessage message)
         {
             try
@@ -362,6 +445,7 @@ namespace UnityMCP.Editor
                 var offset = message.Params["offset"]?.ToObject<int>() ?? 0;
                 var limit = message.Params["limit"]?.ToObject<int>() ?? 50;
                 var includeStackTrace = message.Params["includeStackTrace"]?.ToObject<bool>() ?? true;
+                var includeBridgeLogs = message.Params["includeBridgeLogs"]?.ToObject<bool>() ?? true;
 
                 AddLog($"Parameters: logType={logType}, offset={offset}, limit={limit}, includeStackTrace={includeStackTrace}");
 
@@ -373,9 +457,12 @@ namespace UnityMCP.Editor
                 {
                     ["success"] = true,
                     ["data"] = consoleLogsResult,
-                    ["bridgeLogs"] = JArray.FromObject(logs.ToArray()), // Thread-safe copy
                     ["message"] = $"Retrieved console logs successfully (logType: {logType}, offset: {offset}, limit: {limit})"
                 };
+                if (includeBridgeLogs)
+                {
+                    result["bridgeLogs"] = JArray.FromObject(logs.ToArray()); // Thread-safe copy
+                }
 
                 AddLog($"Professional MCP response created successfully");
                 return await Task.FromResult(result);
@@ -397,6 +484,34 @@ namespace UnityMCP.Editor
             }
         }
 
+        private async Task<object> GetLogFingerprints(MCPMessage message)
+        {
+            try
+            {
+                var logType = message.Params["logType"]?.ToString() ?? "";
+                var limit = message.Params["limit"]?.ToObject<int>() ?? 20;
+
+                // Answered from the service's bounded index (thread-safe), no main-thread hop
+                var fingerprints = consoleLogsService.GetFingerprintsAsJson(logType, limit);
+                var result = new JObject
+                {
+                    ["success"] = true,
+                    ["data"] = fingerprints,
+                    ["message"] = fingerprints["message"]
+                };
+                return await Task.FromResult(result);
+            }
+            catch (Exception e)
+            {
+                AddLog($"Error getting log fingerprints: {e.Message}");
+                return await Task.FromResult(new JObject
+                {
+                    ["success"] = false,
+                    ["message"] = $"Failed to get log fingerprints: {e.Message}"
+                });
+            }
+        }
+
         private async Task<object> ClearConsole()
         {
             return await ExecuteOnMainThread<object>(() =>
@@ -467,6 +582,83 @@ namespace UnityMCP.Editor
             });
         }
 
+        /// <summary>
+        /// Import exactly the given asset paths in one batch instead of a project-wide refresh
+        /// </summary>
+        private async Task<object> ImportAssets(MCPMessage message)
+        {
+            return await ExecuteOnMainThread<object>(() =>
+            {
+                var pathsToken = message.Params["paths"] as JArray;
+                if (pathsToken == null || pathsToken.Count == 0)
+                {
+                    return Response.Error("Asset paths are required", "validation_error");
+                }
+
+                string projectRoot = Path.GetFullPath(Path.GetDirectoryName(Application.dataPath));
+                string projectPath = message.Params["projectPath"]?.ToString();
+                if (!string.IsNullOrEmpty(projectPath) &&
+                    !string.Equals(Path.GetFullPath(projectPath).TrimEnd('/', '\\'), projectRoot.TrimEnd('/', '\\'),
+                        StringComparison.OrdinalIgnoreCase))
+                {
+                    return Response.Error("project_mismatch", new { projectPath, openProject = projectRoot });
+                }
+
+                var files = new List<string>();
+                var folders = new SortedSet<string>(StringComparer.Ordinal);
+                var skipped = new JArray();
+                foreach (var token in pathsToken)
+                {
+                    string assetPath = token.ToString().Replace('\\', '/');
+                    if (!assetPath.StartsWith("Assets/") || assetPath.Contains("..") || assetPath.EndsWith(".meta") ||
+                        !File.Exists(Path.Combine(projectRoot, assetPath)))
+                    {
+                        skipped.Add(assetPath);
+                        continue;
+                    }
+
+                    files.Add(assetPath);
+
+                    // New folders must be known to the AssetDatabase before the files inside them
+                    string folder = Path.GetDirectoryName(assetPath)?.Replace('\\', '/');
+                    while (!string.IsNullOrEmpty(folder) && folder != "Assets" && !AssetDatabase.IsValidFolder(folder))
+                    {
+                        folders.Add(folder);
+                        folder = Path.GetDirectoryName(folder)?.Replace('\\', '/');
+                    }
+                }
+
+                var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+                AssetDatabase.StartAssetEditing();
+                try
+                {
+                    // Parents sort before their children
+                    foreach (var folder in folders)
+                    {
+                        AssetDatabase.ImportAsset(folder);
+                    }
+                    foreach (var file in files)
+                    {
+                        AssetDatabase.ImportAsset(file);
+                    }
+                }
+                finally
+                {
+                    AssetDatabase.StopAssetEditing();
+                }
+                stopwatch.Stop();
+
+                AddLog($"Imported {files.Count} assets in {stopwatch.ElapsedMilliseconds}ms");
+                return Response.Success($"Imported {files.Count} assets", new
+                {
+                    imported = files,
+                    folders = folders.ToList(),
+                    skipped,
+                    durationMs = stopwatch.ElapsedMilliseconds
+                });
+            });
+        }
+
         #endregion
 
         #region New MCP Methods (GameLovers Compatible)
@@ -895,7 +1087,8 @@ namespace UnityMCP.Editor
                 {
                     Id = jsonObj["id"]?.ToString(),
                     Method = jsonObj["method"]?.ToString(),
-                    Params = jsonObj["params"] as JObject ?? new JObject()
+                    Params = jsonObj["params"] as JObject ?? new JObject(),
+                    BulkThreshold = jsonObj["bulk"]?["threshold"]?.ToObject<int>() ?? 0
                 };
             }
             catch (Exception e)
@@ -1109,7 +1302,7 @@ namespace UnityMCP.Editor
                 if (Instance == null)
                 {
                     Debug.LogError("[ProcessWebSocketMessage] Unity MCP Bridge instance not found!");
-                    return JsonUtility.ToJson(new { error = "Unity MCP Bridge not initialized" });
+                    return McpWebSocketBehavior.ErrorFrame(messageJson, "Unity MCP Bridge not initialized");
                 }
 
                 Debug.Log("[ProcessWebSocketMessage] Calling ProcessMCPMessageInternal");
@@ -1120,7 +1313,7 @@ namespace UnityMCP.Editor
             catch (Exception e)
             {
                 Debug.LogError($"[ProcessWebSocketMessage] Exception: {e.Message}");
-                return JsonUtility.ToJson(new { error = e.Message });
+                return McpWebSocketBehavior.ErrorFrame(messageJson, e.Message);
             }
         }
 
@@ -1166,10 +1359,11 @@ namespace UnityMCP.Editor
 
         private async Task<string> ProcessMCPMessageInternal(string messageJson)
         {
+            MCPMessage message = null;
             try
             {
                 AddLog($"Received raw message: {messageJson}");
-                var message = ParseMCPMessage(messageJson);
+                message = ParseMCPMessage(messageJson);
                 AddLog($"Processing method: {message.Method} with ID: {message.Id}");
 
                 JObject result = null;
@@ -1202,6 +1396,9 @@ namespace UnityMCP.Editor
                         case "get_console_logs":
                             result = await GetConsoleLogs(message) as JObject;
                             break;
+                        case "get_log_fingerprints":
+                            result = await GetLogFingerprints(message) as JObject;
+                            break;
                         case "clear_console":
                             result = await ClearConsole() as JObject;
                             break;
@@ -1225,12 +1422,26 @@ namespace UnityMCP.Editor
                         case "unity.get_scene_info":
                             result = JObject.FromObject(await GetSceneInfo());
                             break;
+                        case "unity.get_scene_hierarchy":
+                            result = await GetSceneHierarchy() as JObject;
+                            break;
                         case "unity.execute_menu_item":
                             result = JObject.FromObject(await ExecuteMenuItem(message));
                             break;
                         case "unity.select_gameobject":
                             result = JObject.FromObject(await SelectGameObject(message));
                             break;
+                        case "unity.get_editor_state":
+                            // Answered from cached state, so it works while the main thread is busy
+                            result = EditorStateService.BuildStatus();
+                            result["success"] = true;
+                            break;
+                        case "unity.get_capabilities":
+                            result = GetCapabilities(message);
+                            break;
+                        case "unity.import_assets":
+                            result = await ImportAssets(message) as JObject;
+                            break;
                         case "unity.test":
                         case "test":
                         case "ping":
@@ -1263,6 +1474,15 @@ namespace UnityMCP.Editor
                 };
 
                 var responseJson = SerializeMCPResponse(response);
+
+                // Large responses go through a memory-mapped temp file when the client is on the same host
+                var bulkHandle = BulkTransferService.TryCreateHandle(responseJson, message.Id, message.BulkThreshold);
+                if (bulkHandle != null)
+                {
+                    AddLog($"Sending bulk handle for {responseJson.Length} chars: {bulkHandle}");
+                    return bulkHandle;
+                }
+
                 AddLog($"Sending response: {responseJson}");
                 return responseJson;
             }
@@ -1271,7 +1491,7 @@ namespace UnityMCP.Editor
                 AddLog($"Error processing message: {e.Message}");
                 var errorResponse = new MCPResponse
                 {
-                    Id = "unknown",
+                    Id = message?.Id ?? "unknown",
                     Error = new JObject
                     {
                         ["type"] = "internal_error",
@@ -1296,8 +1516,66 @@ namespace UnityMCP.Editor
             RegisterTool(new UpdateGameObjectTool());
             RegisterTool(new GetGameObjectTool());
             RegisterTool(new CreatePrefabTool());
+            RegisterTool(new AddComponentTool());
+            RegisterTool(new UpdateComponentTool());
+            RegisterTool(new CreateMaterialTool());
+            RegisterTool(new CreateSceneTool());
+            RegisterTool(new CreateUIElementTool());
+            RegisterTool(new ApplyUIStyleTool());
+            RegisterTool(new ValidateUIComponentsTool());
+            RegisterTool(new ExecuteMenuItemTool());
+
+            BuildCapabilityManifest();
+            AddLog($"Initialized {mcpTools.Count} MCP tools (capabilities {capabilityHash.Substring(0, 12)})");
+        }
 
-            AddLog($"Initialized {mcpTools.Count} MCP tools");
+        /// <summary>
+        /// Describe the registered tools once; the hash lets clients reuse a cached copy
+        /// </summary>
+        private void BuildCapabilityManifest()
+        {
+            capabilityTools = new JArray();
+            foreach (var tool in mcpTools.Values.OrderBy(t => t.Name, StringComparer.Ordinal))
+            {
+                capabilityTools.Add(new JObject
+                {
+                    ["name"] = tool.Name,
+                    ["description"] = tool.Description,
+                    ["inputSchema"] = tool.InputSchema,
+                    ["readOnly"] = tool.IsReadOnly
+                });
+            }
+
+            var canonical = $"{CapabilityManifestVersion}:{capabilityTools.ToString(Newtonsoft.Json.Formatting.None)}";
+            using (var sha = System.Security.Cryptography.SHA256.Create())
+            {
+                var digest = sha.ComputeHash(Encoding.UTF8.GetBytes(canonical));
+                capabilityHash = BitConverter.ToString(digest).Replace("-", "").ToLowerInvariant();
+            }
+        }
+
+        /// <summary>
+        /// Capability manifest; only the hash is returned when the client already has this version
+        /// </summary>
+        private JObject GetCapabilities(MCPMessage message)
+        {
+            var result = new JObject
+            {
+                ["success"] = true,
+                ["version"] = CapabilityManifestVersion,
+                ["hash"] = capabilityHash
+            };
+
+            if (message.Params?["knownHash"]?.ToString() == capabilityHash)
+            {
+                result["unchanged"] = true;
+            }
+            else
+            {
+                result["tools"] = capabilityTools;
+            }
+
+            return result;
         }
 
         /// <summary>
@@ -1325,6 +1603,7 @@ namespace UnityMCP.Editor
         public string id;
         public string method;
         public JObject @params; // JObject parameters (professional MCP format)
+        public int bulkThreshold; // Bulk transfer threshold in bytes (0 = inline only)
 
         // Properties for easier access
         public string Id
@@ -1344,6 +1623,12 @@ namespace UnityMCP.Editor
             get => @params;
             set => @params = value;
         }
+
+        public int BulkThreshold
+        {
+            get => bulkThreshold;
+            set => bulkThreshold = value;
+        }
     }
 
     [System.Serializable]
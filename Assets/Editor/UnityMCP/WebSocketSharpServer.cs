@@ -4,7 +4,9 @@ using UnityEngine;
 using UnityEditor;
 using WebSocketSharp;
 using WebSocketSharp.Server;
+using Newtonsoft.Json.Linq;
 using System.Threading;
+using UnityMCP.Editor.Services;
 
 namespace UnityMCP.Editor
 {
@@ -41,6 +43,10 @@ namespace UnityMCP.Editor
                 server.Start();
                 isRunning = true;
 
+                // Push editor state changes (compiling, reloading, playmode) to all clients
+                EditorStateService.StateChanged -= BroadcastStatus;
+                EditorStateService.StateChanged += BroadcastStatus;
+
                 Debug.Log($"WebSocketSharp server started on ws://localhost:{port} with enhanced stability features");
 
                 await Task.CompletedTask;
@@ -56,6 +62,8 @@ namespace UnityMCP.Editor
         {
             try
             {
+                EditorStateService.StateChanged -= BroadcastStatus;
+
                 if (server != null)
                 {
                     server.Stop();
@@ -69,6 +77,24 @@ namespace UnityMCP.Editor
             }
         }
 
+        /// <summary>
+        /// Send a status frame to every connected client; synchronous so it goes out before a reload
+        /// </summary>
+        private void BroadcastStatus(JObject status)
+        {
+            try
+            {
+                if (server != null && isRunning)
+                {
+                    server.WebSocketServices["/"]?.Sessions.Broadcast(status.ToString(Newtonsoft.Json.Formatting.None));
+                }
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning($"Failed to broadcast editor state: {e.Message}");
+            }
+        }
+
         public async Task SendMessageAsync(string message)
         {
             // This would need to be implemented to send to all connected clients
@@ -115,6 +141,9 @@ namespace UnityMCP.Editor
             // Start heartbeat to maintain connection
             StartHeartbeat();
 
+            // Tell the client right away whether the editor is ready
+            Send(EditorStateService.BuildStatus().ToString(Newtonsoft.Json.Formatting.None));
+
             // Update bridge UI (use main thread)
             EditorApplication.delayCall += () => {
                 if (UnityMCPBridge.Instance != null)
@@ -199,7 +228,7 @@ namespace UnityMCP.Editor
             catch (Exception ex)
             {
                 Debug.LogError($"Error processing MCP WebSocket message: {ex.Message}");
-                Send($"{{\"jsonrpc\":\"2.0\",\"error\":\"Processing failed: {ex.Message}\"}}");
+                Send(ErrorFrame(e.Data, $"Processing failed: {ex.Message}"));
             }
         }
 
@@ -245,7 +274,7 @@ namespace UnityMCP.Editor
                 {
                     try
                     {
-                        Send($"{{\"jsonrpc\":\"2.0\",\"error\":\"Background processing error: {e.Message}\"}}");
+                        Send(ErrorFrame(messageJson, $"Background processing error: {e.Message}"));
                     }
                     catch (Exception sendEx)
                     {
@@ -265,8 +294,32 @@ namespace UnityMCP.Editor
             catch (Exception e)
             {
                 Debug.LogError($"Error in ProcessMessageAsync: {e.Message}");
-                return $"{{\"jsonrpc\":\"2.0\",\"error\":\"Processing error: {e.Message}\"}}";
+                return ErrorFrame(messageJson, $"Processing error: {e.Message}");
+            }
+        }
+
+        /// <summary>
+        /// Error response that echoes the request id, so the client's pending request fails at once
+        /// instead of waiting for its timeout (frames without an id are treated as notifications)
+        /// </summary>
+        internal static string ErrorFrame(string messageJson, string error)
+        {
+            JToken id = null;
+            try
+            {
+                id = JObject.Parse(messageJson)["id"];
             }
+            catch (Exception)
+            {
+                // Unparseable request: nothing to echo
+            }
+
+            return new JObject
+            {
+                ["jsonrpc"] = "2.0",
+                ["id"] = id,
+                ["error"] = error
+            }.ToString(Newtonsoft.Json.Formatting.None);
         }
     }
 }
\ No newline at end of file
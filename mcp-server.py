@@ -5,12 +5,20 @@ Provides Unity feature generation tools via MCP protocol
 """
 
 import asyncio
+import contextlib
 import json
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 import subprocess
 import os
+import time
+
+from unity_mcp_profile import ToolProfiler, phase
+from unity_mcp_progress import progress_notification, report_progress, track_progress
+from unity_mcp_schema import SchemaValidationError, compile_tool_validators
+from unity_mcp_singleflight import SingleFlight
+from unity_mcp_transport import DEFAULT_BRIDGE_URL, create_transport
 
 # 检查是否有mcp模块，如果没有就使用基础实现
 try:
@@ -31,37 +39,59 @@ except ImportError:
             self.tools = []
             self.handlers = {}
 
-        def list_tools_handler(self, handler):
+        # 支持 @server.list_tools_handler() 与 @server.list_tools_handler 两种写法
+        def list_tools_handler(self, handler=None):
+            if handler is None:
+                return self.list_tools_handler
             self.handlers['list_tools'] = handler
             return handler
 
-        def call_tool_handler(self, handler):
+        def call_tool_handler(self, handler=None):
+            if handler is None:
+                return self.call_tool_handler
             self.handlers['call_tool'] = handler
             return handler
 
+        async def send_notification(self, message: dict):
+            await self.write_message(message)
+
+        async def write_message(self, message: dict):
+            # 多个请求并发处理，写入按消息加锁，避免两条响应交错
+            async with self.write_lock:
+                self.write_stream.write(json.dumps(message).encode() + b'\n')
+                await self.write_stream.drain()
+
         async def run(self, read_stream, write_stream, initialization_options=None):
-            # 简单的stdio MCP实现
+            # 简单的stdio MCP实现：每个请求在独立任务中处理，慢调用不阻塞后续请求
+            self.write_stream = write_stream
+            self.write_lock = asyncio.Lock()
+            tasks = set()
             while True:
-                try:
-                    line = await read_stream.readline()
-                    if not line:
-                        break
-
-                    data = json.loads(line.decode().strip())
-                    response = await self.handle_request(data)
-
-                    if response:
-                        write_stream.write(json.dumps(response).encode() + b'\n')
-                        await write_stream.drain()
-
-                except Exception as e:
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": data.get('id'),
-                        "error": {"code": -32603, "message": str(e)}
-                    }
-                    write_stream.write(json.dumps(error_response).encode() + b'\n')
-                    await write_stream.drain()
+                line = await read_stream.readline()
+                if not line:
+                    break
+                task = asyncio.ensure_future(self.dispatch(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            # 输入结束后等待进行中的请求写完响应
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        async def dispatch(self, line: bytes):
+            data = {}
+            try:
+                data = json.loads(line.decode().strip())
+                response = await self.handle_request(data)
+                if response:
+                    await self.write_message(response)
+
+            except Exception as e:
+                error_response = {
+                    "jsonrpc": "2.0",
+                    "id": data.get('id') if isinstance(data, dict) else None,
+                    "error": {"code": -32603, "message": str(e)}
+                }
+                await self.write_message(error_response)
 
         async def handle_request(self, data):
             method = data.get('method')
@@ -76,7 +106,7 @@ except ImportError:
                     "result": {"tools": result}
                 }
             elif method == 'tools/call':
-                result = await self.handlers['call_tool'](params)
+                result = await self.handlers['call_tool'](params, request_id)
                 return {
                     "jsonrpc": "2.0",
                     "id": request_id,
@@ -85,84 +115,149 @@ except ImportError:
 
             return None
 
+# Node脚本单行stderr的上限（asyncio默认64KiB）
+NODE_STDERR_LINE_LIMIT = 16 * 1024 * 1024
+# 基础实现读取stdin上单条JSON-RPC消息的上限（大模板数据随请求一起到达）
+MCP_STDIO_LINE_LIMIT = 16 * 1024 * 1024
+
+
+def parse_progress_line(line: str):
+    """generate.js 输出到stderr的进度行：{"type": "progress", ...}，其他内容返回None"""
+    if not line.startswith('{"type":"progress"'):
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
 class UnityMCPServer:
     def __init__(self):
         self.server = Server("unity-generator", "1.0.0")
         self.project_root = Path(__file__).parent
+        # 到编辑器Bridge的连接，首次需要导入资源时才建立；只发送导入命令，不需要完整的编辑器客户端
+        self.editor_transport = None
+        self._editor_connect_lock = asyncio.Lock()
+        self._editor_request_counter = 0
+        # 并发的相同只读调用（模板列表）共享一个Node进程
+        self.single_flight = SingleFlight()
+        # 模板列表缓存，以TemplateManager的目录版本为键；版本文件变化即失效
+        self.catalog_version_path = self.project_root / "src" / "templates" / "data" / ".catalog-version"
+        self._templates_cache: Optional[Tuple[str, subprocess.CompletedProcess]] = None
+        # 工具调用剖析（UNITY_MCP_PROFILE），关闭时为None
+        self.profiler = ToolProfiler.from_env()
         self.setup_handlers()
 
     def setup_handlers(self):
-        @self.server.list_tools_handler()
-        async def handle_list_tools():
-            """Return list of available Unity generation tools"""
-            return [
-                {
-                    "name": "generate_unity_feature",
-                    "description": "根据自然语言描述生成Unity界面和功能",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "description": {
-                                "type": "string",
-                                "description": "功能描述，如'登录界面'、'背包系统'等"
-                            },
-                            "projectPath": {
-                                "type": "string",
-                                "description": "Unity项目路径"
-                            }
+        # 工具列表只构建一次，inputSchema同时编译为参数校验器
+        self.tools = [
+            {
+                "name": "generate_unity_feature",
+                "description": "根据自然语言描述生成Unity界面和功能",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "description": {
+                            "type": "string",
+                            "description": "功能描述，如'登录界面'、'背包系统'等"
                         },
-                        "required": ["description", "projectPath"]
-                    }
-                },
-                {
-                    "name": "list_unity_templates",
-                    "description": "列出所有可用的Unity模板",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {}
-                    }
-                },
-                {
-                    "name": "create_unity_template",
-                    "description": "创建自定义Unity模板",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "templateName": {
-                                "type": "string",
-                                "description": "模板名称"
-                            },
-                            "templateData": {
-                                "type": "object",
-                                "description": "模板数据配置"
-                            }
+                        "projectPath": {
+                            "type": "string",
+                            "description": "Unity项目路径"
                         },
-                        "required": ["templateName", "templateData"]
-                    }
+                        "importAssets": {
+                            "type": "boolean",
+                            "description": "生成后让编辑器只导入新生成的文件（默认开启）",
+                            "default": True
+                        }
+                    },
+                    "required": ["description", "projectPath"]
                 }
-            ]
+            },
+            {
+                "name": "list_unity_templates",
+                "description": "列出所有可用的Unity模板",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {}
+                }
+            },
+            {
+                "name": "create_unity_template",
+                "description": "创建自定义Unity模板",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "templateName": {
+                            "type": "string",
+                            "description": "模板名称"
+                        },
+                        "templateData": {
+                            "type": "object",
+                            "description": "模板数据配置"
+                        }
+                    },
+                    "required": ["templateName", "templateData"]
+                }
+            }
+        ]
+        self.validators = compile_tool_validators(self.tools)
+
+        @self.server.list_tools_handler()
+        async def handle_list_tools():
+            """Return list of available Unity generation tools"""
+            return self.tools
 
         @self.server.call_tool_handler()
-        async def handle_call_tool(params):
+        async def handle_call_tool(params, request_id=None):
             """Handle tool execution"""
             name = params.get("name")
             arguments = params.get("arguments", {})
+            # 客户端给出progressToken时，长时间的生成过程发送进度通知
+            token = (params.get("_meta") or {}).get("progressToken")
+
+            async def send_progress(progress, total, message):
+                await self.server.send_notification(progress_notification(token, progress, total, message))
+
+            async with track_progress(token, send_progress):
+                if self.profiler is None:
+                    return await self.call_tool(name, arguments)
+                return await self.profiler.run(name, lambda: self.call_tool(name, arguments), request_id)
+
+    async def call_tool(self, name: str, arguments: dict):
+        # 参数不合法时不启动Node进程
+        phase("validate")
+        validator = self.validators.get(name)
+        if validator:
+            try:
+                arguments = validator(arguments)
+            except SchemaValidationError as e:
+                return {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"❌ 参数错误: {str(e)}"
+                        }
+                    ]
+                }
 
-            if name == "generate_unity_feature":
-                return await self.generate_unity_feature(arguments)
-            elif name == "list_unity_templates":
-                return await self.list_unity_templates()
-            elif name == "create_unity_template":
-                return await self.create_unity_template(arguments)
-            else:
-                raise Exception(f"Unknown tool: {name}")
+        if name == "generate_unity_feature":
+            return await self.generate_unity_feature(arguments)
+        elif name == "list_unity_templates":
+            return await self.list_unity_templates()
+        elif name == "create_unity_template":
+            return await self.create_unity_template(arguments)
+        else:
+            raise Exception(f"Unknown tool: {name}")
 
     async def generate_unity_feature(self, args):
         """Generate Unity feature based on natural language description"""
         description = args.get("description", "")
         project_path = args.get("projectPath", str(self.project_root))
+        import_assets = args.get("importAssets", True)
 
         try:
+            started = time.perf_counter()
             # 调用Node.js生成器
             cmd = [
                 "node",
@@ -171,21 +266,34 @@ class UnityMCPServer:
                 project_path
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(self.project_root)
-            )
+            result = await self.run_node(cmd)
 
             if result.returncode == 0:
+                phase("parse")
                 output = json.loads(result.stdout)
+                created_files = output.get('createdFiles', [])
+                generate_ms = (time.perf_counter() - started) * 1000.0
+
+                text = f"✅ 成功生成Unity功能: {description}\\n\\n生成的文件:\\n" + \
+                       "\\n".join(f"- {file}" for file in created_files)
+
+                if import_assets and created_files:
+                    phase("import")
+                    report_progress(f"import: 导入 {len(created_files)} 个资源")
+                    import_started = time.perf_counter()
+                    import_text = await self.import_generated_assets(project_path, created_files)
+                    import_ms = (time.perf_counter() - import_started) * 1000.0
+                    phase("format")
+                    text += f"\\n\\n{import_text}"
+                    text += f"\\n⏱️ 生成 {generate_ms:.0f} ms + 导入 {import_ms:.0f} ms = {generate_ms + import_ms:.0f} ms"
+                else:
+                    text += f"\\n\\n⏱️ 生成 {generate_ms:.0f} ms"
+
                 return {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"✅ 成功生成Unity功能: {description}\\n\\n生成的文件:\\n" +
-                                   "\\n".join(f"- {file}" for file in output.get('createdFiles', []))
+                            "text": text
                         }
                     ]
                 }
@@ -209,18 +317,129 @@ class UnityMCPServer:
                 ]
             }
 
+    async def import_generated_assets(self, project_path: str, created_files: List[str]) -> str:
+        """让编辑器批量导入刚生成的文件，替代整个工程的Refresh"""
+        # createdFiles 是相对 Assets/ 的路径
+        asset_paths = ["Assets/" + file.replace("\\", "/").lstrip("/") for file in created_files]
+
+        try:
+            result = await self.editor_request("unity.import_assets", {
+                "paths": asset_paths,
+                "projectPath": str(project_path)
+            })
+        except Exception as e:
+            return f"⚠️ 资源导入失败: {str(e)}，文件将在Unity下次刷新时导入"
+
+        if not result.get("success"):
+            return f"⚠️ 资源导入未完成: {result.get('error', 'Unknown error')}，文件将在Unity下次刷新时导入"
+
+        data = result.get("data", {})
+        text = f"📥 已导入 {len(data.get('imported', []))} 个资源（编辑器内 {data.get('durationMs', 0)} ms）"
+        skipped = data.get("skipped", [])
+        if skipped:
+            text += "\\n⚠️ 跳过:\\n" + "\\n".join(f"- {path}" for path in skipped)
+        return text
+
+    async def editor_request(self, method: str, params: dict) -> dict:
+        """通过Bridge连接发送一条命令（UNITY_MCP_URL，默认 ws://localhost:8765），断线时重连"""
+        async with self._editor_connect_lock:
+            if self.editor_transport is None or not self.editor_transport.connected:
+                transport = create_transport(os.environ.get("UNITY_MCP_URL", DEFAULT_BRIDGE_URL))
+                await transport.connect()
+                self.editor_transport = transport
+
+        self._editor_request_counter += 1
+        report_progress(f"executing: {method}")
+        response = await self.editor_transport.request({
+            "jsonrpc": "2.0",
+            "id": f"gen_{self._editor_request_counter}",
+            "method": method,
+            "params": params
+        })
+        return response.get("result", response)
+
+    async def run_node(self, cmd: List[str], input_data: Optional[str] = None) -> subprocess.CompletedProcess:
+        """异步运行Node脚本，不阻塞事件循环上的其他请求；input_data 通过stdin传入"""
+        phase("node")
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.project_root),
+            limit=NODE_STDERR_LINE_LIMIT
+        )
+
+        async def write_stdin():
+            if input_data is not None:
+                try:
+                    process.stdin.write(input_data.encode("utf-8"))
+                    await process.stdin.drain()
+                    process.stdin.close()
+                except (BrokenPipeError, ConnectionResetError):
+                    # 脚本没读完输入就退出了，原因在它的stderr和退出码里
+                    pass
+
+        # stderr按行读取：脚本的结构化进度行转发为进度通知，其余保留为错误输出
+        stderr_lines = []
+
+        async def read_stderr():
+            async for raw in process.stderr:
+                line = raw.decode("utf-8", errors="replace")
+                event = parse_progress_line(line)
+                if event is None:
+                    stderr_lines.append(line)
+                else:
+                    report_progress(f"{event.get('step', 'node')}: {event.get('message', '')}",
+                                    event.get("progress"), event.get("total"))
+
+        tasks = [asyncio.ensure_future(io) for io in (process.stdout.read(), read_stderr(), write_stdin())]
+        completed = False
+        try:
+            stdout, _, _ = await asyncio.gather(*tasks)
+            completed = True
+        finally:
+            if not completed:
+                # 读写出错或调用被取消：结束Node进程，不留下孤儿进程
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if process.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+            await process.wait()
+        return subprocess.CompletedProcess(
+            cmd, process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            "".join(stderr_lines)
+        )
+
+    def read_catalog_version(self) -> Optional[str]:
+        """模板目录版本（TemplateManager 每次改动模板集合时递增），尚未生成时为None"""
+        try:
+            return self.catalog_version_path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
     async def list_unity_templates(self):
         """List all available Unity templates"""
         try:
             cmd = ["node", str(self.project_root / "src" / "list-templates.js")]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(self.project_root)
-            )
+            # 先读版本再列目录：列目录期间有新模板时缓存的是旧版本，下次读取自然失效
+            version = self.read_catalog_version()
+            cached = self._templates_cache
+            if version is not None and cached is not None and cached[0] == version:
+                result = cached[1]
+            else:
+                # 合并到他人在途的Node进程时，等待时间同样计入node阶段
+                phase("node")
+                result = await self.single_flight.do(
+                    ("list_unity_templates",), lambda: self.run_node(cmd), label="list_unity_templates")
+                if result.returncode == 0 and version is not None:
+                    self._templates_cache = (version, result)
 
             if result.returncode == 0:
+                phase("parse")
                 templates = json.loads(result.stdout)
                 template_list = "\\n".join(
                     f"- {t['name']} ({t['id']}): {t['description']}"
@@ -261,19 +480,17 @@ class UnityMCPServer:
         template_data = args.get("templateData", {})
 
         try:
+            # 模板数据走stdin，大模板不受命令行参数长度限制
             cmd = [
                 "node",
                 str(self.project_root / "src" / "create-template.js"),
                 template_name,
-                json.dumps(template_data)
+                "-"
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(self.project_root)
-            )
+            result = await self.run_node(cmd, input_data=json.dumps(template_data))
+            # 之后的模板列表请求不能复用创建前就已在途的结果
+            self.single_flight.forget("list_unity_templates")
 
             if result.returncode == 0:
                 return {
@@ -320,8 +537,17 @@ async def main():
                 )
             )
     else:
-        # 使用自定义MCP实现
-        await server.server.run(sys.stdin, sys.stdout)
+        # 使用自定义MCP实现：stdin/stdout 接入事件循环，请求可以并发处理
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=MCP_STDIO_LINE_LIMIT)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        await server.server.run(reader, writer)
+
+    # 退出时输出合并统计：多少次模板列表请求共享了同一个Node进程
+    for label, counts in server.single_flight.stats().items():
+        print(f"🔗 {label}: {counts['executed']} executed, {counts['shared']} shared", file=sys.stderr)
 
 if __name__ == "__main__":
     print("🚀 Unity MCP Generator Server starting...", file=sys.stderr)
@@ -1,14 +1,39 @@
 #!/usr/bin/env node
 
+import fs from 'fs-extra';
 import { TemplateManager } from './templates/TemplateManager.js';
 
+/**
+ * 读取模板数据：参数为 '-' 或省略时从stdin读取，'--file path' 从文件读取，否则为JSON字符串
+ * 大模板应走stdin或文件，命令行参数有长度限制
+ */
+async function readTemplateData(args) {
+  if (args[0] === '--file') {
+    return args[1] ? await fs.readFile(args[1], 'utf8') : null;
+  }
+  if (args[0] !== undefined && args[0] !== '-') {
+    return args[0];
+  }
+  if (process.stdin.isTTY) {
+    return null;
+  }
+
+  const chunks = [];
+  for await (const chunk of process.stdin) {
+    chunks.push(chunk);
+  }
+  return Buffer.concat(chunks).toString('utf8') || null;
+}
+
 /**
  * 命令行工具：创建自定义模板
- * 用法: node create-template.js "template_name" '{"name": "Custom", "description": "Custom template"}'
+ * 用法: echo '{"name": "Custom", "description": "Custom template"}' | node create-template.js "template_name" -
+ *       node create-template.js "template_name" --file template.json
+ *       node create-template.js "template_name" '{"name": "Custom", "description": "Custom template"}'
  */
 async function main() {
   const templateName = process.argv[2];
-  const templateDataStr = process.argv[3];
+  const templateDataStr = await readTemplateData(process.argv.slice(3));
 
   if (!templateName) {
     console.error(JSON.stringify({
@@ -35,6 +60,7 @@ async function main() {
     console.log(JSON.stringify({
       success: result.success,
       path: result.path,
+      catalogVersion: result.catalogVersion,
       message: `模板 '${templateName}' 创建成功`
     }, null, 2));
 
@@ -4,6 +4,28 @@ import { UnityCommandParser } from './parsers/CommandParser.js';
 import { TemplateManager } from './templates/TemplateManager.js';
 import { UnityGenerator } from './generators/UnityGenerator.js';
 
+/**
+ * 向stderr输出一行结构化进度，供 mcp-server.py 转发为MCP进度通知
+ * 格式: {"type": "progress", "step": "write", "progress": 3, "total": 8, "message": "..."}
+ */
+function createProgressReporter() {
+  const reporter = {
+    progress: 0,
+    total: undefined,
+    report(step, message) {
+      reporter.progress += 1;
+      console.error(JSON.stringify({
+        type: 'progress',
+        step: step,
+        progress: reporter.progress,
+        total: reporter.total,
+        message: message
+      }));
+    }
+  };
+  return reporter;
+}
+
 /**
  * 命令行工具：生成Unity功能
  * 用法: node generate.js "我想做一个登录界面" "/path/to/unity/project"
@@ -27,18 +49,26 @@ async function main() {
   }
 
   try {
+    const progress = createProgressReporter();
     const parser = new UnityCommandParser();
     const templateManager = new TemplateManager();
-    const generator = new UnityGenerator();
+    const generator = new UnityGenerator({
+      onProgress: (step, message) => progress.report(step, message)
+    });
 
     // 初始化模板系统
     await templateManager.initializeTemplates();
 
     // 解析命令
     const command = await parser.parse(description);
+    progress.report('parse', `解析命令: ${command.type}`);
 
     // 获取模板
     const template = await templateManager.getTemplate(command.type);
+    // 之后的步骤：每个文件写入 + 对应的.meta，再加场景与项目设置
+    const fileCount = (template.files?.length || 0) + (template.resources?.length || 0);
+    progress.total = progress.progress + 1 + fileCount * 2 + 1;
+    progress.report('template', `加载模板: ${template.name}`);
 
     // 生成Unity功能
     const result = await generator.generate({
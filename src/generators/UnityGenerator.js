@@ -6,8 +6,13 @@ import path from 'path';
  * 负责根据模板和命令生成Unity项目文件
  */
 export class UnityGenerator {
-  constructor() {
+  /**
+   * @param {Object} options - 生成器选项
+   * @param {Function} options.onProgress - 进度回调 (step, message)，step 为 write/meta/scene/settings
+   */
+  constructor(options = {}) {
     this.createdFiles = [];
+    this.onProgress = options.onProgress || (() => {});
   }
 
   /**
@@ -41,6 +46,7 @@ export class UnityGenerator {
 
       // 更新项目配置
       await this.updateProjectSettings(projectPath, template);
+      this.onProgress('settings', '更新场景与项目设置');
 
       return {
         success: true,
@@ -128,9 +134,11 @@ export class UnityGenerator {
 
         // 写入文件
         await fs.writeFile(fullPath, content, 'utf8');
+        this.onProgress('write', `写入脚本: ${file.path}`);
 
         // 生成对应的.meta文件
         await this.generateMetaFile(fullPath, 'script');
+        this.onProgress('meta', `生成meta: ${file.path}.meta`);
 
         this.createdFiles.push(file.path);
         console.error(`Generated script: ${file.path}`);
@@ -156,7 +164,9 @@ export class UnityGenerator {
 
         await fs.ensureDir(path.dirname(fullPath));
         await fs.writeFile(fullPath, content, 'utf8');
+        this.onProgress('write', `写入预制件: ${file.path}`);
         await this.generateMetaFile(fullPath, 'prefab');
+        this.onProgress('meta', `生成meta: ${file.path}.meta`);
 
         this.createdFiles.push(file.path);
         console.error(`Generated prefab: ${file.path}`);
@@ -170,7 +180,9 @@ export class UnityGenerator {
 
         await fs.ensureDir(path.dirname(fullPath));
         await fs.writeFile(fullPath, resource.content, 'utf8');
+        this.onProgress('write', `写入资源: ${resource.path}`);
         await this.generateMetaFile(fullPath, resource.type);
+        this.onProgress('meta', `生成meta: ${resource.path}.meta`);
 
         this.createdFiles.push(resource.path);
         console.error(`Generated resource: ${resource.path}`);
@@ -1,3 +1,4 @@
+import { createHash } from 'crypto';
 import fs from 'fs-extra';
 import path from 'path';
 import { fileURLToPath } from 'url';
@@ -5,6 +6,15 @@ import { fileURLToPath } from 'url';
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
+// 模板目录的目录版本文件：每次模板集合变化时递增，读取方比较它即可判断缓存是否过期
+export const CATALOG_VERSION_FILE = '.catalog-version';
+
+// 锁文件超过这个时间仍未释放，视为持有进程已崩溃
+const LOCK_STALE_MS = 30000;
+const LOCK_TIMEOUT_MS = 10000;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
 /**
  * Unity模板管理器
  * 负责管理和提供各种Unity功能的模板配置
@@ -12,15 +22,21 @@ const __dirname = path.dirname(__filename);
 export class TemplateManager {
   constructor() {
     this.templatesDir = path.join(__dirname, 'data');
-    this.initializeTemplates();
+    this.catalogVersionPath = path.join(this.templatesDir, CATALOG_VERSION_FILE);
+    this.ready = null;
   }
 
   /**
-   * 初始化模板系统
+   * 初始化模板系统（同一实例只执行一次）
    */
-  async initializeTemplates() {
-    await fs.ensureDir(this.templatesDir);
-    await this.createDefaultTemplates();
+  initializeTemplates() {
+    if (!this.ready) {
+      this.ready = (async () => {
+        await fs.ensureDir(this.templatesDir);
+        await this.createDefaultTemplates();
+      })();
+    }
+    return this.ready;
   }
 
   /**
@@ -140,19 +156,185 @@ export class TemplateManager {
       }
     };
 
-    // 保存默认模板到文件
+    // 保存默认模板到文件；内容未变时不重写，避免每次启动都改动目录
+    let changed = false;
     for (const [key, template] of Object.entries(defaultTemplates)) {
       const templatePath = path.join(this.templatesDir, `${key}.json`);
-      await fs.writeJSON(templatePath, template, { spaces: 2 });
+      const content = JSON.stringify(template, null, 2) + '\n';
+      const current = await fs.readFile(templatePath, 'utf8').catch(() => null);
+      if (current !== content) {
+        await this.withLock(key, () => this.writeFileAtomic(templatePath, content));
+        changed = true;
+      }
+    }
+    if (changed) {
+      await this.bumpCatalogVersion();
+    }
+  }
+
+  /**
+   * 原子写入：先写同目录下的临时文件，再rename到目标位置，读取方不会看到写了一半的文件
+   * @param {string} filePath - 目标文件
+   * @param {string} content - 文件内容
+   */
+  async writeFileAtomic(filePath, content) {
+    const tmpPath = `${filePath}.${process.pid}.${Math.random().toString(36).slice(2)}.tmp`;
+    try {
+      await fs.writeFile(tmpPath, content, 'utf8');
+      await fs.rename(tmpPath, filePath);
+    } catch (error) {
+      await fs.remove(tmpPath).catch(() => {});
+      throw error;
+    }
+  }
+
+  /**
+   * 在锁文件保护下执行 fn；同名的锁跨进程互斥，不同名字互不阻塞
+   * @param {string} name - 锁名称（模板名或 catalog）
+   * @param {Function} fn - 持有锁时执行的异步函数
+   */
+  async withLock(name, fn) {
+    const lockPath = path.join(this.templatesDir, `.${name}.lock`);
+    // 锁文件内容是这次加锁独有的token，释放或破除时据此确认还是同一把锁
+    const token = `${process.pid}.${Date.now()}.${Math.random().toString(36).slice(2)}`;
+    const deadline = Date.now() + LOCK_TIMEOUT_MS;
+    let delay = 5;
+
+    for (;;) {
+      try {
+        const handle = await fs.open(lockPath, 'wx');
+        await fs.writeFile(handle, token);
+        await fs.close(handle);
+        break;
+      } catch (error) {
+        if (error.code !== 'EEXIST') throw error;
+      }
+
+      const owner = await this.readLock(lockPath);
+      if (owner && Date.now() - owner.mtimeMs > LOCK_STALE_MS) {
+        await this.breakStaleLock(lockPath, owner.token);
+        continue;
+      }
+      if (Date.now() > deadline) {
+        throw new Error(`Timed out waiting for template lock: ${name}`);
+      }
+      await sleep(delay + Math.random() * delay);
+      delay = Math.min(delay * 2, 200);
+    }
+
+    try {
+      return await fn();
+    } finally {
+      await this.releaseLock(lockPath, token).catch(() => {});
+    }
+  }
+
+  /**
+   * 读取锁文件的token与修改时间，锁不存在时为 null
+   * @param {string} lockPath - 锁文件
+   * @returns {{token: string, mtimeMs: number}|null} 锁的持有信息
+   */
+  async readLock(lockPath) {
+    let fd;
+    try {
+      fd = await fs.open(lockPath, 'r');
+    } catch (error) {
+      if (error.code === 'ENOENT') return null;
+      throw error;
+    }
+    // 通过同一个fd读取，修改时间与token一定来自同一把锁
+    try {
+      const stat = await fs.fstat(fd);
+      const token = await fs.readFile(fd, 'utf8');
+      return { token, mtimeMs: stat.mtimeMs };
+    } finally {
+      await fs.close(fd);
+    }
+  }
+
+  /**
+   * 破除已崩溃持有者留下的锁：先用 link 以这把锁的token认领，同一把过期锁只有一个进程能破除；
+   * link到的已是别人在检查之后新建的锁时只撤销认领，不动那把锁
+   * @param {string} lockPath - 锁文件
+   * @param {string} token - 读到的过期锁内容
+   */
+  async breakStaleLock(lockPath, token) {
+    const claimPath = `${lockPath}.${createHash('sha1').update(token).digest('hex').slice(0, 16)}.break`;
+    try {
+      await fs.link(lockPath, claimPath);
+    } catch (error) {
+      if (error.code === 'ENOENT') return;
+      if (error.code !== 'EEXIST') throw error;
+      // 另一个进程正在破除；认领的ctime（link时间）也过期说明它在破除途中崩溃了
+      const claim = await fs.stat(claimPath).catch(() => null);
+      if (claim && Date.now() - claim.ctimeMs > LOCK_STALE_MS) {
+        await fs.remove(claimPath);
+      }
+      return;
+    }
+
+    try {
+      if (await fs.readFile(claimPath, 'utf8').catch(() => null) === token) {
+        await this.releaseLock(lockPath, token);
+      }
+    } finally {
+      await fs.remove(claimPath);
     }
   }
 
+  /**
+   * 删除内容为 token 的锁：先rename到独有的文件名再核对内容，
+   * 不会删掉别人在检查之后新建的锁；拿到的不是这把锁时放回原处
+   * @param {string} lockPath - 锁文件
+   * @param {string} token - 期望的锁内容
+   * @returns {boolean} 是否删除了这把锁
+   */
+  async releaseLock(lockPath, token) {
+    const takenPath = `${lockPath}.${process.pid}.${Math.random().toString(36).slice(2)}.taken`;
+    try {
+      await fs.rename(lockPath, takenPath);
+    } catch (error) {
+      if (error.code === 'ENOENT') return false;
+      throw error;
+    }
+
+    const taken = await fs.readFile(takenPath, 'utf8').catch(() => null);
+    if (taken !== token) {
+      // link不覆盖已存在的文件：期间已有人重新加锁时保留对方的锁
+      await fs.link(takenPath, lockPath).catch(() => {});
+    }
+    await fs.remove(takenPath);
+    return taken === token;
+  }
+
+  /**
+   * 读取目录版本，目录尚未初始化时为 0
+   * @returns {number} 目录版本
+   */
+  async getCatalogVersion() {
+    const content = await fs.readFile(this.catalogVersionPath, 'utf8').catch(() => '0');
+    return parseInt(content, 10) || 0;
+  }
+
+  /**
+   * 递增目录版本
+   * @returns {number} 新版本
+   */
+  async bumpCatalogVersion() {
+    return await this.withLock('catalog', async () => {
+      const version = await this.getCatalogVersion() + 1;
+      await this.writeFileAtomic(this.catalogVersionPath, `${version}\n`);
+      return version;
+    });
+  }
+
   /**
    * 获取模板
    * @param {string} templateType - 模板类型
    * @returns {Object} 模板对象
    */
   async getTemplate(templateType) {
+    await this.initializeTemplates();
     const templatePath = path.join(this.templatesDir, `${templateType}.json`);
 
     if (await fs.pathExists(templatePath)) {
@@ -167,11 +349,13 @@ export class TemplateManager {
    * @returns {Array} 模板列表
    */
   async listTemplates() {
+    await this.initializeTemplates();
     const files = await fs.readdir(this.templatesDir);
     const templates = [];
 
     for (const file of files) {
-      if (path.extname(file) === '.json') {
+      // 跳过锁文件、临时文件和目录版本文件
+      if (path.extname(file) === '.json' && !file.startsWith('.')) {
         const templatePath = path.join(this.templatesDir, file);
         const template = await fs.readJSON(templatePath);
         templates.push({
@@ -193,11 +377,19 @@ export class TemplateManager {
    * @returns {Object} 创建结果
    */
   async createTemplate(name, templateData) {
+    if (!name || name !== path.basename(name) || name.startsWith('.')) {
+      throw new Error(`Invalid template name: ${name}`);
+    }
+    await this.initializeTemplates();
+
     const templatePath = path.join(this.templatesDir, `${name}.json`);
-    await fs.writeJSON(templatePath, templateData, { spaces: 2 });
+    const content = JSON.stringify(templateData, null, 2) + '\n';
+    await this.withLock(name, () => this.writeFileAtomic(templatePath, content));
+    const catalogVersion = await this.bumpCatalogVersion();
 
     return {
       path: templatePath,
+      catalogVersion: catalogVersion,
       success: true
     };
   }
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Unity Log Fingerprint - 控制台日志指纹与重复折叠
+Normalizes log entries into fingerprints (message template + top stack frame) and collapses
+duplicates into counted entries for bridges that return one entry per message
+"""
+
+import hashlib
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+# 与 ConsoleLogsService 的折叠窗口一致
+DEFAULT_COLLAPSE_WINDOW = 10.0
+
+_GUID = re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b")
+_HEX = re.compile(r"\b0x[0-9a-fA-F]+\b")
+# 不紧跟在字母/下划线后的数字：Enemy_12、Player2 这类名称保持不变
+_NUMBER = re.compile(r"(?<![A-Za-z_\d])[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_SPACES = re.compile(r"\s+")
+
+# 日志API自身的栈帧，不作为来源
+_LOGGING_FRAMES = ("UnityEngine.Debug:", "UnityEngine.Logger:", "UnityEngine.DebugLogHandler:")
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def normalize_message(message: str) -> str:
+    """消息模板：GUID、十六进制、数字替换为占位符，空白合并"""
+    template = _GUID.sub("<guid>", message)
+    template = _HEX.sub("<hex>", template)
+    template = _NUMBER.sub("<n>", template)
+    return _SPACES.sub(" ", template).strip()
+
+
+def top_frame(stack_trace: Optional[str]) -> str:
+    """第一个不属于日志API的栈帧，如 'EnemyAI:Update () (at Assets/Scripts/EnemyAI.cs:42)'"""
+    for line in (stack_trace or "").splitlines():
+        line = line.strip()
+        if line and not line.startswith(_LOGGING_FRAMES):
+            return line
+    return ""
+
+
+def fingerprint(message: str, stack_trace: Optional[str] = None, log_type: str = "Log") -> Tuple[str, str, str]:
+    """-> (fingerprint, template, top_frame)；类型不同的相同消息视为不同指纹"""
+    template = normalize_message(message)
+    frame = top_frame(stack_trace)
+    digest = hashlib.sha1(f"{log_type}\0{template}\0{frame}".encode("utf-8")).hexdigest()[:16]
+    return digest, template, frame
+
+
+def _parse_timestamp(value) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        # Bridge格式 "yyyy-MM-dd HH:mm:ss.fff"，fromisoformat 比 strptime 快一个数量级
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        try:
+            return datetime.strptime(value, _TIMESTAMP_FORMAT).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+
+def _as_entry(log: Union[str, dict]) -> dict:
+    # 旧版Bridge（SimpleUnityMCP）返回纯字符串
+    return {"message": log, "type": "Log"} if isinstance(log, str) else log
+
+
+def collapse_logs(logs: List[Union[str, dict]], window: float = DEFAULT_COLLAPSE_WINDOW) -> List[dict]:
+    """
+    把同一指纹的日志折叠为一条，带 count 与 firstTimestamp/lastTimestamp
+
+    Input is in bridge order (newest first). Duplicates collapse when they are consecutive or
+    when they fall within `window` seconds of the group's last occurrence. Entries the bridge
+    already collapsed keep their counts. Output is ordered by last occurrence, newest first;
+    message and stackTrace are taken from the latest occurrence.
+    """
+    groups: List[dict] = []
+    open_groups: Dict[str, dict] = {}
+    previous = None
+
+    for log in reversed(logs):
+        entry = _as_entry(log)
+        message = entry.get("message", "")
+        log_type = entry.get("type", "Log")
+        key = entry.get("fingerprint")
+        if key and entry.get("template") is not None:
+            template, frame = entry["template"], entry.get("topFrame", "")
+        else:
+            key, template, frame = fingerprint(message, entry.get("stackTrace"), log_type)
+
+        first = entry.get("firstTimestamp") or entry.get("timestamp")
+        last = entry.get("lastTimestamp") or entry.get("timestamp")
+        count = int(entry.get("count", 1))
+
+        group = open_groups.get(key)
+        if group is not None and group is not previous:
+            group_last, entry_first = _parse_timestamp(group["lastTimestamp"]), _parse_timestamp(first)
+            if group_last is None or entry_first is None or entry_first - group_last > window:
+                group = None
+        if group is None:
+            group = {
+                "fingerprint": key,
+                "template": template,
+                "topFrame": frame,
+                "type": log_type,
+                "count": 0,
+                "firstTimestamp": first,
+                "lastTimestamp": last,
+            }
+            groups.append(group)
+            open_groups[key] = group
+
+        group["count"] += count
+        group["message"] = message
+        group["lastTimestamp"] = last or group["lastTimestamp"]
+        if "stackTrace" in entry:
+            group["stackTrace"] = entry["stackTrace"]
+        previous = group
+
+    groups.sort(key=lambda g: _parse_timestamp(g["lastTimestamp"]) or 0.0, reverse=True)
+    return groups
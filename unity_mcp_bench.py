@@ -0,0 +1,715 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Bench - trace回放与性能基准（开发工具，生产服务器不导入）
+Replays JSONL traces and runs the transport, caching and profiling benchmarks against the mock bridge
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from unity_log_fingerprint import collapse_logs
+from unity_mcp_mock import MockUnityBridge, build_mock_hierarchy
+from unity_mcp_trace import load_trace
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile, 0 for empty input"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class TraceReplayer:
+    """Re-issue a trace through UnityMCPServer and measure latency/throughput"""
+
+    def __init__(self, server, speed: float = 1.0, concurrency: int = 64):
+        # speed > 0: 按原始节奏的speed倍回放; speed == 0: 以最大并发回放
+        self.server = server
+        self.speed = speed
+        self.concurrency = concurrency
+
+    async def replay(self, entries: List[dict]) -> dict:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results: List[Optional[dict]] = [None] * len(entries)
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+
+        async def run_one(index: int, entry: dict):
+            if self.speed > 0:
+                delay = entry.get("offset", 0) / self.speed - (loop.time() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            async with semaphore:
+                t0 = time.perf_counter()
+                result = await self.server.execute_unity_command(entry["tool"], dict(entry.get("arguments") or {}))
+                duration_ms = (time.perf_counter() - t0) * 1000.0
+            text = "".join(item.get("text", "") for item in result.get("content", []))
+            results[index] = {
+                "tool": entry["tool"],
+                "duration_ms": duration_ms,
+                "success": not text.startswith("❌")
+            }
+
+        await asyncio.gather(*(run_one(i, e) for i, e in enumerate(entries)))
+        wall = loop.time() - start
+        return build_report(entries, [r for r in results if r], wall)
+
+
+def build_report(recorded: List[dict], replayed: List[dict], replay_wall: float) -> dict:
+    """对比录制与回放的延迟和吞吐"""
+    def span(entries):
+        if not entries:
+            return 1e-9
+        first = min(e.get("offset", 0) for e in entries)
+        last = max(e.get("offset", 0) + e.get("duration_ms", 0) / 1000.0 for e in entries)
+        return max(last - first, 1e-9)
+
+    tools: Dict[str, Dict[str, Any]] = {}
+    for entry in recorded:
+        tools.setdefault(entry["tool"], {"recorded": [], "replayed": [], "errors": 0})["recorded"].append(entry.get("duration_ms", 0.0))
+    for entry in replayed:
+        stats = tools.setdefault(entry["tool"], {"recorded": [], "replayed": [], "errors": 0})
+        stats["replayed"].append(entry["duration_ms"])
+        if not entry["success"]:
+            stats["errors"] += 1
+
+    per_tool = {}
+    for name, stats in sorted(tools.items()):
+        rec_p50 = percentile(stats["recorded"], 50)
+        rep_p50 = percentile(stats["replayed"], 50)
+        per_tool[name] = {
+            "calls": len(stats["replayed"]),
+            "errors": stats["errors"],
+            "recorded_p50_ms": round(rec_p50, 3),
+            "replayed_p50_ms": round(rep_p50, 3),
+            "recorded_p95_ms": round(percentile(stats["recorded"], 95), 3),
+            "replayed_p95_ms": round(percentile(stats["replayed"], 95), 3),
+            "p50_delta_pct": round((rep_p50 - rec_p50) / rec_p50 * 100.0, 1) if rec_p50 else None
+        }
+
+    recorded_tput = len(recorded) / span(recorded)
+    replayed_tput = len(replayed) / max(replay_wall, 1e-9)
+    return {
+        "calls": len(replayed),
+        "errors": sum(t["errors"] for t in per_tool.values()),
+        "recorded_throughput_per_s": round(recorded_tput, 2),
+        "replayed_throughput_per_s": round(replayed_tput, 2),
+        "throughput_delta_pct": round((replayed_tput - recorded_tput) / recorded_tput * 100.0, 1) if recorded_tput else None,
+        "replay_wall_s": round(replay_wall, 3),
+        "tools": per_tool
+    }
+
+
+def print_report(report: dict):
+    print("📊 Replay Report")
+    print("=" * 40)
+    print(f"Calls: {report['calls']}  Errors: {report['errors']}  Wall: {report['replay_wall_s']}s")
+    print(f"Throughput: recorded {report['recorded_throughput_per_s']}/s → "
+          f"replayed {report['replayed_throughput_per_s']}/s ({report['throughput_delta_pct']}%)")
+    for name, stats in report["tools"].items():
+        print(f"• {name}: {stats['calls']} calls, p50 {stats['recorded_p50_ms']} → {stats['replayed_p50_ms']} ms "
+              f"({stats['p50_delta_pct']}%), p95 {stats['recorded_p95_ms']} → {stats['replayed_p95_ms']} ms, "
+              f"errors {stats['errors']}")
+    for method, counts in report.get("singleFlight", {}).items():
+        print(f"🔗 {method}: {counts['executed']} executed, {counts['shared']} shared")
+    if "coalesce" in report:
+        stats = report["coalesce"]
+        print(f"🧮 coalesce ({stats['windowMs']} ms): {stats['submitted']} writes → {stats['sent']} commands")
+
+
+async def run_replay(args):
+    from unity_mcp_server import UnityMCPServer
+
+    entries = load_trace(args.trace)
+    mock = None
+    server = UnityMCPServer()
+    if args.mock:
+        mock = await MockUnityBridge(latency_ms=args.mock_latency, scene_objects=args.scene_objects,
+                                     transport=args.mock_transport).start()
+        server.unity_url = mock.url
+    else:
+        server.unity_url = args.url
+
+    await server.connect_to_unity()
+    speed = 0.0 if args.max else args.speed
+    try:
+        report = await TraceReplayer(server, speed=speed, concurrency=args.concurrency).replay(entries)
+        if server.single_flight is not None:
+            report["singleFlight"] = server.single_flight.stats()
+        if server.write_coalescer is not None:
+            await server.write_coalescer.flush()
+            report["coalesce"] = server.write_coalescer.stats()
+    finally:
+        if server.transport:
+            await server.transport.close()
+        if mock:
+            await mock.stop()
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report)
+
+
+async def run_compare_bulk(args):
+    """对比同一mock场景在inline帧与bulk文件两种方式下的传输耗时"""
+    from unity_mcp_server import UnityMCPServer
+
+    mock = await MockUnityBridge(scene_objects=args.scene_objects).start()
+    timings = {}
+    payloads = {}
+    try:
+        for mode, threshold in (("inline", 0), ("bulk", args.threshold)):
+            server = UnityMCPServer()
+            server.unity_url = mock.url
+            server.bulk_threshold = threshold
+            await server.connect_to_unity()
+
+            durations = []
+            for _ in range(args.iterations):
+                t0 = time.perf_counter()
+                result = await server.send_unity_command("unity.get_scene_info")
+                durations.append((time.perf_counter() - t0) * 1000.0)
+            timings[mode] = durations
+            payloads[mode] = result
+            await server.transport.close()
+    finally:
+        await mock.stop()
+
+    size = len(json.dumps(payloads["inline"]).encode("utf-8"))
+    same = payloads["inline"] == payloads["bulk"]
+    print(f"📦 Payload: {args.scene_objects} objects, {size / 1024 / 1024:.2f} MiB, {args.iterations} iterations")
+    for mode, durations in timings.items():
+        print(f"• {mode}: p50 {percentile(durations, 50):.2f} ms, p95 {percentile(durations, 95):.2f} ms")
+    print(("✅" if same else "❌") + " inline and bulk payloads " + ("match" if same else "differ"))
+    if not same:
+        sys.exit(1)
+
+
+async def run_compare_transports(args):
+    """对比WebSocket与长度前缀TCP两种传输层：串行往返与流水线吞吐"""
+    from unity_mcp_server import UnityMCPServer
+
+    print(f"🔌 {args.requests} requests per transport, pipelining {args.concurrency} in flight")
+    for transport in ("ws", "tcp"):
+        mock = await MockUnityBridge(scene_objects=args.scene_objects, transport=transport).start()
+        server = UnityMCPServer()
+        server.unity_url = mock.url
+        # 测量的是传输层本身，关闭single-flight合并
+        server.single_flight = None
+        await server.connect_to_unity()
+        try:
+            durations = []
+            for _ in range(args.requests):
+                t0 = time.perf_counter()
+                await server.send_unity_command("unity.get_scene_info")
+                durations.append((time.perf_counter() - t0) * 1000.0)
+
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def pipelined():
+                async with semaphore:
+                    await server.send_unity_command("unity.get_scene_info")
+
+            t0 = time.perf_counter()
+            await asyncio.gather(*(pipelined() for _ in range(args.requests)))
+            pipelined_tput = args.requests / (time.perf_counter() - t0)
+        finally:
+            await server.transport.close()
+            await mock.stop()
+
+        print(f"• {transport}: round trip p50 {percentile(durations, 50):.3f} ms, "
+              f"p95 {percentile(durations, 95):.3f} ms, pipelined {pipelined_tput:.0f} req/s")
+
+
+async def run_bench_scene_store(args):
+    """本地场景索引：拉取+建索引耗时、内存占用，以及各类查询与逐次请求编辑器的对比"""
+    import tracemalloc
+    from unity_mcp_server import UnityMCPServer
+    from unity_scene_store import SceneStore
+
+    mock = await MockUnityBridge(scene_objects=args.scene_objects).start()
+    server = UnityMCPServer()
+    server.unity_url = mock.url
+    await server.connect_to_unity()
+    try:
+        t0 = time.perf_counter()
+        await server.refresh_scene_store()
+        refresh_ms = (time.perf_counter() - t0) * 1000.0
+
+        durations = []
+        for _ in range(args.iterations):
+            t0 = time.perf_counter()
+            await server.send_unity_command("unity.select_gameobject", {"name": "Button_1"})
+            durations.append((time.perf_counter() - t0) * 1000.0)
+        round_trip = percentile(durations, 50)
+    finally:
+        await server.transport.close()
+        await mock.stop()
+
+    store = server.scene_store
+    hierarchy = build_mock_hierarchy(args.scene_objects)
+    tracemalloc.start()
+    SceneStore().load(hierarchy)
+    _, peak = tracemalloc.get_traced_memory()
+    retained = SceneStore()
+    before, _ = tracemalloc.get_traced_memory()
+    retained.load(hierarchy)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sample = store.ids[len(store) // 2]
+    sample_path = store.path_of(len(store) // 2)
+    queries = [
+        ("index_of(instanceId)", lambda: store.index_of(sample)),
+        ("name", lambda: store.query(name="Button_1")),
+        ("exact path", lambda: store.query(path=sample_path)),
+        ("glob '*/*/Button_*'", lambda: store.query(path="*/*/Button_*")),
+        ("glob '**/Label_2'", lambda: store.query(path="**/Label_2")),
+        ("component + name", lambda: store.query(component="Button", name="Button_1")),
+        ("subtree + component", lambda: store.query(subtree_of=store.path_of(1), component="Rigidbody")),
+        ("ancestors", lambda: store.query(ancestors_of=sample)),
+    ]
+
+    print(f"🌳 Scene store: {len(store)} objects, refresh {refresh_ms:.1f} ms "
+          f"(transfer + index), retained {(after - before) / 1024 / 1024:.1f} MiB, "
+          f"load peak {peak / 1024 / 1024:.1f} MiB")
+    print(f"• editor round trip (mock): p50 {round_trip:.3f} ms")
+    for label, query in queries:
+        timings = []
+        for _ in range(args.iterations):
+            t0 = time.perf_counter()
+            query()
+            timings.append((time.perf_counter() - t0) * 1000.0)
+        print(f"• {label}: p50 {percentile(timings, 50):.3f} ms, p95 {percentile(timings, 95):.3f} ms")
+
+
+async def run_bench_editor_state(args):
+    """调用进行中触发一次编译+域重载：wait 与 fail-fast 两种熔断模式下调用的结果、延迟与重连次数"""
+    from unity_mcp_editor_state import EditorStateTracker
+    from unity_mcp_server import UnityMCPServer
+
+    for mode in ("wait", "fail-fast"):
+        mock = await MockUnityBridge(latency_ms=args.mock_latency).start()
+        server = UnityMCPServer()
+        server.unity_url = mock.url
+        server.editor_state = EditorStateTracker(mode=mode)
+        await server.connect_to_unity()
+
+        calls = []
+        reload_done = asyncio.Event()
+
+        async def caller():
+            while not reload_done.is_set():
+                t0 = time.perf_counter()
+                result = await server.execute_unity_command("unity_get_scene_info", {})
+                text = result["content"][0]["text"]
+                calls.append(((time.perf_counter() - t0) * 1000.0, not text.startswith("❌"), text))
+                await asyncio.sleep(args.interval_ms / 1000.0)
+
+        async def reload():
+            await asyncio.sleep(0.1)
+            await mock.simulate_reload(args.compile_ms, args.reload_ms)
+            # 重载结束后再跑一小段，确认调用恢复正常
+            await asyncio.sleep(0.3)
+            reload_done.set()
+
+        try:
+            t0 = time.perf_counter()
+            await asyncio.gather(reload(), *(caller() for _ in range(args.callers)))
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        finally:
+            if server.transport:
+                await server.transport.close()
+            await mock.stop()
+
+        latencies = [ms for ms, _, _ in calls]
+        failed = [text for _, ok, text in calls if not ok]
+        print(f"• {mode}: {len(calls)} calls in {elapsed_ms:.0f} ms, {len(calls) - len(failed)} ok, "
+              f"{len(failed)} failed, p50 {percentile(latencies, 50):.1f} ms, max {max(latencies):.0f} ms, "
+              f"{mock.connections} bridge connections")
+        if failed:
+            print(f"    first error: {failed[0].splitlines()[0]}")
+
+
+SAMPLE_VALUES = {"string": "Sample", "integer": 3, "number": 1.5, "boolean": True, "object": {}, "array": []}
+
+
+def sample_arguments(schema: dict):
+    """Build a valid call (every property set) and, if possible, an invalid one from an inputSchema"""
+    properties = schema.get("properties", {})
+    valid = {name: SAMPLE_VALUES.get(prop.get("type"), "Sample") for name, prop in properties.items()}
+    if schema.get("required"):
+        invalid = {}
+    elif properties:
+        # 对象/数组以外的类型都无法接受一个dict
+        name = next(iter(properties))
+        invalid = {name: {"wrong": "type"}} if properties[name].get("type") not in ("object", None) else None
+    else:
+        invalid = None
+    return valid, invalid
+
+
+async def run_bench_validate(args):
+    """参数校验器的编译与单次校验开销，对比一次被拒绝调用的编辑器往返"""
+    from unity_mcp_server import UnityMCPServer
+    from unity_mcp_schema import SchemaValidationError, compile_tool_validators
+
+    server = UnityMCPServer()
+    t0 = time.perf_counter()
+    for _ in range(args.iterations):
+        compile_tool_validators(server.tools)
+    compile_us = (time.perf_counter() - t0) / args.iterations * 1e6
+    print(f"🧰 {len(server.tools)} tool schemas compiled in {compile_us:.1f} µs")
+
+    for tool in server.tools:
+        validate = server.validators[tool["name"]]
+        valid, invalid = sample_arguments(tool.get("inputSchema", {}))
+        t0 = time.perf_counter()
+        for _ in range(args.iterations):
+            validate(valid)
+        valid_us = (time.perf_counter() - t0) / args.iterations * 1e6
+
+        line = f"• {tool['name']}: valid {valid_us:.2f} µs"
+        if invalid is not None:
+            t0 = time.perf_counter()
+            for _ in range(args.iterations):
+                try:
+                    validate(invalid)
+                except SchemaValidationError:
+                    pass
+            line += f", rejected {(time.perf_counter() - t0) / args.iterations * 1e6:.2f} µs"
+        print(line)
+
+    # 没有校验时，非法参数要经过一次编辑器往返才会失败
+    mock = await MockUnityBridge(latency_ms=args.mock_latency).start()
+    server.unity_url = mock.url
+    await server.connect_to_unity()
+    try:
+        durations = []
+        for _ in range(min(args.iterations, 1000)):
+            t0 = time.perf_counter()
+            await server.send_unity_command("unity.execute_menu_item", {})
+            durations.append((time.perf_counter() - t0) * 1000.0)
+    finally:
+        await server.transport.close()
+        await mock.stop()
+    print(f"• editor round trip for a rejected call (mock, {args.mock_latency:g} ms latency): "
+          f"p50 {percentile(durations, 50):.3f} ms")
+
+
+async def run_bench_single_flight(args):
+    """同一时刻N个相同的只读请求：合并与不合并的编辑器往返次数和总耗时"""
+    from unity_mcp_server import UnityMCPServer
+    from unity_mcp_singleflight import SingleFlight
+
+    mock = await MockUnityBridge(latency_ms=args.mock_latency, scene_objects=args.scene_objects).start()
+    try:
+        for mode in ("direct", "single-flight"):
+            server = UnityMCPServer()
+            server.unity_url = mock.url
+            server.single_flight = SingleFlight() if mode == "single-flight" else None
+            await server.connect_to_unity()
+
+            t0 = time.perf_counter()
+            for _ in range(args.rounds):
+                results = await asyncio.gather(*(server.send_unity_command("unity.get_scene_info")
+                                                 for _ in range(args.callers)))
+                if not all(r.get("success") for r in results):
+                    print(f"❌ {mode}: some calls failed")
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            await server.transport.close()
+
+            if server.single_flight is None:
+                executed, shared = args.rounds * args.callers, 0
+            else:
+                counts = server.single_flight.stats()["unity.get_scene_info"]
+                executed, shared = counts["executed"], counts["shared"]
+            print(f"• {mode}: {args.rounds}×{args.callers} calls in {elapsed_ms:.1f} ms, "
+                  f"{executed} round trips, {shared} shared")
+    finally:
+        await mock.stop()
+
+
+async def run_bench_coalesce(args):
+    """多个对象各自被连续修改：逐条发送与窗口合并的命令数、总耗时，并检查后写覆盖先写"""
+    from unity_mcp_server import UnityMCPServer
+    from unity_mcp_coalesce import WriteCoalescer
+
+    mock = await MockUnityBridge(latency_ms=args.mock_latency).start()
+    try:
+        for mode in ("direct", "coalesced"):
+            server = UnityMCPServer()
+            server.unity_url = mock.url
+            await server.connect_to_unity()
+            if mode == "coalesced":
+                server.write_coalescer = WriteCoalescer(server._send_deduplicated, args.window_ms)
+            else:
+                server.write_coalescer = None
+
+            async def tweak(instance_id: int, step: int):
+                await asyncio.sleep(step * args.interval_ms / 1000.0)
+                return instance_id, step, await server.send_unity_command("update_gameobject", {
+                    "instanceId": instance_id,
+                    "gameObjectData": {"name": f"Object{instance_id}_{step}", "layer": step % 32}
+                })
+
+            # 窗口中同时等待发送的对象数（每个对象一个合并后的修改）
+            peak_pending = 0
+
+            async def sample_pending():
+                nonlocal peak_pending
+                while True:
+                    peak_pending = max(peak_pending, server.write_coalescer.pending)
+                    await asyncio.sleep(0.001)
+
+            sampler = asyncio.ensure_future(sample_pending()) if server.write_coalescer else None
+            requests_before = mock.requests
+            t0 = time.perf_counter()
+            results = await asyncio.gather(*(tweak(2000 + i, step)
+                                             for step in range(args.tweaks) for i in range(args.objects)))
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            commands = mock.requests - requests_before
+            if sampler:
+                sampler.cancel()
+            await server.transport.close()
+
+            failed = sum(1 for _, _, r in results if not r.get("success"))
+            # 每个对象最后一次修改拿到的结果必须反映这次写入
+            last = args.tweaks - 1
+            last_wins = all(r.get("data", {}).get("name") == f"Object{instance_id}_{last}"
+                            for instance_id, step, r in results if step == last)
+            print(f"• {mode}: {len(results)} writes → {commands} commands in {elapsed_ms:.1f} ms, {failed} failed, "
+                  + ("last write wins" if last_wins else "❌ last write lost")
+                  + (f", peak {peak_pending} objects pending" if sampler else ""))
+    finally:
+        await mock.stop()
+
+
+async def run_bench_profile(args):
+    """剖析关闭、未命中采样、全量剖析三种情况下单次工具调用的耗时"""
+    from unity_mcp_server import UnityMCPServer
+    from unity_mcp_profile import ToolProfiler
+
+    mock = await MockUnityBridge(scene_objects=args.scene_objects).start()
+    server = UnityMCPServer()
+    server.unity_url = mock.url
+    server.single_flight = None
+    await server.connect_to_unity()
+    output_dir = Path(args.output or tempfile.mkdtemp(prefix="unity-mcp-profile-"))
+    modes = (
+        ("disabled", None, args.iterations),
+        ("not sampled", ToolProfiler(str(output_dir), sample_rate=0.0), args.iterations),
+        ("phases only", ToolProfiler(str(output_dir), cpu=False, memory=False), args.iterations),
+        ("cpu + memory", ToolProfiler(str(output_dir)), min(args.iterations, 50)),
+    )
+    try:
+        for mode, profiler, iterations in modes:
+            server.profiler = profiler
+            durations = []
+            for _ in range(iterations):
+                t0 = time.perf_counter()
+                await server.execute_unity_command("unity_get_scene_info", {})
+                durations.append((time.perf_counter() - t0) * 1000.0)
+            print(f"• {mode}: p50 {percentile(durations, 50):.3f} ms, p95 {percentile(durations, 95):.3f} ms "
+                  f"({iterations} calls)")
+    finally:
+        await server.transport.close()
+        await mock.stop()
+    print(f"📁 Profiles written to {output_dir}")
+
+
+async def run_bench_logs(args):
+    """日志风暴：逐条传输/渲染与指纹折叠后的响应大小、文本长度，以及折叠的开销"""
+    from unity_mcp_server import UnityMCPServer
+
+    mock = await MockUnityBridge(log_messages=args.messages).start()
+
+    def without_stack(logs):
+        return [{k: v for k, v in log.items() if k != "stackTrace"} for log in logs]
+
+    raw_bytes = len(json.dumps(without_stack(mock.raw_logs)).encode("utf-8"))
+    raw_text = sum(len(f"• {log['message']}\n") for log in mock.raw_logs)
+    collapsed_bytes = len(json.dumps(without_stack(mock.logs)).encode("utf-8"))
+    print(f"📜 {len(mock.raw_logs)} messages → {len(mock.logs)} collapsed entries")
+    print(f"• payload: {raw_bytes / 1024:.1f} KiB per-message → {collapsed_bytes / 1024:.1f} KiB collapsed "
+          f"({raw_bytes / max(collapsed_bytes, 1):.0f}x)")
+
+    t0 = time.perf_counter()
+    for _ in range(args.iterations):
+        collapse_logs(mock.raw_logs)
+    collapse_us = (time.perf_counter() - t0) / (args.iterations * len(mock.raw_logs)) * 1e6
+
+    print(f"• fingerprinting: collapse {collapse_us:.2f} µs/message")
+
+    server = UnityMCPServer()
+    server.unity_url = mock.url
+    await server.connect_to_unity()
+    try:
+        result = await server.execute_unity_command("unity_get_console_logs", {"limit": len(mock.raw_logs)})
+        text = result["content"][0]["text"]
+        print(f"• rendered text: {raw_text / 1024:.1f} KiB per-message → {len(text.encode('utf-8')) / 1024:.1f} KiB")
+        result = await server.execute_unity_command("unity_get_log_fingerprints", {"limit": 5})
+        print(result["content"][0]["text"])
+    finally:
+        await server.transport.close()
+        await mock.stop()
+
+
+async def run_bench_progress(args):
+    """编辑器编译中收到一次大场景拉取：客户端多久收到第一条反馈、最长静默多久"""
+    from unity_mcp_server import UnityMCPServer
+    from unity_mcp_progress import track_progress
+
+    mock = await MockUnityBridge(latency_ms=args.mock_latency, scene_objects=args.scene_objects).start()
+    server = UnityMCPServer()
+    server.unity_url = mock.url
+    await server.connect_to_unity()
+    try:
+        for mode in ("no progress", "progress"):
+            server.scene_store_stale = True
+            notifications = []
+
+            async def send(progress, total, message):
+                notifications.append(((time.perf_counter() - t0) * 1000.0, progress, message))
+
+            await mock.push_status("compiling", int(args.compile_ms))
+            await asyncio.sleep(0.05)
+            t0 = time.perf_counter()
+            asyncio.get_running_loop().call_later(
+                args.compile_ms / 1000.0, lambda: asyncio.ensure_future(mock.push_status("ready")))
+            async with track_progress("bench" if mode == "progress" else None, send, keepalive=args.keepalive):
+                result = await server.execute_unity_command("unity_query_scene", {"refresh": True, "limit": 1})
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            if result["content"][0]["text"].startswith("❌"):
+                print(f"❌ {mode}: {result['content'][0]['text']}")
+
+            times = [0.0] + [at for at, _, _ in notifications] + [elapsed_ms]
+            first = notifications[0][0] if notifications else elapsed_ms
+            gap = max(b - a for a, b in zip(times, times[1:]))
+            print(f"• {mode}: {elapsed_ms:.0f} ms total, first feedback at {first:.0f} ms, "
+                  f"longest silence {gap:.0f} ms, {len(notifications)} notifications")
+            for at, progress, message in notifications if args.verbose else []:
+                print(f"    {at:7.0f} ms  {progress:<8g} {message}")
+    finally:
+        await server.transport.close()
+        await mock.stop()
+
+
+async def run_mock_bridge(args):
+    mock = await MockUnityBridge(host=args.host, port=args.port, latency_ms=args.mock_latency,
+                                 scene_objects=args.scene_objects, transport=args.transport).start()
+    try:
+        await asyncio.Future()
+    finally:
+        await mock.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unity MCP trace replay and benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    replay = sub.add_parser("replay", help="回放JSONL trace")
+    replay.set_defaults(run=run_replay)
+    replay.add_argument("trace")
+    replay.add_argument("--speed", type=float, default=1.0, help="回放倍速，1为原始速度")
+    replay.add_argument("--max", action="store_true", help="忽略原始节奏，以最大并发回放")
+    replay.add_argument("--concurrency", type=int, default=64)
+    replay.add_argument("--url", default="ws://localhost:8765", help="Bridge地址，ws:// 或 tcp://")
+    replay.add_argument("--mock", action="store_true", help="使用内置mock bridge")
+    replay.add_argument("--mock-transport", choices=["ws", "tcp"], default="ws")
+    replay.add_argument("--mock-latency", type=float, default=0.0, help="mock bridge每次响应延迟(ms)")
+    replay.add_argument("--scene-objects", type=int, default=10)
+    replay.add_argument("--json", action="store_true", help="以JSON输出报告")
+
+    mock = sub.add_parser("mock-bridge", help="启动mock Unity bridge")
+    mock.set_defaults(run=run_mock_bridge)
+    mock.add_argument("--host", default="localhost")
+    mock.add_argument("--port", type=int, default=8765)
+    mock.add_argument("--transport", choices=["ws", "tcp"], default="ws")
+    mock.add_argument("--mock-latency", type=float, default=0.0)
+    mock.add_argument("--scene-objects", type=int, default=10)
+
+    compare = sub.add_parser("compare-bulk", help="对比inline帧与bulk文件传输")
+    compare.set_defaults(run=run_compare_bulk)
+    compare.add_argument("--scene-objects", type=int, default=50000)
+    compare.add_argument("--iterations", type=int, default=10)
+    compare.add_argument("--threshold", type=int, default=1024 * 1024)
+
+    transports = sub.add_parser("compare-transports", help="对比WebSocket与TCP传输层")
+    transports.set_defaults(run=run_compare_transports)
+    transports.add_argument("--requests", type=int, default=2000)
+    transports.add_argument("--concurrency", type=int, default=16)
+    transports.add_argument("--scene-objects", type=int, default=10)
+
+    scene = sub.add_parser("bench-scene-store", help="本地场景索引的建索引与查询基准")
+    scene.set_defaults(run=run_bench_scene_store)
+    scene.add_argument("--scene-objects", type=int, default=100000)
+    scene.add_argument("--iterations", type=int, default=200)
+
+    editor_state = sub.add_parser("bench-editor-state", help="调用进行中触发编译与域重载：wait / fail-fast 熔断的表现")
+    editor_state.set_defaults(run=run_bench_editor_state)
+    editor_state.add_argument("--compile-ms", type=float, default=800.0)
+    editor_state.add_argument("--reload-ms", type=float, default=600.0)
+    editor_state.add_argument("--callers", type=int, default=4)
+    editor_state.add_argument("--interval-ms", type=float, default=50.0, help="每个调用方两次调用之间的间隔")
+    editor_state.add_argument("--mock-latency", type=float, default=1.0)
+
+    validate = sub.add_parser("bench-validate", help="工具参数校验器的开销")
+    validate.set_defaults(run=run_bench_validate)
+    validate.add_argument("--iterations", type=int, default=20000)
+    validate.add_argument("--mock-latency", type=float, default=0.0)
+
+    flight = sub.add_parser("bench-singleflight", help="并发相同只读请求的合并效果")
+    flight.set_defaults(run=run_bench_single_flight)
+    flight.add_argument("--callers", type=int, default=32, help="每轮同时发起的相同请求数")
+    flight.add_argument("--rounds", type=int, default=50)
+    flight.add_argument("--mock-latency", type=float, default=5.0)
+    flight.add_argument("--scene-objects", type=int, default=2000)
+
+    coalesce = sub.add_parser("bench-coalesce", help="同一对象连续修改的合并效果")
+    coalesce.set_defaults(run=run_bench_coalesce)
+    coalesce.add_argument("--objects", type=int, default=20)
+    coalesce.add_argument("--tweaks", type=int, default=10, help="每个对象的修改次数")
+    coalesce.add_argument("--interval-ms", type=float, default=1.0, help="同一对象两次修改的间隔")
+    coalesce.add_argument("--window-ms", type=float, default=20.0)
+    coalesce.add_argument("--mock-latency", type=float, default=1.0)
+
+    profile = sub.add_parser("bench-profile", help="剖析钩子在关闭/采样/开启时的开销")
+    profile.set_defaults(run=run_bench_profile)
+    profile.add_argument("--iterations", type=int, default=2000)
+    profile.add_argument("--scene-objects", type=int, default=200)
+    profile.add_argument("--output", help="剖析结果目录，默认临时目录")
+
+    logs = sub.add_parser("bench-logs", help="日志风暴下指纹折叠的效果与开销")
+    logs.set_defaults(run=run_bench_logs)
+    logs.add_argument("--messages", type=int, default=20000)
+    logs.add_argument("--iterations", type=int, default=5)
+
+    progress = sub.add_parser("bench-progress", help="长时间调用的进度通知与保活")
+    progress.set_defaults(run=run_bench_progress)
+    progress.add_argument("--compile-ms", type=float, default=1500.0, help="调用前编辑器处于编译状态的时长")
+    progress.add_argument("--mock-latency", type=float, default=1500.0, help="场景拉取在编辑器内的耗时")
+    progress.add_argument("--scene-objects", type=int, default=20000)
+    progress.add_argument("--keepalive", type=float, default=0.5, help="保活间隔（秒）")
+    progress.add_argument("--verbose", action="store_true", help="打印每条通知")
+
+    args = parser.parse_args()
+    try:
+        asyncio.run(args.run(args))
+    except KeyboardInterrupt:
+        # mock-bridge 一直运行到Ctrl+C
+        pass
+
+
+if __name__ == "__main__":
+    main()
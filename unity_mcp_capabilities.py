@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Capabilities - Bridge能力清单与本地缓存
+Caches the bridge's tool manifest on disk, keyed by its hash, and turns it into MCP tools
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("UNITY_MCP_CACHE_DIR", Path.home() / ".cache" / "unity-mcp"))
+
+
+def tool_name_for(method: str) -> str:
+    """Bridge方法名 -> MCP工具名：unity.create_gameobject / add_component -> unity_create_gameobject / unity_add_component"""
+    if method.startswith("unity."):
+        method = method[len("unity."):]
+    return "unity_" + method.replace(".", "_")
+
+
+class CapabilityCache:
+    """
+    能力清单缓存：<dir>/capabilities/<hash>.json 存清单，index.json 记录每个bridge地址最近的hash
+
+    Startup reads the manifest for the bridge URL without contacting the editor; the
+    server revalidates with knownHash after it connects.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or default_cache_dir()) / "capabilities"
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / "index.json"
+
+    def _read_json(self, path: Path) -> Optional[dict]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_json(self, path: Path, data: dict):
+        # 先写临时文件再原子替换，多个server进程同时写也不会读到半个文件
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(self.directory), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def load(self, bridge_url: str) -> Optional[dict]:
+        """该bridge最近一次的清单，没有缓存时返回None"""
+        index = self._read_json(self.index_path) or {}
+        manifest_hash = index.get(bridge_url)
+        if not manifest_hash:
+            return None
+        manifest = self._read_json(self.directory / f"{manifest_hash}.json")
+        if not manifest or manifest.get("hash") != manifest_hash:
+            return None
+        return manifest
+
+    def save(self, bridge_url: str, manifest: dict):
+        manifest_hash = manifest["hash"]
+        manifest_path = self.directory / f"{manifest_hash}.json"
+        if not manifest_path.exists():
+            self._write_json(manifest_path, manifest)
+        index = self._read_json(self.index_path) or {}
+        if index.get(bridge_url) != manifest_hash:
+            index[bridge_url] = manifest_hash
+            self._write_json(self.index_path, index)
+
+
+def build_manifest_tools(manifest: dict, existing: Set[str]) -> Tuple[List[dict], Dict[str, str], Set[str]]:
+    """
+    清单 -> (MCP工具列表, 工具名到bridge方法的路由, 只读方法集合)
+
+    Tools whose name is already taken by a hand-written tool are skipped, so the
+    specialised formatting of the built-in tools keeps working.
+    """
+    tools, routes, read_only = [], {}, set()
+    for entry in manifest.get("tools", []):
+        method = entry.get("name")
+        if not method:
+            continue
+        name = tool_name_for(method)
+        if name in existing or name in routes:
+            continue
+        tools.append({
+            "name": name,
+            "description": entry.get("description", method),
+            "inputSchema": entry.get("inputSchema") or {"type": "object", "properties": {}}
+        })
+        routes[name] = method
+        if entry.get("readOnly"):
+            read_only.add(method)
+    return tools, routes, read_only
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Write Coalescing - 同一对象的连续修改合并
+Mutations of the same object that arrive within a short window are merged and sent as one command
+"""
+
+import asyncio
+import copy
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# update_gameobject 不带 gameObjectData 时，bridge直接从顶层读取这些字段
+GAMEOBJECT_FIELDS = ("name", "tag", "layer", "isActiveSelf", "isStatic")
+
+
+def merge_params(target: dict, update: dict):
+    """逐字段合并，后写覆盖先写；嵌套对象（gameObjectData、position、componentData）按字段合并"""
+    for name, value in update.items():
+        if isinstance(value, dict) and isinstance(target.get(name), dict):
+            merge_params(target[name], value)
+        else:
+            target[name] = copy.deepcopy(value)
+
+
+def _normalize_update_gameobject(params: dict) -> dict:
+    params = copy.deepcopy(params)
+    if not isinstance(params.get("gameObjectData"), dict):
+        # 顶层字段写法统一成 gameObjectData，否则和嵌套写法合并时会被bridge忽略
+        params["gameObjectData"] = {name: params.pop(name) for name in GAMEOBJECT_FIELDS if name in params}
+    return params
+
+
+class _PendingWrite:
+    __slots__ = ("method", "params", "waiters")
+
+    def __init__(self, method: str, params: dict):
+        self.method = method
+        self.params = params
+        self.waiters: List[asyncio.Future] = []
+
+
+class WriteCoalescer:
+    """
+    合并窗口：窗口内针对同一对象（instanceId）的修改合并为一条命令
+
+    The window opens with the first pending write and is not extended by later ones,
+    so no write waits longer than window_ms before it is sent. Merged commands are
+    sent in the order their first write arrived; every caller receives the result
+    of the merged command its write went into. Any other command is a barrier and
+    calls flush() first, so reads and non-mergeable writes observe earlier writes.
+    """
+
+    def __init__(self, send: Callable[[str, dict], Awaitable[dict]], window_ms: float):
+        self._send = send
+        self.window = window_ms / 1000.0
+        self._pending: Dict[tuple, _PendingWrite] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self.submitted = 0
+        self.sent = 0
+
+    @classmethod
+    def from_env(cls, send: Callable[[str, dict], Awaitable[dict]]) -> Optional["WriteCoalescer"]:
+        """UNITY_MCP_COALESCE_MS > 0 时启用，默认关闭"""
+        window_ms = float(os.environ.get("UNITY_MCP_COALESCE_MS", 0) or 0)
+        return cls(send, window_ms) if window_ms > 0 else None
+
+    def key_for(self, method: str, params: Optional[dict]) -> Optional[tuple]:
+        """可合并的写操作返回合并key，否则返回None"""
+        if not params or params.get("instanceId") is None:
+            return None
+        if method == "update_gameobject":
+            return method, params["instanceId"]
+        if method == "update_component" and params.get("componentName"):
+            return method, params["instanceId"], params["componentName"]
+        return None
+
+    async def submit(self, key: tuple, method: str, params: dict) -> dict:
+        if method == "update_gameobject":
+            params = _normalize_update_gameobject(params)
+        entry = self._pending.get(key)
+        if entry is None:
+            self._pending[key] = entry = _PendingWrite(method, copy.deepcopy(params))
+        else:
+            merge_params(entry.params, params)
+        self.submitted += 1
+
+        loop = asyncio.get_event_loop()
+        waiter = loop.create_future()
+        entry.waiters.append(waiter)
+        if self._timer is None:
+            self._timer = loop.call_later(self.window, self._on_window_closed)
+        return await waiter
+
+    def _on_window_closed(self):
+        self._timer = None
+        asyncio.ensure_future(self.flush())
+
+    async def flush(self):
+        """立即发送窗口内的写入，并等待此前已开始发送的批次完成"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            batch = list(self._pending.values())
+            self._pending = {}
+            self._inflight = asyncio.ensure_future(self._send_batch(batch, self._inflight))
+        if self._inflight is not None:
+            await asyncio.shield(self._inflight)
+
+    async def _send_batch(self, batch: List[_PendingWrite], previous: Optional[asyncio.Future]):
+        # 批次之间保持先后顺序
+        if previous is not None:
+            await previous
+        self.sent += len(batch)
+        # 一次性按到达顺序发出，bridge在主线程上按接收顺序执行
+        results = await asyncio.gather(*(self._send(entry.method, entry.params) for entry in batch),
+                                       return_exceptions=True)
+        for entry, result in zip(batch, results):
+            for waiter in entry.waiters:
+                if waiter.done():
+                    continue
+                if isinstance(result, BaseException):
+                    waiter.set_exception(result)
+                else:
+                    waiter.set_result(result)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "windowMs": round(self.window * 1000.0, 3),
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "merged": self.submitted - self.sent - sum(len(e.waiters) for e in self._pending.values())
+        }
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Editor State - 编辑器忙碌状态跟踪与熔断
+Tracks ready/compiling/reloading/playmode from bridge status pushes and gates requests
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Optional
+
+READY = "ready"
+COMPILING = "compiling"
+RELOADING = "reloading"
+PLAYMODE = "playmode"
+DISCONNECTED = "disconnected"
+
+BUSY_STATES = (COMPILING, RELOADING, PLAYMODE)
+
+# 没有bridge估计值时的默认重试提示(ms)
+DEFAULT_RETRY_AFTER_MS = {
+    COMPILING: 5000,
+    RELOADING: 3000,
+    PLAYMODE: 2000,
+}
+
+FAIL_FAST = "fail-fast"
+WAIT = "wait"
+
+# Bridge在整个Play模式期间停止（见 UnityMCPAutoStarter），wait 模式只等待进出Play模式的切换这么久
+PLAYMODE_MAX_WAIT = 3.0
+
+
+class EditorStateTracker:
+    """
+    编辑器状态熔断器
+
+    fail-fast: 编辑器忙碌时立即返回错误和 retryAfterMs
+    wait:      挂起请求直到编辑器就绪，最多等待 max_wait 秒
+    编译/重载期间连接断开时，重连按指数退避，避免重连风暴。
+    """
+
+    def __init__(self, mode: Optional[str] = None, max_wait: Optional[float] = None):
+        self.mode = mode or os.environ.get("UNITY_MCP_BUSY_MODE", WAIT)
+        if self.mode not in (FAIL_FAST, WAIT):
+            # 调优用的环境变量写错不应让服务器无法启动
+            print(f"⚠️  Unknown UNITY_MCP_BUSY_MODE '{self.mode}', using '{WAIT}'", file=sys.stderr)
+            self.mode = WAIT
+        if max_wait is None:
+            try:
+                max_wait = float(os.environ.get("UNITY_MCP_BUSY_MAX_WAIT", 30))
+            except ValueError:
+                print("⚠️  Invalid UNITY_MCP_BUSY_MAX_WAIT, using 30", file=sys.stderr)
+                max_wait = 30.0
+        self.max_wait = max_wait
+
+        self.state = DISCONNECTED
+        self.since = time.monotonic()
+        self.retry_after_ms = 0
+        self._ready = asyncio.Event()
+
+        self.min_backoff = 0.25
+        self.max_backoff = 2.0
+        self._backoff = 0.0
+        self._next_attempt = 0.0
+
+    @property
+    def busy(self) -> bool:
+        return self.state in BUSY_STATES
+
+    def set_state(self, state: str, retry_after_ms: Optional[int] = None):
+        if state != self.state:
+            self.state = state
+            self.since = time.monotonic()
+        self.retry_after_ms = retry_after_ms if retry_after_ms is not None else DEFAULT_RETRY_AFTER_MS.get(state, 0)
+        if state == READY:
+            self._ready.set()
+            self._backoff = 0.0
+            self._next_attempt = 0.0
+        else:
+            self._ready.clear()
+
+    def on_status(self, message: dict):
+        """Bridge推送的状态帧：{"type": "status", "state": ..., "retryAfterMs": ...}"""
+        if message.get("type") == "status" and message.get("state"):
+            self.set_state(message["state"], message.get("retryAfterMs"))
+
+    def on_connected(self):
+        # 新连接上bridge会立刻推送当前状态；在此之前按就绪处理
+        if self.state != READY:
+            self.set_state(READY)
+
+    def on_disconnected(self):
+        # 编译完成后紧接着就是域重载，bridge会在重载期间断开
+        if self.state in (COMPILING, RELOADING):
+            self.set_state(RELOADING)
+        elif self.state != PLAYMODE:
+            self.set_state(DISCONNECTED)
+
+    def retry_after(self) -> int:
+        """剩余的预计忙碌时间(ms)"""
+        elapsed_ms = (time.monotonic() - self.since) * 1000.0
+        return max(500, int(self.retry_after_ms - elapsed_ms))
+
+    def wait_limit(self) -> float:
+        """wait 模式在当前状态下最多等待的秒数；Play模式只覆盖切换过程"""
+        if self.state == PLAYMODE:
+            return min(self.max_wait, PLAYMODE_MAX_WAIT)
+        return self.max_wait
+
+    def busy_error(self) -> dict:
+        retry_after_ms = self.retry_after()
+        if self.state == PLAYMODE:
+            error = "Unity Editor is in play mode; the MCP bridge is stopped until play mode exits"
+        else:
+            error = f"Unity Editor is {self.state}, retry after {retry_after_ms} ms"
+        return {
+            "success": False,
+            "error": error,
+            "editorState": self.state,
+            "retryAfterMs": retry_after_ms
+        }
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """等待状态变为就绪，超时返回False"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    # ========== 重连退避 ==========
+
+    def reconnect_delay(self) -> float:
+        """距离下一次允许重连的秒数"""
+        return max(0.0, self._next_attempt - time.monotonic())
+
+    def connect_failed(self):
+        if not self.busy:
+            return
+        self._backoff = min(self.max_backoff, max(self.min_backoff, self._backoff * 2))
+        self._next_attempt = time.monotonic() + self._backoff
+
+    def describe(self) -> dict:
+        return {
+            "state": self.state,
+            "busy": self.busy,
+            "forSeconds": round(time.monotonic() - self.since, 2),
+            "retryAfterMs": self.retry_after() if self.busy else 0,
+            "mode": self.mode,
+            "maxWait": self.max_wait
+        }
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Mock Bridge - 离线测试与基准用的模拟Unity Bridge
+Answers the bridge protocol with canned results, synthetic hierarchies and log storms
+"""
+
+import asyncio
+import hashlib
+import json
+import sys
+import tempfile
+import uuid
+import websockets
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from unity_log_fingerprint import collapse_logs, fingerprint
+from unity_mcp_transport import FRAME_HEADER
+
+
+class MockUnityBridge:
+    """模拟Unity Bridge，按bridge协议返回固定结果，用于离线回放"""
+
+    def __init__(self, host: str = "localhost", port: int = 0,
+                 latency_ms: float = 0.0, scene_objects: int = 10, transport: str = "ws",
+                 log_messages: int = 200):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.scene_objects = scene_objects
+        self.transport = transport
+        self.requests = 0
+        self.connections = 0
+        self._server = None
+        self._hierarchy = None
+        self._clients = set()
+        self.state = "ready"
+        self.capabilities = mock_capabilities(MOCK_CAPABILITY_TOOLS)
+
+        # 与ConsoleLogsService一致：捕获时折叠重复日志，并按指纹精确计数
+        self.raw_logs = build_mock_logs(log_messages)
+        self.logs = collapse_logs(self.raw_logs)
+        self.fingerprints = count_fingerprints(self.raw_logs)
+
+    @property
+    def url(self) -> str:
+        return f"{self.transport}://{self.host}:{self.port}"
+
+    async def start(self):
+        if self.transport == "tcp":
+            self._server = await asyncio.start_server(self._handle_tcp, self.host, self.port)
+        else:
+            self._server = await websockets.serve(self._handle, self.host, self.port, max_size=None)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"🧪 Mock Unity bridge listening on {self.url}", file=sys.stderr)
+        return self
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, websocket, path=None):
+        self.connections += 1
+        self._clients.add(websocket)
+        try:
+            # 与UnityMCPBridge一致：连接建立后立即推送当前编辑器状态
+            await websocket.send(json.dumps({"type": "status", "state": self.state}))
+            async for raw in websocket:
+                await websocket.send(await self._respond(raw))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self._clients.discard(websocket)
+
+    async def push_status(self, state: str, retry_after_ms: Optional[int] = None):
+        """Broadcast an editor status frame to WebSocket clients"""
+        self.state = state
+        frame = {"type": "status", "state": state}
+        if retry_after_ms is not None:
+            frame["retryAfterMs"] = retry_after_ms
+        for websocket in list(self._clients):
+            try:
+                await websocket.send(json.dumps(frame))
+            except websockets.exceptions.ConnectionClosed:
+                pass
+
+    async def simulate_reload(self, compile_ms: float, reload_ms: float):
+        """编译 -> 域重载（bridge停止后在同一端口重启），模拟生成.cs文件后的编辑器行为"""
+        await self.push_status("compiling", int(compile_ms + reload_ms))
+        await asyncio.sleep(compile_ms / 1000.0)
+        await self.push_status("reloading", int(reload_ms))
+        for websocket in list(self._clients):
+            await websocket.close()
+        await self.stop()
+        await asyncio.sleep(reload_ms / 1000.0)
+        self.state = "ready"
+        await self.start()
+
+    async def _handle_tcp(self, reader, writer):
+        """Length-prefixed frames, answered in order like SimpleUnityMCP"""
+        self.connections += 1
+        try:
+            while True:
+                (length,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+                response = (await self._respond(await reader.readexactly(length))).encode("utf-8")
+                writer.write(FRAME_HEADER.pack(len(response)) + response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, raw) -> str:
+        message = json.loads(raw)
+        self.requests += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000.0)
+        response = json.dumps({
+            "id": message.get("id"),
+            "result": self.build_result(message.get("method"), message.get("params") or {})
+        })
+        threshold = (message.get("bulk") or {}).get("threshold", 0)
+        if threshold and len(response) >= threshold:
+            response = self.write_bulk(message.get("id"), response)
+        return response
+
+    def write_bulk(self, request_id, response: str) -> str:
+        """Mirror BulkTransferService: write the payload to a temp file and return a handle"""
+        from unity_mcp_server import BULK_FILE_PREFIX
+
+        data = response.encode("utf-8")
+        bulk_dir = Path(tempfile.gettempdir()) / "UnityMCP" / "bulk"
+        bulk_dir.mkdir(parents=True, exist_ok=True)
+        path = bulk_dir / f"{BULK_FILE_PREFIX}{uuid.uuid4().hex}.json"
+        path.write_bytes(data)
+        return json.dumps({"id": request_id, "bulk": {"path": str(path), "size": len(data), "encoding": "utf-8"}})
+
+    def build_result(self, method: str, params: dict) -> dict:
+        """Canned bridge results, shaped like UnityMCPBridge responses"""
+        if method == "unity.create_scene":
+            return {"success": True, "sceneName": params.get("sceneName", "NewScene"), "scenePath": ""}
+        if method == "unity.create_gameobject":
+            return {"success": True, "objectName": params.get("name", "GameObject"), "instanceId": 1000 + self.requests}
+        if method == "unity.create_ui_canvas":
+            return {"success": True, "canvasName": "Canvas", "instanceId": 1000 + self.requests}
+        if method == "unity.get_scene_info":
+            return {
+                "success": True,
+                "sceneName": "MockScene",
+                "scenePath": "Assets/Scenes/MockScene.unity",
+                "isLoaded": True,
+                "isDirty": False,
+                "gameObjects": [
+                    {"name": f"GameObject_{i}", "instanceId": 2000 + i, "activeInHierarchy": True, "tag": "Untagged", "layer": 0}
+                    for i in range(self.scene_objects)
+                ]
+            }
+        if method == "unity.get_capabilities":
+            if params.get("knownHash") == self.capabilities["hash"]:
+                return {"success": True, "version": 1, "hash": self.capabilities["hash"], "unchanged": True}
+            return self.capabilities
+        if method == "get_gameobject":
+            return {"success": True, "type": "text", "message": "GameObject found",
+                    "data": {"name": params.get("name", "GameObject"), "instanceId": 2000}}
+        if method == "update_gameobject":
+            instance_id = params.get("instanceId", 2000)
+            data = dict(params.get("gameObjectData") or {})
+            data.setdefault("name", f"GameObject_{instance_id}")
+            data["instanceId"] = instance_id
+            return {"success": True, "type": "text",
+                    "message": f"GameObject '{data['name']}' (identified by instance ID {instance_id}) updated successfully.",
+                    "data": data}
+        if method == "unity.get_scene_hierarchy":
+            if self._hierarchy is None:
+                self._hierarchy = build_mock_hierarchy(self.scene_objects)
+            return self._hierarchy
+        if method == "unity.select_gameobject":
+            return {"success": True, "objectName": params.get("name", "")}
+        if method == "unity.import_assets":
+            paths = params.get("paths", [])
+            return {"success": True, "message": f"Imported {len(paths)} assets",
+                    "data": {"imported": paths, "folders": [], "skipped": [], "durationMs": 0}}
+        if method == "unity.execute_menu_item":
+            return {"success": True, "menuPath": params.get("menuPath", "")}
+        if method == "get_console_logs":
+            log_type = params.get("logType", "")
+            logs = [log for log in self.logs if not log_type or log["type"].lower() == log_type.lower()]
+            offset, limit = params.get("offset", 0), params.get("limit", 50)
+            page = [dict(log) for log in logs[offset:offset + limit]]
+            if not params.get("includeStackTrace", True):
+                for log in page:
+                    log.pop("stackTrace", None)
+            return {"success": True, "message": "Retrieved console logs successfully",
+                    "data": {"logs": page, "totalCount": len(self.logs), "totalMessages": len(self.raw_logs),
+                             "filteredCount": len(logs), "returnedCount": len(page), "success": True}}
+        if method == "get_log_fingerprints":
+            log_type = params.get("logType")
+            entries = [e for e in self.fingerprints
+                       if not log_type or log_type.lower() == "all" or e["type"].lower() == log_type.lower()]
+            fingerprints = [dict(e) for e in entries[:params.get("limit", 20)]]
+            return {"success": True, "message": f"Top {len(fingerprints)} fingerprints",
+                    "data": {"fingerprints": fingerprints, "tracked": len(self.fingerprints),
+                             "capacity": MOCK_INDEX_CAPACITY, "totalMessages": len(self.raw_logs)}}
+        return {"success": True, "message": f"Mock handled {method}"}
+
+
+# mock日志风暴：(类型, 消息格式, 来源栈帧, 权重)
+MOCK_LOG_KINDS = [
+    ("Warning", "Enemy_{i} velocity {v:.2f} exceeds limit {limit}",
+     "EnemyAI:Update () (at Assets/Scripts/EnemyAI.cs:42)", 60),
+    ("Log", "Frame {frame}: pooled {n} projectiles",
+     "ProjectilePool:LateUpdate () (at Assets/Scripts/ProjectilePool.cs:88)", 30),
+    ("Error", "NullReferenceException: Object reference not set to an instance of an object (target 0x{addr:x})",
+     "HealthBar:Refresh () (at Assets/Scripts/UI/HealthBar.cs:17)", 8),
+    ("Log", "Spawned wave {n}",
+     "WaveSpawner:Spawn () (at Assets/Scripts/WaveSpawner.cs:31)", 2),
+]
+
+
+def build_mock_logs(count: int) -> List[dict]:
+    """Play模式下的日志风暴（每帧重复的警告为主），按bridge顺序最新在前"""
+    weights = [kind[3] for kind in MOCK_LOG_KINDS]
+    total_weight = sum(weights)
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    logs = []
+    for frame in range(count):
+        # 确定性地按权重轮转日志类型
+        slot = (frame * 37) % total_weight
+        for kind in MOCK_LOG_KINDS:
+            if slot < kind[3]:
+                break
+            slot -= kind[3]
+        log_type, fmt, source, _ = kind
+        message = fmt.format(i=frame % 12, v=10 + (frame % 97) / 7, limit=10, frame=frame,
+                             n=frame % 50, addr=0x7f000000 + frame * 16)
+        logs.append({
+            "message": message,
+            "type": log_type,
+            "timestamp": (start + timedelta(milliseconds=frame * 16)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+            "stackTrace": f"UnityEngine.Debug:Log{'' if log_type == 'Log' else log_type} (object)\n{source}\n"
+        })
+    logs.reverse()
+    return logs
+
+
+# 高频指纹索引由Bridge（LogFingerprint.cs的FingerprintIndex）维护；mock只按同样的响应格式返回精确计数
+MOCK_INDEX_CAPACITY = 256
+
+
+def count_fingerprints(logs: List[dict]) -> List[dict]:
+    """按指纹精确计数（logs最新在前），返回与 get_log_fingerprints 相同字段、按次数降序的列表"""
+    entries: Dict[str, dict] = {}
+    for log in reversed(logs):
+        key, template, frame = fingerprint(log["message"], log["stackTrace"], log["type"])
+        entry = entries.get(key)
+        if entry is None:
+            entry = entries[key] = {
+                "fingerprint": key, "template": template, "topFrame": frame, "type": log["type"],
+                "count": 0, "error": 0, "sample": log["message"],
+                "firstTimestamp": log["timestamp"], "lastTimestamp": log["timestamp"],
+            }
+        entry["count"] += 1
+        entry["lastTimestamp"] = log["timestamp"]
+    return sorted(entries.values(), key=lambda e: e["count"], reverse=True)
+
+
+# mock层级的节点类型：(名称前缀, 组件)
+MOCK_NODE_KINDS = [
+    ("Panel", ["Transform", "RectTransform", "Image"]),
+    ("Button", ["Transform", "RectTransform", "Image", "Button"]),
+    ("Label", ["Transform", "RectTransform", "Text"]),
+    ("Enemy", ["Transform", "MeshRenderer", "BoxCollider", "Rigidbody"]),
+    ("Prop", ["Transform", "MeshRenderer", "MeshFilter"]),
+    ("Group", ["Transform"]),
+]
+
+
+def build_mock_hierarchy(count: int, fanout: int = 8) -> dict:
+    """Synthetic columnar hierarchy in preorder, shaped like unity.get_scene_hierarchy"""
+    type_names: List[str] = []
+    type_lookup: Dict[str, int] = {}
+    ids, names, parents, active = [], [], [], []
+    offsets, component_ids = [0], []
+
+    # 先序生成：栈中存放 (父索引, 深度)
+    stack = [(-1, 0)] * min(count, 4)
+    while stack and len(ids) < count:
+        parent, depth = stack.pop()
+        index = len(ids)
+        kind, components = MOCK_NODE_KINDS[index % len(MOCK_NODE_KINDS)]
+        ids.append(10000 + index * 2)
+        names.append(f"{kind}_{index % 97}")
+        parents.append(parent)
+        active.append(0 if index % 13 == 0 else 1)
+        for component in components:
+            if component not in type_lookup:
+                type_lookup[component] = len(type_names)
+                type_names.append(component)
+            component_ids.append(type_lookup[component])
+        offsets.append(len(component_ids))
+        if depth < 6:
+            stack.extend([(index, depth + 1)] * fanout)
+
+    return {
+        "success": True,
+        "sceneName": "MockScene",
+        "scenePath": "Assets/Scenes/MockScene.unity",
+        "count": len(ids),
+        "ids": ids,
+        "names": names,
+        "parents": parents,
+        "active": active,
+        "componentTypes": type_names,
+        "componentOffsets": offsets,
+        "componentIds": component_ids
+    }
+
+
+# mock bridge的能力清单，形状与UnityMCPBridge.GetCapabilities一致
+MOCK_CAPABILITY_TOOLS = [
+    {"name": "add_component", "description": "Adds a component to a GameObject by instance ID or name",
+     "inputSchema": {"type": "object", "properties": {
+         "componentType": {"type": "string", "description": "Component type name"},
+         "gameObjectName": {"type": "string", "description": "Target GameObject name"},
+         "instanceId": {"type": "integer", "description": "Target GameObject instance ID"},
+         "componentData": {"type": "object", "description": "Field values to set"}},
+         "required": ["componentType"]}, "readOnly": False},
+    {"name": "create_scene", "description": "Creates a new Unity scene",
+     "inputSchema": {"type": "object", "properties": {"sceneName": {"type": "string", "default": "NewScene"}}},
+     "readOnly": False},
+    {"name": "execute_menu_item", "description": "Executes a Unity menu item by path",
+     "inputSchema": {"type": "object", "properties": {"menuPath": {"type": "string"}}, "required": ["menuPath"]},
+     "readOnly": False},
+    {"name": "get_gameobject", "description": "Gets GameObject information by name, instance ID, or object path",
+     "inputSchema": {"type": "object", "properties": {
+         "name": {"type": "string"}, "objectPath": {"type": "string"}, "instanceId": {"type": "integer"}}},
+     "readOnly": True},
+    {"name": "update_gameobject", "description": "Updates a GameObject's name, tag, layer, active and static state",
+     "inputSchema": {"type": "object", "properties": {
+         "instanceId": {"type": "integer"}, "objectPath": {"type": "string"},
+         "gameObjectData": {"type": "object", "properties": {
+             "name": {"type": "string"}, "tag": {"type": "string"}, "layer": {"type": "integer"},
+             "isActiveSelf": {"type": "boolean"}, "isStatic": {"type": "boolean"}}}}},
+     "readOnly": False},
+]
+
+
+def mock_capabilities(tools: List[dict]) -> dict:
+    canonical = "1:" + json.dumps(tools, separators=(",", ":"), ensure_ascii=False)
+    return {"success": True, "version": 1, "hash": hashlib.sha256(canonical.encode("utf-8")).hexdigest(), "tools": tools}
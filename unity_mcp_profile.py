@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Profiling - 工具调用的采样剖析
+Wraps sampled tool calls in cProfile/tracemalloc and breaks their wall time down by phase
+"""
+
+import cProfile
+import itertools
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+# 请求序号在进程内唯一，多个profiler写同一目录也不会覆盖
+_sequence = itertools.count(1)
+# 请求id用作文件名时替换掉的字符
+_UNSAFE_ID = re.compile(r"[^A-Za-z0-9_.-]")
+
+# 当前任务正在剖析的调用；未开启剖析时始终为None
+_current_call: ContextVar[Optional["ProfiledCall"]] = ContextVar("unity_mcp_profiled_call", default=None)
+
+
+def phase(name: str):
+    """
+    标记当前调用进入一个新阶段，到下一次标记为止的时间都计入该阶段
+
+    Costs one ContextVar lookup when the call is not being profiled.
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.enter(name)
+
+
+def add_phase(name: str, seconds: float):
+    """把在别处测得的耗时（如读循环里的JSON解析）计入某阶段，并从当前阶段中扣除"""
+    call = _current_call.get()
+    if call is not None:
+        call.add(name, seconds)
+
+
+class ProfiledCall:
+    """一次被采样的工具调用：按阶段累计的耗时"""
+
+    def __init__(self, tool: str, request_id: str):
+        self.tool = tool
+        self.request_id = request_id
+        self.started_at = time.time()
+        self.phases: Dict[str, float] = {}
+        self._phase = "other"
+        self._since = time.perf_counter()
+        self._started = self._since
+        self._moved = 0.0
+
+    def enter(self, name: str):
+        now = time.perf_counter()
+        self.phases[self._phase] = self.phases.get(self._phase, 0.0) + (now - self._since - self._moved)
+        self._phase = name
+        self._since = now
+        self._moved = 0.0
+
+    def add(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        self._moved += seconds
+
+    def finish(self) -> float:
+        self.enter("other")
+        return time.perf_counter() - self._started
+
+
+class ToolProfiler:
+    """
+    采样剖析器：命中采样的调用在 cProfile + tracemalloc 下执行，结果写入 directory
+
+    Each profiled call writes <tool>-<requestId>.json (phase breakdown, peak and top
+    retained allocations) and, when CPU profiling ran, <tool>-<requestId>.prof for
+    pstats/snakeviz. cProfile and tracemalloc are process-wide, so they only run for
+    one call at a time and also see any other task that runs meanwhile; overlapping
+    sampled calls still get their phase breakdown.
+    """
+
+    def __init__(self, directory: str, sample_rate: float = 1.0, tools: Optional[Set[str]] = None,
+                 cpu: bool = True, memory: bool = True, top_allocations: int = 10):
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+        self.tools = tools
+        self.cpu = cpu
+        self.memory = memory
+        self.top_allocations = top_allocations
+        self._exclusive_busy = False
+
+    @classmethod
+    def from_env(cls, directory: Optional[str] = None) -> Optional["ToolProfiler"]:
+        """
+        UNITY_MCP_PROFILE=1 或输出目录时启用（命令行 --profile 优先）
+
+        UNITY_MCP_PROFILE_SAMPLE   采样率 0-1，默认 1
+        UNITY_MCP_PROFILE_TOOLS    只剖析这些工具，逗号分隔，默认全部
+        UNITY_MCP_PROFILE_CPU      0 关闭cProfile
+        UNITY_MCP_PROFILE_MEMORY   0 关闭tracemalloc
+        """
+        setting = directory or os.environ.get("UNITY_MCP_PROFILE", "")
+        if setting in ("", "0"):
+            return None
+        if setting == "1":
+            setting = "profiles"
+        tools = {name.strip() for name in os.environ.get("UNITY_MCP_PROFILE_TOOLS", "").split(",") if name.strip()}
+        return cls(
+            setting,
+            sample_rate=float(os.environ.get("UNITY_MCP_PROFILE_SAMPLE", 1.0)),
+            tools=tools or None,
+            cpu=os.environ.get("UNITY_MCP_PROFILE_CPU", "1") != "0",
+            memory=os.environ.get("UNITY_MCP_PROFILE_MEMORY", "1") != "0"
+        )
+
+    def should_profile(self, tool: str) -> bool:
+        if self.tools is not None and tool not in self.tools:
+            return False
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    async def run(self, tool: str, call: Callable[[], Awaitable[Any]], request_id: Any = None) -> Any:
+        """
+        在剖析下执行一次工具调用；未命中采样时直接执行
+
+        request_id is the MCP JSON-RPC id of the tools/call request, so a profile can be
+        matched to the client's request; calls without one (interactive mode, benches)
+        fall back to <pid>-<seq>.
+        """
+        if not self.should_profile(tool):
+            return await call()
+
+        if request_id is None:
+            request_id = f"{os.getpid()}-{next(_sequence):06d}"
+        record = ProfiledCall(tool, str(request_id))
+        token = _current_call.set(record)
+
+        cpu_profile = None
+        tracing = False
+        if not self._exclusive_busy:
+            self._exclusive_busy = True
+            if self.cpu:
+                cpu_profile = cProfile.Profile()
+                try:
+                    cpu_profile.enable()
+                except ValueError:
+                    # 进程已在其他profiler下运行（如 python -m cProfile）
+                    cpu_profile = None
+            if self.memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                tracing = True
+            if cpu_profile is None and not tracing:
+                self._exclusive_busy = False
+
+        try:
+            return await call()
+        finally:
+            total = record.finish()
+            _current_call.reset(token)
+            memory = None
+            if cpu_profile is not None:
+                cpu_profile.disable()
+            if tracing:
+                memory = self._memory_summary()
+                tracemalloc.stop()
+            if cpu_profile is not None or tracing:
+                self._exclusive_busy = False
+            try:
+                self._write(record, total, cpu_profile, memory)
+            except OSError as e:
+                print(f"⚠️  Failed to write profile for {tool}: {e}", file=sys.stderr)
+
+    def _memory_summary(self) -> dict:
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        top = [
+            {"where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             "bytes": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:self.top_allocations]
+        ]
+        return {"peakBytes": peak, "retainedTop": top}
+
+    def _write(self, record: ProfiledCall, total: float, cpu_profile, memory: Optional[dict]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{record.tool}-{_UNSAFE_ID.sub('_', record.request_id)}"
+        if (self.directory / f"{stem}.json").exists():
+            # 客户端重连后请求id从头开始，不覆盖之前会话的结果
+            stem = f"{stem}-{os.getpid()}-{next(_sequence):06d}"
+        if cpu_profile is not None:
+            cpu_profile.dump_stats(str(self.directory / f"{stem}.prof"))
+
+        phases = {name: round(seconds * 1000.0, 3) for name, seconds in record.phases.items() if seconds > 0}
+        breakdown = {
+            "tool": record.tool,
+            "requestId": record.request_id,
+            "startedAt": record.started_at,
+            "totalMs": round(total * 1000.0, 3),
+            "phasesMs": phases,
+            "cpuProfile": f"{stem}.prof" if cpu_profile is not None else None,
+            "memory": memory
+        }
+        with open(self.directory / f"{stem}.json", "w", encoding="utf-8") as f:
+            json.dump(breakdown, f, ensure_ascii=False, indent=2)
+
+        summary = ", ".join(f"{name} {ms:.2f}" for name, ms in phases.items())
+        print(f"🔬 {record.tool} {breakdown['totalMs']:.2f} ms ({summary}) → {self.directory / stem}.json",
+              file=sys.stderr)
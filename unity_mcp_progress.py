@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Progress - 长时间工具调用的MCP进度通知
+Reports notifications/progress for the request's progressToken, with keep-alives during long waits
+"""
+
+import asyncio
+import contextlib
+import math
+import os
+import sys
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+# 没有新进度时，每隔这么多秒发送一次保活通知（UNITY_MCP_PROGRESS_KEEPALIVE，0 关闭）
+DEFAULT_KEEPALIVE = 5.0
+# 保活通知的进度增量：足够小，不会让客户端显示的百分比明显跳动
+KEEPALIVE_STEP = 0.001
+
+# send(progress, total, message)
+ProgressSender = Callable[[float, Optional[float], str], Awaitable[None]]
+
+# 当前请求的进度上报器；客户端没有给progressToken时始终为None
+_current_reporter: ContextVar[Optional["ProgressReporter"]] = ContextVar("unity_mcp_progress", default=None)
+
+
+def report_progress(message: str, progress: Optional[float] = None, total: Optional[float] = None):
+    """
+    上报当前请求的一步进度；未指定 progress 时自动前进一步
+
+    Costs one ContextVar lookup when the client did not ask for progress.
+    """
+    reporter = _current_reporter.get()
+    if reporter is not None:
+        reporter.report(message, progress, total)
+
+
+def progress_notification(token, progress: float, total: Optional[float] = None, message: str = "") -> dict:
+    """notifications/progress 的JSON-RPC消息"""
+    params = {"progressToken": token, "progress": progress}
+    if total is not None:
+        params["total"] = total
+    if message:
+        params["message"] = message
+    return {"jsonrpc": "2.0", "method": "notifications/progress", "params": params}
+
+
+class ProgressReporter:
+    """
+    一个请求的进度上报：按顺序发送通知，空闲时发送保活
+
+    MCP requires progress to increase with every notification. Steps advance to the next
+    integer (or to an explicit larger value) and keep-alives add a small fraction, so a
+    later step is always larger. Notifications are sent by a single pump task in report
+    order, and everything queued is flushed before the call returns.
+    """
+
+    def __init__(self, send: ProgressSender, keepalive: float = DEFAULT_KEEPALIVE):
+        self._send = send
+        self.keepalive = keepalive
+        self.progress = 0.0
+        self.total: Optional[float] = None
+        self.message = ""
+        self.sent = 0
+        self._pending: List[Tuple[float, Optional[float], str]] = []
+        self._wakeup = asyncio.Event()
+        self._pump: Optional[asyncio.Task] = None
+        self._closing = False
+        self._failed = False
+        self._started = time.monotonic()
+        self._last_sent = self._started
+
+    def report(self, message: str, progress: Optional[float] = None, total: Optional[float] = None):
+        step = math.floor(self.progress) + 1
+        self.progress = progress if progress is not None and progress > self.progress else step
+        if total is not None:
+            self.total = total
+        if self.total is not None and self.progress > self.total:
+            self.total = self.progress
+        self.message = message
+        self._enqueue(self.progress, self.total, message)
+
+    def _keepalive(self):
+        self.progress = round(self.progress + KEEPALIVE_STEP, 6)
+        if self.total is not None and self.progress > self.total:
+            self.total = self.progress
+        elapsed = time.monotonic() - self._started
+        message = f"{self.message} ({elapsed:.1f}s)" if self.message else f"working ({elapsed:.1f}s)"
+        self._enqueue(self.progress, self.total, message)
+
+    def _enqueue(self, progress: float, total: Optional[float], message: str):
+        self._pending.append((progress, total, message))
+        self._wakeup.set()
+
+    async def __aenter__(self) -> "ProgressReporter":
+        self._pump = asyncio.ensure_future(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._closing = True
+        self._wakeup.set()
+        await self._pump
+
+    async def _run(self):
+        while True:
+            if not self._pending and not self._closing:
+                timeout = None
+                if self.keepalive > 0:
+                    timeout = max(0.0, self._last_sent + self.keepalive - time.monotonic())
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    # 事件循环被同步工作阻塞时，超时与新进度可能同时到达，此时不需要保活
+                    if not self._pending:
+                        self._keepalive()
+                self._wakeup.clear()
+
+            pending, self._pending = self._pending, []
+            for progress, total, message in pending:
+                await self._deliver(progress, total, message)
+            if self._closing and not self._pending:
+                return
+
+    async def _deliver(self, progress: float, total: Optional[float], message: str):
+        self._last_sent = time.monotonic()
+        if self._failed:
+            return
+        try:
+            await self._send(progress, total, message)
+            self.sent += 1
+        except Exception as e:
+            # 客户端已断开等情况：停止发送，不影响工具调用本身
+            self._failed = True
+            print(f"⚠️  Progress notifications stopped: {e}", file=sys.stderr)
+
+
+@contextlib.asynccontextmanager
+async def track_progress(token, send: ProgressSender, keepalive: Optional[float] = None):
+    """
+    客户端在请求 _meta 中给出 progressToken 时，在此范围内的 report_progress 发送进度通知
+
+    Without a token this does nothing and report_progress stays a no-op.
+    """
+    if token is None:
+        yield None
+        return
+    if keepalive is None:
+        keepalive = float(os.environ.get("UNITY_MCP_PROGRESS_KEEPALIVE", DEFAULT_KEEPALIVE))
+    async with ProgressReporter(send, keepalive) as reporter:
+        context_token = _current_reporter.set(reporter)
+        try:
+            yield reporter
+        finally:
+            _current_reporter.reset(context_token)
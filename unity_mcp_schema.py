@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Schema - 工具参数校验
+Compiles tool inputSchemas once into validators that check, coerce and fill defaults before any I/O
+"""
+
+import copy
+import json
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+_INTEGER = re.compile(r"^[+-]?\d+$")
+_TRUE = ("true", "1", "yes")
+_FALSE = ("false", "0", "no")
+
+
+class SchemaValidationError(ValueError):
+    """Raised when tool arguments do not match the tool's inputSchema"""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+class _Invalid(Exception):
+    def __init__(self, message: str):
+        self.message = message
+
+
+# ========== 标量类型：检查并做宽松的类型转换 ==========
+
+def _to_string(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise _Invalid(f"expected string, got {type(value).__name__}")
+
+
+def _to_integer(value):
+    if isinstance(value, bool):
+        raise _Invalid("expected integer, got bool")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INTEGER.match(value.strip()):
+        return int(value)
+    raise _Invalid(f"expected integer, got {type(value).__name__}")
+
+
+def _to_number(value):
+    if isinstance(value, bool):
+        raise _Invalid("expected number, got bool")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise _Invalid(f"expected number, got {type(value).__name__}")
+
+
+def _to_boolean(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise _Invalid(f"expected boolean, got {type(value).__name__}")
+
+
+def _to_null(value):
+    if value is None:
+        return None
+    raise _Invalid(f"expected null, got {type(value).__name__}")
+
+
+def _json_container(value, expected: type, name: str):
+    # 交互模式或部分客户端会把对象/数组作为JSON字符串传入
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            raise _Invalid(f"expected {name}, got unparseable string")
+    if not isinstance(value, expected):
+        raise _Invalid(f"expected {name}, got {type(value).__name__}")
+    return value
+
+
+# ========== 编译 ==========
+
+def _compile(schema: dict) -> Callable[[Any, str, List[str]], Any]:
+    """Compile one schema node into convert(value, path, errors) -> value"""
+    schema_type = schema.get("type")
+    types = schema_type if isinstance(schema_type, list) else [schema_type] if schema_type else []
+
+    converters = []
+    for name in types:
+        if name == "object":
+            converters.append(_compile_object(schema))
+        elif name == "array":
+            converters.append(_compile_array(schema))
+        elif name in _SCALARS:
+            scalar = _SCALARS[name]
+            converters.append(lambda value, path, errors, scalar=scalar: scalar(value))
+
+    enum = schema.get("enum")
+    enum_values = frozenset(enum) if enum and all(isinstance(v, (str, int, float, bool)) for v in enum) else None
+
+    if not converters and enum_values is None:
+        return lambda value, path, errors: value
+
+    def convert(value, path, errors):
+        if converters:
+            failure = None
+            for converter in converters:
+                try:
+                    value = converter(value, path, errors)
+                    break
+                except _Invalid as e:
+                    failure = e
+            else:
+                errors.append(f"{path or 'arguments'}: {failure.message}")
+                return value
+        if enum_values is not None and not _in_enum(value, enum_values):
+            errors.append(f"{path or 'arguments'}: must be one of {sorted(map(str, enum_values))}")
+        return value
+
+    return convert
+
+
+def _in_enum(value, enum_values: frozenset) -> bool:
+    # 没有type的enum会收到任意JSON值；对象和数组不可哈希，也不会等于任何标量取值
+    try:
+        return value in enum_values
+    except TypeError:
+        return False
+
+
+def _compile_object(schema: dict):
+    properties: List[Tuple[str, Callable, bool, Any]] = []
+    required = set(schema.get("required", []))
+    for name, prop in (schema.get("properties") or {}).items():
+        has_default = "default" in prop
+        properties.append((name, _compile(prop), has_default, prop.get("default")))
+    known = frozenset(name for name, _, _, _ in properties)
+    # required但没有在properties里声明的字段只检查是否存在
+    undeclared_required = [name for name in schema.get("required", []) if name not in known]
+    allow_extra = schema.get("additionalProperties", True) is not False
+
+    def convert(value, path, errors):
+        value = _json_container(value, dict, "object")
+        result = dict(value)
+        prefix = f"{path}." if path else ""
+        for name, converter, has_default, default in properties:
+            if name in value and value[name] is not None:
+                result[name] = converter(value[name], prefix + name, errors)
+            elif name in required:
+                errors.append(f"{prefix}{name}: required")
+            elif has_default:
+                # 可变默认值每次复制，避免调用之间共享
+                result[name] = copy.deepcopy(default) if isinstance(default, (dict, list)) else default
+            else:
+                result.pop(name, None)
+        for name in undeclared_required:
+            if value.get(name) is None:
+                errors.append(f"{prefix}{name}: required")
+        if not allow_extra:
+            for name in value:
+                if name not in known:
+                    errors.append(f"{prefix}{name}: unexpected property")
+        return result
+
+    return convert
+
+
+def _compile_array(schema: dict):
+    items = _compile(schema["items"]) if isinstance(schema.get("items"), dict) else None
+
+    def convert(value, path, errors):
+        value = _json_container(value, list, "array")
+        if items is None:
+            return list(value)
+        return [items(item, f"{path}[{i}]", errors) for i, item in enumerate(value)]
+
+    return convert
+
+
+_SCALARS = {
+    "string": _to_string,
+    "integer": _to_integer,
+    "number": _to_number,
+    "boolean": _to_boolean,
+    "null": _to_null,
+}
+
+
+def compile_schema(schema: dict) -> Callable[[dict], dict]:
+    """
+    把inputSchema编译为校验函数：validate(arguments) -> 规范化后的参数
+
+    Applies defaults, coerces loosely typed values ("5" -> 5, "false" -> False, JSON strings
+    -> objects) and raises SchemaValidationError listing every problem.
+    """
+    root = _compile(schema or {"type": "object"})
+
+    def validate(arguments: dict) -> dict:
+        errors: List[str] = []
+        result = root(arguments if arguments is not None else {}, "", errors)
+        if errors:
+            raise SchemaValidationError(errors)
+        return result
+
+    return validate
+
+
+def compile_tool_validators(tools: List[dict]) -> Dict[str, Callable[[dict], dict]]:
+    """每个工具的inputSchema编译一次，按工具名索引"""
+    return {tool["name"]: compile_schema(tool.get("inputSchema", {"type": "object"})) for tool in tools}
@@ -4,39 +4,128 @@ Unity MCP Server - Real Unity Editor Integration
 Communicates directly with Unity Editor through WebSocket
 """
 
+import argparse
 import asyncio
 import json
+import mmap
+import os
 import sys
-import websockets
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+from unity_log_fingerprint import collapse_logs
+from unity_mcp_capabilities import CapabilityCache, build_manifest_tools, tool_name_for
+from unity_mcp_coalesce import WriteCoalescer
+from unity_mcp_editor_state import WAIT, EditorStateTracker
+from unity_mcp_profile import ToolProfiler, phase
+from unity_mcp_progress import report_progress, track_progress
+from unity_mcp_schema import SchemaValidationError, compile_tool_validators
+from unity_mcp_singleflight import SingleFlight, request_key
+from unity_mcp_trace import TraceRecorder
+from unity_scene_store import SceneStore
+from unity_mcp_transport import RequestTimeout, TransportClosed, create_transport
+
 # MCP server implementation
 try:
-    from mcp.server import Server
+    from mcp.server import NotificationOptions, Server
     from mcp.server.models import InitializationOptions
+    from mcp.server.stdio import stdio_server
     from mcp.types import Tool, TextContent
     MCP_AVAILABLE = True
 except ImportError:
     MCP_AVAILABLE = False
     print("MCP module not available, using basic implementation", file=sys.stderr)
 
+# Bridge写出的bulk文件名前缀（见 BulkTransferService.cs）
+BULK_FILE_PREFIX = "unity-mcp-bulk-"
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+# 不修改场景的Bridge方法，执行后本地场景索引仍然有效
+READ_ONLY_METHODS = {
+    "unity.get_scene_info",
+    "unity.get_scene_hierarchy",
+    "get_console_logs",
+    "get_log_fingerprints",
+    "unity.get_editor_state",
+    "unity.get_capabilities",
+}
+
 class UnityMCPServer:
     def __init__(self):
-        self.websocket = None
+        self.transport = None
         self.unity_connected = False
         self.unity_host = "localhost"
         self.unity_port = 8765
+        # ws://host:port 连接UnityMCPBridge，tcp://host:port 连接SimpleUnityMCP
+        self.unity_url = os.environ.get("UNITY_MCP_URL")
+        self._request_counter = 0
+        # 并发调用同时发现断线时只发起一次连接，其余调用方等待同一结果
+        self._connect_flight = SingleFlight()
+
+        # 同机大数据传输：超过阈值的响应经由内存映射临时文件交付（0 表示关闭）
+        self.bulk_threshold = int(os.environ.get("UNITY_MCP_BULK_THRESHOLD", 1024 * 1024))
+        self.bulk_max_bytes = int(os.environ.get("UNITY_MCP_BULK_MAX_BYTES", 512 * 1024 * 1024))
+
+        # 相同的只读请求在途时合并为一次往返（UNITY_MCP_SINGLE_FLIGHT=0 关闭）
+        self.single_flight = SingleFlight() if os.environ.get("UNITY_MCP_SINGLE_FLIGHT", "1") != "0" else None
+        # 同一对象的连续修改在窗口内合并（UNITY_MCP_COALESCE_MS，默认关闭）
+        self.write_coalescer = WriteCoalescer.from_env(self._send_deduplicated)
+
+        # 编辑器忙碌熔断（UNITY_MCP_BUSY_MODE=wait|fail-fast, UNITY_MCP_BUSY_MAX_WAIT=秒）
+        self.editor_state = EditorStateTracker()
+
+        # 本地场景索引：一次拉取层级，查询在进程内完成；写命令之后标记为过期
+        self.scene_store = SceneStore()
+        self.scene_store_stale = True
+
+        # Trace录制（--record 或 UNITY_MCP_TRACE）
+        self.trace_recorder = None
+        trace_path = os.environ.get("UNITY_MCP_TRACE")
+        if trace_path:
+            self.enable_trace(trace_path)
+
+        # 工具调用剖析（--profile 或 UNITY_MCP_PROFILE），关闭时为None
+        self.profiler = ToolProfiler.from_env()
 
         if MCP_AVAILABLE:
             self.server = Server("unity-mcp", "1.0.0")
         else:
             self.server = None
 
+        # Bridge能力清单：磁盘缓存按hash索引，连接后用knownHash校验
+        self.capability_cache = CapabilityCache()
+        self.capability_hash = None
+        # 工具列表变化后待发送的 notifications/tools/list_changed（需要在MCP会话的请求上下文中发送）
+        self.tools_changed_pending = False
+
         self.setup_tools()
+        cached = self.capability_cache.load(self.bridge_url)
+        if cached:
+            self.apply_capabilities(cached)
+
+    @property
+    def bridge_url(self) -> str:
+        return self.unity_url or f"ws://{self.unity_host}:{self.unity_port}"
 
     def setup_tools(self):
         """Setup MCP tools for Unity operations"""
+        # Map MCP tool names to Unity methods
+        self.method_mapping = {
+            "unity_create_scene": "unity.create_scene",
+            "unity_create_gameobject": "unity.create_gameobject",
+            "unity_create_ui_canvas": "unity.create_ui_canvas",
+            "unity_get_scene_info": "unity.get_scene_info",
+            "unity_select_gameobject": "unity.select_gameobject",
+            "unity_execute_menu": "unity.execute_menu_item",
+            # ConsoleLogsService 的方法名没有 unity. 前缀
+            "unity_get_console_logs": "get_console_logs",
+            "unity_get_log_fingerprints": "get_log_fingerprints"
+        }
+        self.read_only_methods = set(READ_ONLY_METHODS)
+        # 来自bridge能力清单的工具，使用通用的结果格式
+        self.manifest_tools = set()
+
         self.tools = [
             {
                 "name": "unity_create_scene",
@@ -116,85 +205,462 @@ class UnityMCPServer:
             },
             {
                 "name": "unity_get_console_logs",
-                "description": "获取Unity控制台日志",
+                "description": "获取Unity控制台日志，相同指纹（消息模板+来源栈帧）的重复日志折叠为一条并带次数",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "logType": {
+                            "type": "string",
+                            "description": "日志类型过滤：Log / Warning / Error / Exception / Assert，默认全部"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "最多返回的日志条数（折叠后）",
+                            "default": 50
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "从最新日志起跳过的条数",
+                            "default": 0
+                        },
+                        "includeStackTrace": {
+                            "type": "boolean",
+                            "description": "是否附带完整调用栈",
+                            "default": False
+                        }
+                    }
+                }
+            },
+            {
+                "name": "unity_get_log_fingerprints",
+                "description": "获取出现次数最多的日志指纹（日志风暴时快速定位来源）",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "logType": {
+                            "type": "string",
+                            "description": "日志类型过滤，默认全部"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "返回的指纹数量",
+                            "default": 20
+                        }
+                    }
+                }
+            },
+            {
+                "name": "unity_get_editor_state",
+                "description": "获取Unity编辑器状态（就绪、编译中、域重载、进出Play模式）",
                 "inputSchema": {
                     "type": "object",
                     "properties": {}
                 }
+            },
+            {
+                "name": "unity_query_scene",
+                "description": "在本地场景索引中查询GameObject（路径glob、名称、组件、子树/祖先），无需逐个请求编辑器",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "层级路径glob，如 'Canvas/**/Button*'"
+                        },
+                        "name": {
+                            "type": "string",
+                            "description": "精确名称"
+                        },
+                        "component": {
+                            "type": "string",
+                            "description": "组件类型名，如 'Image'"
+                        },
+                        "subtreeOf": {
+                            "anyOf": [{"type": "string"}, {"type": "integer"}],
+                            "description": "只在该对象的子树中查找：字符串按路径或名称解析，整数按instanceId解析"
+                        },
+                        "ancestorsOf": {
+                            "anyOf": [{"type": "string"}, {"type": "integer"}],
+                            "description": "返回该对象的祖先：字符串按路径或名称解析，整数按instanceId解析"
+                        },
+                        "activeOnly": {
+                            "type": "boolean",
+                            "description": "只返回activeInHierarchy的对象",
+                            "default": False
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "最多返回的结果数",
+                            "default": 50
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "查询前强制从编辑器重新拉取层级",
+                            "default": False
+                        }
+                    }
+                }
             }
         ]
 
+        self.builtin_tools = list(self.tools)
+        self.builtin_methods = dict(self.method_mapping)
+
+        # inputSchema在启动时编译一次，调用时校验并补全参数
+        self.validators = compile_tool_validators(self.tools)
+
         if MCP_AVAILABLE and self.server:
             @self.server.list_tools()
             async def list_tools():
+                # 客户端正在重新获取列表，之前待发送的变化通知不再需要
+                self.tools_changed_pending = False
                 return self.tools
 
             @self.server.call_tool()
             async def call_tool(name: str, arguments: dict):
-                return await self.execute_unity_command(name, arguments)
+                # 客户端给出progressToken时报告 queued / executing / transferring，并在长时间等待中保活
+                context = self.server.request_context
+                token = context.meta.progressToken if context.meta else None
+
+                async def send_progress(progress, total, message):
+                    await context.session.send_progress_notification(token, progress, total, message=message)
+
+                async with track_progress(token, send_progress):
+                    result = await self.execute_unity_command(name, arguments, request_id=context.request_id)
+                await self.flush_tools_changed()
+                return result
+
+    def apply_capabilities(self, manifest: dict):
+        """用能力清单重建工具列表、路由和校验器；内置工具优先"""
+        # 内置工具已覆盖的方法（如 unity_execute_menu -> execute_menu_item）不重复暴露
+        covered = {tool["name"] for tool in self.builtin_tools}
+        covered.update(tool_name_for(method) for method in self.builtin_methods.values())
+        tools, routes, read_only = build_manifest_tools(manifest, covered)
+        self.tools = self.builtin_tools + tools
+        self.method_mapping = {**self.builtin_methods, **routes}
+        self.read_only_methods = set(READ_ONLY_METHODS) | read_only
+        self.manifest_tools = set(routes)
+        self.validators = compile_tool_validators(self.tools)
+        self.capability_hash = manifest.get("hash")
+
+    async def refresh_capabilities(self) -> bool:
+        """向bridge校验能力清单，只有hash变化时才传输并写入缓存"""
+        params = {"knownHash": self.capability_hash} if self.capability_hash else {}
+        result = await self.send_unity_command("unity.get_capabilities", params)
+        if not result.get("success") or result.get("unchanged") or "tools" not in result:
+            return False
 
-    async def connect_to_unity(self):
-        """连接到Unity Editor WebSocket服务器"""
+        self.capability_cache.save(self.bridge_url, result)
+        self.apply_capabilities(result)
+        print(f"🧩 Loaded {len(self.manifest_tools)} tools from bridge capabilities ({result['hash'][:12]})",
+              file=sys.stderr)
+        # hash变化（如域重载后新增了工具）：通知客户端重新获取工具列表
+        self.tools_changed_pending = True
+        await self.flush_tools_changed()
+        return True
+
+    async def flush_tools_changed(self):
+        """在MCP请求上下文中发送待发送的 tools/list_changed；不在请求中时留到下一次工具调用结束"""
+        if not (self.tools_changed_pending and MCP_AVAILABLE and self.server):
+            return
+        try:
+            session = self.server.request_context.session
+        except LookupError:
+            return
         try:
-            uri = f"ws://{self.unity_host}:{self.unity_port}"
-            self.websocket = await websockets.connect(uri)
-            self.unity_connected = True
-            print(f"✅ Connected to Unity Editor at {uri}", file=sys.stderr)
+            await session.send_tool_list_changed()
+            self.tools_changed_pending = False
+        except Exception as e:
+            print(f"⚠️  Failed to send tools/list_changed: {e}", file=sys.stderr)
+
+    def enable_trace(self, path: str):
+        """开始把工具调用录制到JSONL trace"""
+        if self.trace_recorder:
+            self.trace_recorder.close()
+        self.trace_recorder = TraceRecorder(path)
+        print(f"📼 Recording tool calls to {path}", file=sys.stderr)
+
+    async def connect_to_unity(self) -> bool:
+        """连接到Unity Editor（WebSocket或TCP）；已连接时直接返回，并发调用共享同一次连接"""
+        return await self._connect_flight.do("connect", self._connect, label="connect")
+
+    async def _connect(self) -> bool:
+        # 排队期间别的调用可能已经连上
+        if self.transport and self.transport.connected:
             return True
+
+        uri = self.bridge_url
+        transport = create_transport(uri, on_notification=self.editor_state.on_status)
+        try:
+            await transport.connect()
         except Exception as e:
+            await transport.close()
             print(f"❌ Failed to connect to Unity Editor: {e}", file=sys.stderr)
             self.unity_connected = False
+            self.editor_state.connect_failed()
             return False
 
+        # 旧transport此时一定已断开，先换上新连接再关闭它，只是释放资源
+        previous, self.transport = self.transport, transport
+        if previous:
+            await previous.close()
+        self.unity_connected = True
+        self.editor_state.on_connected()
+        print(f"✅ Connected to Unity Editor at {uri}", file=sys.stderr)
+
+        try:
+            await self.refresh_capabilities()
+        except Exception as e:
+            # 旧版bridge没有能力清单，继续使用内置工具
+            print(f"⚠️  Capability discovery failed: {e}", file=sys.stderr)
+        return True
+
+    async def wait_for_editor(self, wait: bool = True) -> Optional[dict]:
+        """
+        连接并等待编辑器就绪，返回None或熔断错误
+
+        编译、域重载、进出Play模式期间：fail-fast 模式立即返回 retryAfterMs，
+        wait 模式最多等待 editor_state.max_wait 秒（Play模式只等待切换过程）；重载期间的重连按退避间隔进行。
+        编辑器未运行时返回None，由调用方报告连接错误。wait=False 时只做一次非阻塞检查。
+        """
+        state = self.editor_state
+        started = time.monotonic()
+        reported = None
+        while True:
+            if not (self.transport and self.transport.connected):
+                if self.unity_connected:
+                    self.unity_connected = False
+                    state.on_disconnected()
+                if state.reconnect_delay() == 0:
+                    await self.connect_to_unity()
+
+            if not state.busy:
+                return None
+
+            # 状态可能在等待中变化（如编译结束后进入Play模式），每轮按当前状态计算上限
+            limit = state.wait_limit() if wait and state.mode == WAIT else 0.0
+            remaining = started + limit - time.monotonic()
+            if remaining <= 0:
+                return state.busy_error()
+            if state.state != reported:
+                reported = state.state
+                report_progress(f"queued: editor {state.state}")
+            if self.unity_connected:
+                # 短周期等待，以便及时发现重载导致的断线
+                await state.wait_ready(min(remaining, 0.25))
+            else:
+                await asyncio.sleep(min(remaining, max(state.reconnect_delay(), 0.05)))
+
     async def send_unity_command(self, method: str, params: dict = None) -> dict:
-        """向Unity发送MCP命令"""
-        if not self.unity_connected or not self.websocket:
+        """向Unity发送MCP命令；同一对象的修改可在窗口内合并，只读方法经过single-flight合并"""
+        if self.write_coalescer is not None:
+            key = self.write_coalescer.key_for(method, params)
+            if key is not None:
+                phase("coalesce")
+                report_progress(f"queued: {method} (coalescing)")
+                return await self.write_coalescer.submit(key, method, params)
+            # 其他命令都是屏障：先把窗口内的修改发出去，保证读到之前的写入
+            await self.write_coalescer.flush()
+        return await self._send_deduplicated(method, params)
+
+    async def _send_deduplicated(self, method: str, params: dict = None) -> dict:
+        phase("send")
+        if self.single_flight is None:
+            return await self._send_unity_command(method, params)
+        if method in self.read_only_methods:
+            return await self.single_flight.do(
+                request_key(method, params), lambda: self._send_unity_command(method, params), label=method)
+
+        # 写操作之后发起的读取不能合并到写之前的在途读取上
+        self.single_flight.forget()
+        return await self._send_unity_command(method, params)
+
+    async def _send_unity_command(self, method: str, params: dict = None) -> dict:
+        if not self.unity_connected or not self.transport or not self.transport.connected:
             return {
                 "success": False,
                 "error": "Not connected to Unity Editor. Please start Unity and open the MCP Bridge window."
             }
 
         try:
+            self._request_counter += 1
             message = {
                 "jsonrpc": "2.0",
-                "id": f"cmd_{asyncio.get_event_loop().time()}",
+                "id": f"cmd_{self._request_counter}",
                 "method": method,
                 "params": params or {}
             }
+            if self.bulk_threshold > 0 and self.transport.host in LOCAL_HOSTS:
+                message["bulk"] = {"threshold": self.bulk_threshold}
 
-            await self.websocket.send(json.dumps(message))
-            response = await self.websocket.recv()
+            report_progress(f"executing: {method}")
+            result = await self.transport.request(message)
+            if "bulk" in result:
+                phase("bulk")
+                report_progress(f"transferring: {int(result['bulk'].get('size', 0)) / 1048576:.1f} MiB")
+                result = self._read_bulk_payload(result["bulk"])
 
-            result = json.loads(response)
             return result.get("result", result)
 
-        except websockets.exceptions.ConnectionClosed:
+        except TransportClosed:
             self.unity_connected = False
             return {
                 "success": False,
                 "error": "Connection to Unity Editor lost"
             }
+        except RequestTimeout as e:
+            # 编辑器卡住或被调试器暂停；连接本身仍可用
+            return {
+                "success": False,
+                "error": f"{e}. Set UNITY_MCP_REQUEST_TIMEOUT to allow longer operations."
+            }
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Communication error: {str(e)}"
             }
 
-    async def execute_unity_command(self, name: str, arguments: dict) -> dict:
-        """执行Unity命令并返回结果"""
+    def _read_bulk_payload(self, handle: dict) -> dict:
+        """映射bridge写出的bulk文件并直接从映射解析，完成后删除文件"""
+        path = Path(handle.get("path", ""))
+        size = int(handle.get("size", 0))
 
-        # Map MCP tool names to Unity methods
-        method_mapping = {
-            "unity_create_scene": "unity.create_scene",
-            "unity_create_gameobject": "unity.create_gameobject",
-            "unity_create_ui_canvas": "unity.create_ui_canvas",
-            "unity_get_scene_info": "unity.get_scene_info",
-            "unity_select_gameobject": "unity.select_gameobject",
-            "unity_execute_menu": "unity.execute_menu_item",
-            "unity_get_console_logs": "unity.get_console_logs"
-        }
+        if not path.name.startswith(BULK_FILE_PREFIX):
+            raise ValueError(f"Unexpected bulk file: {path}")
 
-        unity_method = method_mapping.get(name)
+        try:
+            if size > self.bulk_max_bytes:
+                raise ValueError(f"Bulk payload of {size} bytes exceeds limit of {self.bulk_max_bytes}")
+            if path.stat().st_size != size:
+                raise ValueError(f"Bulk payload size mismatch: expected {size} bytes")
+
+            with open(path, "rb") as f:
+                if size == 0:
+                    return {}
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # str()直接从映射解码，不经过中间bytes拷贝
+                    return json.loads(str(mapped, handle.get("encoding", "utf-8")))
+        finally:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    async def refresh_scene_store(self) -> dict:
+        """从编辑器拉取列式层级并重建本地索引"""
+        result = await self.send_unity_command("unity.get_scene_hierarchy")
+        if result.get("success"):
+            phase("index")
+            report_progress("indexing: scene hierarchy")
+            self.scene_store.load(result)
+            self.scene_store_stale = False
+        return result
+
+    async def query_scene(self, arguments: dict) -> dict:
+        """unity_query_scene: 在本地场景索引上执行查询"""
+        if arguments.get("refresh") or self.scene_store_stale:
+            result = await self.refresh_scene_store()
+            if not result.get("success"):
+                error = result.get("error", "Unknown error")
+                return {"content": [{"type": "text", "text": f"❌ unity_query_scene failed: {error}"}]}
+
+        def target(value):
+            # 只有JSON整数按instanceId解析；字符串（包括 "123" 这样的名称）按路径或名称解析
+            if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+                return value
+            return str(value)
+
+        phase("query")
+        store = self.scene_store
+        t0 = time.perf_counter()
+        try:
+            indices = store.query(
+                path=arguments.get("path"),
+                name=arguments.get("name"),
+                component=arguments.get("component"),
+                subtree_of=target(arguments.get("subtreeOf")),
+                ancestors_of=target(arguments.get("ancestorsOf")),
+                active_only=arguments.get("activeOnly", False),
+                limit=arguments.get("limit", 50)
+            )
+        except (TypeError, ValueError) as e:
+            return {"content": [{"type": "text", "text": f"❌ unity_query_scene failed: {e}"}]}
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+
+        text = "✅ unity_query_scene executed successfully\n\n"
+        text += f"📋 Scene: {store.scene_name or 'Unknown'} ({len(store)} objects indexed)\n"
+        text += f"🔍 Matches: {len(indices)} in {elapsed_ms:.3f} ms\n\n"
+        for index in indices:
+            status = "✅" if store.active[index] else "❌"
+            components = ", ".join(store.components_of(index))
+            text += f"{status} {store.path_of(index)} (ID: {store.ids[index]}) [{components}]\n"
+
+        return {"content": [{"type": "text", "text": text}]}
+
+    async def execute_unity_command(self, name: str, arguments: dict, request_id=None) -> dict:
+        """执行Unity命令并返回结果；request_id 为MCP请求的JSON-RPC id（剖析结果以它命名）"""
+        if not self.trace_recorder:
+            return await self._run_unity_command(name, arguments, request_id)
+
+        started_at = time.time()
+        t0 = time.perf_counter()
+        result = await self._run_unity_command(name, arguments, request_id)
+        duration_ms = (time.perf_counter() - t0) * 1000.0
+
+        text = "".join(item.get("text", "") for item in result.get("content", []))
+        self.trace_recorder.record(
+            name, arguments, started_at, duration_ms,
+            response_bytes=len(text.encode("utf-8")),
+            success=not text.startswith("❌")
+        )
+        return result
+
+    async def _run_unity_command(self, name: str, arguments: dict, request_id=None) -> dict:
+        if self.profiler is None:
+            return await self._execute_unity_command(name, arguments)
+        return await self.profiler.run(name, lambda: self._execute_unity_command(name, arguments), request_id)
+
+    async def _execute_unity_command(self, name: str, arguments: dict) -> dict:
+        # 参数不合法时在任何I/O之前拒绝
+        phase("validate")
+        validator = self.validators.get(name)
+        if validator:
+            try:
+                arguments = validator(arguments)
+            except SchemaValidationError as e:
+                return {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"❌ {name} failed: Invalid arguments: {e}"
+                        }
+                    ]
+                }
+
+        # 本地工具：不经过method映射
+        if name == "unity_get_editor_state":
+            await self.wait_for_editor(wait=False)
+            status = self.editor_state.describe()
+            text = "✅ unity_get_editor_state executed successfully\n\n"
+            text += f"🛠️ State: {status['state']} ({status['forSeconds']}s)\n"
+            if status["busy"]:
+                text += f"⏳ Retry after: {status['retryAfterMs']} ms\n"
+            text += f"🚦 Busy mode: {status['mode']} (max wait {status['maxWait']}s)"
+            if self.single_flight is not None:
+                text += f"\n🔗 Single-flight: {self.single_flight.in_flight} in flight"
+                for method, counts in self.single_flight.stats().items():
+                    text += f"\n  • {method}: {counts['executed']} executed, {counts['shared']} shared"
+            return {"content": [{"type": "text", "text": text}]}
+
+        if name == "unity_query_scene":
+            if self.scene_store_stale or arguments.get("refresh"):
+                phase("wait")
+                busy = await self.wait_for_editor()
+                if busy:
+                    return {"content": [{"type": "text", "text": f"❌ {name} failed: {busy['error']}"}]}
+            return await self.query_scene(arguments)
+
+        unity_method = self.method_mapping.get(name)
         if not unity_method:
             return {
                 "content": [
@@ -205,9 +671,18 @@ class UnityMCPServer:
                 ]
             }
 
-        # Ensure connection to Unity
-        if not self.unity_connected:
-            await self.connect_to_unity()
+        # Ensure connection to Unity (编辑器忙碌时按熔断模式等待或立即失败)
+        phase("wait")
+        busy = await self.wait_for_editor()
+        if busy:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"❌ {name} failed: {busy['error']}"
+                    }
+                ]
+            }
 
         if not self.unity_connected:
             return {
@@ -219,10 +694,17 @@ class UnityMCPServer:
                 ]
             }
 
+        if name == "unity_get_console_logs":
+            # Bridge自身的调试日志对Agent没有用处，不随响应传输
+            arguments = dict(arguments, includeBridgeLogs=False)
+
         # Execute Unity command
         result = await self.send_unity_command(unity_method, arguments)
+        if unity_method not in self.read_only_methods:
+            self.scene_store_stale = True
 
         # Format response
+        phase("format")
         if result.get("success"):
             # Success response
             text = f"✅ {name} executed successfully\n\n"
@@ -262,13 +744,45 @@ class UnityMCPServer:
                 text += f"📋 Menu: {result.get('menuPath', 'Unknown')}"
 
             elif name == "unity_get_console_logs":
-                logs = result.get('logs', [])
-                text += f"📜 Console Logs ({len(logs)} entries):\n"
-                for log in logs[-10:]:  # Show last 10 logs
-                    text += f"• {log}\n"
+                # 新版Bridge在 data.logs 中返回日志对象（已折叠），旧版直接返回字符串列表
+                data = result.get('data') or {}
+                entries = collapse_logs(data.get('logs', result.get('logs', [])))
+                messages = sum(entry['count'] for entry in entries)
+                text += f"📜 Console Logs ({len(entries)} unique, {messages} messages):\n"
+                for entry in entries:
+                    text += f"• [{entry['type']}] {entry['message']}"
+                    if entry['count'] > 1:
+                        text += f" ×{entry['count']} ({entry['firstTimestamp']} → {entry['lastTimestamp']})"
+                    text += "\n"
+                    if entry.get('stackTrace'):
+                        text += "".join(f"    {line}\n" for line in entry['stackTrace'].strip().splitlines())
+                    elif entry.get('topFrame'):
+                        text += f"  ↳ {entry['topFrame']}\n"
+
+            elif name == "unity_get_log_fingerprints":
+                data = result.get('data') or {}
+                fingerprints = data.get('fingerprints', [])
+                text += (f"🧬 Top log fingerprints ({len(fingerprints)} of {data.get('tracked', 0)} tracked, "
+                         f"{data.get('totalMessages', 0)} messages):\n")
+                for entry in fingerprints:
+                    # error > 0：指纹曾被挤出索引，次数为上界估计
+                    count = f"≤{entry['count']}" if entry.get('error') else str(entry['count'])
+                    text += f"• ×{count} [{entry['type']}] {entry['template']}\n"
+                    if entry.get('topFrame'):
+                        text += f"  ↳ {entry['topFrame']}\n"
+
+            elif name in self.manifest_tools:
+                # 清单工具：通用格式
+                if result.get("message"):
+                    text += f"💬 {result['message']}\n"
+                if result.get("data") is not None:
+                    text += json.dumps(result["data"], ensure_ascii=False, indent=2)
         else:
             # Error response
             error = result.get("error", "Unknown error")
+            if isinstance(error, dict):
+                # McpToolBase 错误格式：{"type": ..., "message": ...}
+                error = error.get("message") or error.get("type") or "Unknown error"
             text = f"❌ {name} failed: {error}"
 
         return {
@@ -348,16 +862,28 @@ class UnityMCPServer:
                 print(f"\n❌ Error: {e}")
 
 async def main():
+    parser = argparse.ArgumentParser(description="Unity MCP Server")
+    parser.add_argument("--test", action="store_true", help="独立交互测试模式")
+    parser.add_argument("--record", metavar="TRACE", help="把工具调用录制到JSONL trace")
+    parser.add_argument("--profile", metavar="DIR", help="剖析工具调用，结果写入DIR（采样等设置见UNITY_MCP_PROFILE_*）")
+    args = parser.parse_args()
+
     server = UnityMCPServer()
+    if args.record:
+        server.enable_trace(args.record)
+    if args.profile:
+        server.profiler = ToolProfiler.from_env(args.profile)
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--test":
+    if args.test:
         # Standalone testing mode
         await server.run_standalone()
     else:
         # MCP server mode
         if MCP_AVAILABLE and server.server:
-            async with server.server:
-                await server.server.run()
+            # 声明 tools.listChanged，能力清单变化时客户端会收到通知
+            options = server.server.create_initialization_options(NotificationOptions(tools_changed=True))
+            async with stdio_server() as (read_stream, write_stream):
+                await server.server.run(read_stream, write_stream, options)
         else:
             print("MCP not available, running in test mode", file=sys.stderr)
             await server.run_standalone()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Single-Flight - 相同只读请求的合并
+Identical read-only requests that overlap in time share one editor round trip or Node process
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+def request_key(method: str, params: Optional[dict]) -> tuple:
+    """方法名 + 规范化参数（键排序），参数顺序不同的相同请求得到相同的key"""
+    return method, json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class SingleFlight:
+    """
+    同一key的请求在途时，后到的调用方挂到同一个结果上，不再重复发送
+
+    The shared call runs as its own task, so a caller that is cancelled does not
+    cancel it for the others. Results are shared objects and must be treated as
+    read-only by callers.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]], label: Optional[str] = None) -> Any:
+        stats = self._stats.setdefault(label or str(key), {"executed": 0, "shared": 0})
+        task = self._inflight.get(key)
+        if task is None:
+            stats["executed"] += 1
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+        else:
+            stats["shared"] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 所有调用方都已取消时，避免 "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    def forget(self, label: Optional[str] = None):
+        """
+        让之后的调用不再合并到当前在途的请求（写操作之后保证读到新状态）
+
+        In-flight calls keep running for the callers already waiting on them.
+        """
+        if label is None:
+            self._inflight.clear()
+            return
+        for key in [k for k in self._inflight if isinstance(k, tuple) and k[0] == label]:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """每类请求的实际执行次数与合并（命中）次数"""
+        return {label: dict(counts) for label, counts in sorted(self._stats.items())}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
@@ -111,11 +111,13 @@ class UnityMCPTool:
                 "node",
                 str(self.project_root / "src" / "create-template.js"),
                 template_name,
-                json.dumps(template_data)
+                "-"
             ]
 
+            # 模板数据走stdin，大模板不受命令行参数长度限制
             result = subprocess.run(
                 cmd,
+                input=json.dumps(template_data),
                 capture_output=True,
                 text=True,
                 cwd=str(self.project_root)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Trace - 工具调用录制
+Records tool-call workloads to JSONL; replay and benchmarks live in unity_mcp_bench.py
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import List
+
+
+class TraceRecorder:
+    """把每一次工具调用写成一行JSONL"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, "a", encoding="utf-8")
+        self.started_at = time.time()
+        self.count = 0
+
+    def record(self, tool: str, arguments: dict, started_at: float,
+               duration_ms: float, response_bytes: int, success: bool):
+        """Append one tool call to the trace"""
+        entry = {
+            "ts": round(started_at, 6),
+            "offset": round(started_at - self.started_at, 6),
+            "tool": tool,
+            "arguments": arguments or {},
+            "duration_ms": round(duration_ms, 3),
+            "response_bytes": response_bytes,
+            "success": success
+        }
+        self.file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def load_trace(path: str) -> List[dict]:
+    """读取JSONL trace，按时间排序"""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    entries.sort(key=lambda e: e.get("offset", 0))
+    return entries
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Unity MCP Transport - Bridge连接传输层
+WebSocket (ws://) for UnityMCPBridge, length-prefixed TCP (tcp://) for SimpleUnityMCP
+"""
+
+import asyncio
+import json
+import os
+import struct
+import sys
+import time
+import websockets
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from unity_mcp_profile import add_phase, phase
+
+# TCP帧头：4字节大端长度
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 512 * 1024 * 1024
+
+# 未设置 UNITY_MCP_URL 时连接的Bridge地址（UnityMCPBridge默认端口）
+DEFAULT_BRIDGE_URL = "ws://localhost:8765"
+
+# 单个请求等待响应的默认上限（秒），UNITY_MCP_REQUEST_TIMEOUT 覆盖，0 表示不限
+DEFAULT_REQUEST_TIMEOUT = 120.0
+
+
+class TransportClosed(ConnectionError):
+    """Raised when the connection to the Unity bridge is lost"""
+
+
+class RequestTimeout(TimeoutError):
+    """Raised when the bridge does not answer a request within the timeout"""
+
+
+class UnityTransport:
+    """
+    传输层基类：按请求id分发响应，支持流水线（多个请求同时在途）
+
+    Messages without a pending id (status pushes, heartbeats) go to on_notification.
+    """
+
+    def __init__(self, url: str, on_notification: Optional[Callable[[dict], None]] = None,
+                 request_timeout: Optional[float] = None):
+        self.url = url
+        self.on_notification = on_notification
+        if request_timeout is None:
+            request_timeout = float(os.environ.get("UNITY_MCP_REQUEST_TIMEOUT", DEFAULT_REQUEST_TIMEOUT))
+        self.request_timeout = request_timeout
+        self.connected = False
+        self._opened = False
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._reader_task = None
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self.url).hostname or "localhost"
+
+    async def connect(self):
+        await self._open()
+        self._opened = True
+        self.connected = True
+        self._reader_task = asyncio.ensure_future(self._read_loop())
+
+    async def request(self, message: dict, timeout: Optional[float] = None) -> dict:
+        """
+        发送请求并等待同id的响应
+
+        Raises RequestTimeout when no response arrives within timeout (default
+        request_timeout) seconds, e.g. when the editor is hung or paused in a debugger.
+        The pending id is dropped on timeout or cancellation; a late response is discarded.
+        """
+        if not self.connected:
+            raise TransportClosed("Not connected to Unity Editor")
+
+        future = asyncio.get_event_loop().create_future()
+        self._pending[message["id"]] = future
+        try:
+            phase("send")
+            await self._send(json.dumps(message))
+            phase("socket")
+            timeout = self.request_timeout if timeout is None else timeout
+            try:
+                response, parse_seconds = await asyncio.wait_for(future, timeout if timeout > 0 else None)
+            except asyncio.TimeoutError:
+                raise RequestTimeout(f"No response from Unity Editor within {timeout:g}s ({message.get('method')})")
+            add_phase("parse", parse_seconds)
+            return response
+        finally:
+            self._pending.pop(message["id"], None)
+
+    async def close(self):
+        self.connected = False
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        # 连接失败的transport没有可关闭的底层连接
+        if self._opened:
+            self._opened = False
+            await self._close()
+        self._fail_pending(TransportClosed("Transport closed"))
+
+    async def _read_loop(self):
+        try:
+            while True:
+                raw = await self._receive()
+                started = time.perf_counter()
+                message = json.loads(raw)
+                future = self._pending.get(str(message.get("id")))
+                if future and not future.done():
+                    # 解析耗时随响应一起交给请求方，便于剖析时单独统计
+                    future.set_result((message, time.perf_counter() - started))
+                elif message.get("heartbeat") or message.get("id") is not None:
+                    # 心跳，或已超时/已取消请求的迟到响应
+                    continue
+                elif self.on_notification:
+                    self.on_notification(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️  Unity transport closed: {e}", file=sys.stderr)
+        self.connected = False
+        self._fail_pending(TransportClosed("Connection to Unity Editor lost"))
+
+    def _fail_pending(self, error: Exception):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    # 子类实现
+    async def _open(self):
+        raise NotImplementedError
+
+    async def _send(self, data: str):
+        raise NotImplementedError
+
+    async def _receive(self) -> str:
+        raise NotImplementedError
+
+    async def _close(self):
+        raise NotImplementedError
+
+
+class WebSocketTransport(UnityTransport):
+    """WebSocket transport for UnityMCPBridge"""
+
+    async def _open(self):
+        # 大响应可能超过websockets默认的1MiB帧限制
+        self._websocket = await websockets.connect(self.url, max_size=None)
+
+    async def _send(self, data: str):
+        try:
+            await self._websocket.send(data)
+        except websockets.exceptions.ConnectionClosed as e:
+            raise TransportClosed(str(e))
+
+    async def _receive(self) -> str:
+        return await self._websocket.recv()
+
+    async def _close(self):
+        await self._websocket.close()
+
+
+class TcpTransport(UnityTransport):
+    """Length-prefixed TCP transport for SimpleUnityMCP: 4-byte big-endian length + UTF-8 JSON"""
+
+    async def _open(self):
+        parts = urlsplit(self.url)
+        self._reader, self._writer = await asyncio.open_connection(parts.hostname or "localhost", parts.port or 8765)
+
+    async def _send(self, data: str):
+        payload = data.encode("utf-8")
+        try:
+            self._writer.write(FRAME_HEADER.pack(len(payload)) + payload)
+            await self._writer.drain()
+        except (ConnectionError, OSError) as e:
+            raise TransportClosed(str(e))
+
+    async def _receive(self) -> str:
+        (length,) = FRAME_HEADER.unpack(await self._reader.readexactly(FRAME_HEADER.size))
+        if length > MAX_FRAME_BYTES:
+            raise TransportClosed(f"Frame of {length} bytes exceeds limit")
+        return (await self._reader.readexactly(length)).decode("utf-8")
+
+    async def _close(self):
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+TRANSPORTS = {
+    "ws": WebSocketTransport,
+    "wss": WebSocketTransport,
+    "tcp": TcpTransport,
+}
+
+
+def create_transport(url: str, on_notification: Optional[Callable[[dict], None]] = None,
+                     request_timeout: Optional[float] = None) -> UnityTransport:
+    """按URL scheme选择传输层"""
+    scheme = urlsplit(url).scheme
+    if scheme not in TRANSPORTS:
+        raise ValueError(f"Unsupported Unity bridge URL scheme: {scheme or url}")
+    return TRANSPORTS[scheme](url, on_notification, request_timeout)
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Unity Scene Store - 本地场景层级索引
+Compact, array-backed copy of the editor hierarchy that answers lookups and queries in-process
+"""
+
+import fnmatch
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+
+class SceneStore:
+    """
+    场景层级的列式存储，节点按先序(preorder)排列
+
+    Every node i owns the contiguous range [i, subtree_end[i]), so subtree queries are
+    slices and glob matching can skip whole branches. Names and component types are
+    interned; name and component postings are CSR arrays rather than per-key lists.
+    """
+
+    def __init__(self):
+        self.scene_name = ""
+        self.scene_path = ""
+        self.ids = array("q")
+        self.parents = array("i")
+        self.subtree_end = array("i")
+        self.active = bytearray()
+        self.name_ids = array("i")
+        self.names: List[str] = []
+        self.component_types: List[str] = []
+        self.component_offsets = array("i", [0])
+        self.component_ids = array("i")
+
+        self._name_lookup: Dict[str, int] = {}
+        self._type_lookup: Dict[str, int] = {}
+        self._name_offsets = array("i", [0])
+        self._name_postings = array("i")
+        self._type_offsets = array("i", [0])
+        self._type_postings = array("i")
+        self._sorted_ids = array("q")
+        self._id_order = array("i")
+
+    def __len__(self):
+        return len(self.ids)
+
+    def load(self, data: dict):
+        """从 unity.get_scene_hierarchy 的列式结果构建存储和索引"""
+        parents = data.get("parents", [])
+        count = len(parents)
+        for i, parent in enumerate(parents):
+            if parent >= i:
+                raise ValueError(f"Scene hierarchy is not in preorder at index {i}")
+
+        self.__init__()
+        self.scene_name = data.get("sceneName", "")
+        self.scene_path = data.get("scenePath", "")
+        self.ids = array("q", data.get("ids", []))
+        self.parents = array("i", parents)
+        self.active = bytearray(data.get("active", [1] * count))
+        self.component_types = list(data.get("componentTypes", []))
+        self.component_offsets = array("i", data.get("componentOffsets", [0] * (count + 1)))
+        self.component_ids = array("i", data.get("componentIds", []))
+        self._type_lookup = {name: i for i, name in enumerate(self.component_types)}
+
+        # 名称驻留
+        name_ids = array("i", bytes(4 * count))
+        for i, name in enumerate(data.get("names", [])):
+            name_id = self._name_lookup.get(name)
+            if name_id is None:
+                name_id = self._name_lookup[name] = len(self.names)
+                self.names.append(name)
+            name_ids[i] = name_id
+        self.name_ids = name_ids
+
+        # 子树范围
+        subtree_end = array("i", range(1, count + 1))
+        for i in range(count - 1, -1, -1):
+            parent = parents[i]
+            if parent >= 0 and subtree_end[i] > subtree_end[parent]:
+                subtree_end[parent] = subtree_end[i]
+        self.subtree_end = subtree_end
+
+        self._name_offsets, self._name_postings = self._build_postings(
+            len(self.names), ((i, name_ids[i]) for i in range(count)), count)
+        type_pairs = ((i, self.component_ids[k])
+                      for i in range(count)
+                      for k in range(self.component_offsets[i], self.component_offsets[i + 1]))
+        self._type_offsets, self._type_postings = self._build_postings(
+            len(self.component_types), type_pairs, len(self.component_ids))
+
+        self._id_order = array("i", sorted(range(count), key=self.ids.__getitem__))
+        self._sorted_ids = array("q", (self.ids[i] for i in self._id_order))
+        return self
+
+    @staticmethod
+    def _build_postings(keys: int, pairs: Iterable, total: int):
+        """Counting sort of (node, key) pairs into CSR offsets + postings"""
+        pairs = list(pairs)
+        offsets = array("i", bytes(4 * (keys + 1)))
+        for _, key in pairs:
+            offsets[key + 1] += 1
+        for k in range(keys):
+            offsets[k + 1] += offsets[k]
+        cursor = array("i", offsets)
+        postings = array("i", bytes(4 * total))
+        for node, key in pairs:
+            postings[cursor[key]] = node
+            cursor[key] += 1
+        return offsets, postings
+
+    # ========== 基础查询 ==========
+
+    def index_of(self, instance_id: int) -> Optional[int]:
+        pos = bisect_left(self._sorted_ids, instance_id)
+        if pos < len(self._sorted_ids) and self._sorted_ids[pos] == instance_id:
+            return self._id_order[pos]
+        return None
+
+    def name_of(self, index: int) -> str:
+        return self.names[self.name_ids[index]]
+
+    def path_of(self, index: int) -> str:
+        parts = []
+        while index >= 0:
+            parts.append(self.names[self.name_ids[index]])
+            index = self.parents[index]
+        return "/".join(reversed(parts))
+
+    def components_of(self, index: int) -> List[str]:
+        return [self.component_types[self.component_ids[k]]
+                for k in range(self.component_offsets[index], self.component_offsets[index + 1])]
+
+    def find_by_name(self, name: str) -> List[int]:
+        name_id = self._name_lookup.get(name)
+        if name_id is None:
+            return []
+        return list(self._name_postings[self._name_offsets[name_id]:self._name_offsets[name_id + 1]])
+
+    def find_by_path(self, path: str) -> List[int]:
+        """精确路径：取叶子名称的倒排表，再沿父链校验"""
+        segments = path.strip("/").split("/")
+        matches = []
+        for index in self.find_by_name(segments[-1]):
+            node, depth = index, len(segments) - 1
+            while depth > 0:
+                node = self.parents[node]
+                if node < 0 or self.names[self.name_ids[node]] != segments[depth - 1]:
+                    break
+                depth -= 1
+            if depth == 0 and self.parents[node] < 0:
+                matches.append(index)
+        return matches
+
+    def with_component(self, type_name: str) -> List[int]:
+        type_id = self._type_lookup.get(type_name)
+        if type_id is None:
+            return []
+        return list(self._type_postings[self._type_offsets[type_id]:self._type_offsets[type_id + 1]])
+
+    def subtree(self, index: int) -> range:
+        """All descendants of index (excluding itself), in preorder"""
+        return range(index + 1, self.subtree_end[index])
+
+    def ancestors(self, index: int) -> List[int]:
+        result = []
+        index = self.parents[index]
+        while index >= 0:
+            result.append(index)
+            index = self.parents[index]
+        return result
+
+    def resolve(self, target) -> Optional[int]:
+        """instanceId、精确路径或名称 -> 节点索引"""
+        if isinstance(target, int):
+            return self.index_of(target)
+        matches = self.find_by_path(target) if "/" in target else self.find_by_name(target)
+        return matches[0] if matches else None
+
+    # ========== 路径glob ==========
+
+    def glob(self, pattern: str, within: Optional[range] = None) -> List[int]:
+        """
+        Match hierarchy paths against a glob: '*' and '?' match within one segment,
+        '**' matches any number of segments. Branches that cannot match are skipped.
+        """
+        matcher = _PathGlob(pattern)
+        leaf = matcher.literal_leaf
+        if leaf is not None:
+            # 只校验候选的父链，不扫描层级
+            candidates = self.find_by_name(leaf)
+            if within is not None:
+                candidates = [i for i in candidates if within.start <= i < within.stop]
+            return [i for i in candidates if matcher.final in self._states_for(matcher, i)]
+
+        names, name_ids, parents, subtree_end = self.names, self.name_ids, self.parents, self.subtree_end
+        transitions: Dict[tuple, frozenset] = {}
+        node_states: Dict[int, frozenset] = {}
+        matches = []
+        i = within.start if within else 0
+        stop = within.stop if within else len(self.ids)
+        while i < stop:
+            parent = parents[i]
+            if parent < 0:
+                parent_states = matcher.start
+            elif parent in node_states:
+                parent_states = node_states[parent]
+            else:
+                parent_states = self._states_for(matcher, parent)
+            key = (parent_states, name_ids[i])
+            states = transitions.get(key)
+            if states is None:
+                states = transitions[key] = matcher.advance(parent_states, names[name_ids[i]])
+            if not states:
+                i = subtree_end[i]
+                continue
+            node_states[i] = states
+            if matcher.final in states:
+                matches.append(i)
+            i += 1
+        return matches
+
+    def _states_for(self, matcher: "_PathGlob", index: int) -> frozenset:
+        """Matcher states after consuming the full path of index"""
+        states = matcher.start
+        for node in reversed([index] + self.ancestors(index)):
+            states = matcher.advance(states, self.names[self.name_ids[node]])
+            if not states:
+                break
+        return states
+
+    def has_component(self, index: int, type_id: int) -> bool:
+        return type_id in self.component_ids[self.component_offsets[index]:self.component_offsets[index + 1]]
+
+    # ========== 组合查询 ==========
+
+    def query(self, path: Optional[str] = None, name: Optional[str] = None,
+              component: Optional[str] = None, subtree_of=None, ancestors_of=None,
+              active_only: bool = False, limit: int = 100) -> List[int]:
+        """Combine filters, most selective first; returns node indices in hierarchy order"""
+        within = None
+        if subtree_of is not None:
+            root = self.resolve(subtree_of)
+            if root is None:
+                return []
+            within = self.subtree(root)
+
+        candidates = None
+        if ancestors_of is not None:
+            node = self.resolve(ancestors_of)
+            if node is None:
+                return []
+            candidates = sorted(self.ancestors(node))
+        if name is not None:
+            by_name = self.find_by_name(name)
+            candidates = by_name if candidates is None else sorted(set(candidates).intersection(by_name))
+        if within is not None and candidates is not None:
+            candidates = [i for i in candidates if within.start <= i < within.stop]
+
+        if component is not None:
+            type_id = self._type_lookup.get(component)
+            if type_id is None:
+                return []
+            if candidates is None and path is None:
+                candidates = self.with_component(component)
+                if within is not None:
+                    candidates = [i for i in candidates if within.start <= i < within.stop]
+            elif candidates is not None:
+                candidates = [i for i in candidates if self.has_component(i, type_id)]
+
+        if path is not None:
+            if candidates is not None:
+                # 候选集已确定：逐个校验路径，避免扫描层级
+                matcher = _PathGlob(path)
+                candidates = [i for i in candidates if matcher.final in self._states_for(matcher, i)]
+            else:
+                candidates = self.glob(path, within)
+            if component is not None and name is None and ancestors_of is None:
+                candidates = [i for i in candidates if self.has_component(i, type_id)]
+        elif candidates is None:
+            candidates = within if within is not None else range(len(self.ids))
+
+        results = []
+        for index in candidates:
+            if active_only and not self.active[index]:
+                continue
+            results.append(index)
+            if len(results) >= limit:
+                break
+        return results
+
+
+class _PathGlob:
+    """NFA over path segments; a state is the number of pattern segments consumed"""
+
+    def __init__(self, pattern: str):
+        segments = pattern.strip("/").split("/")
+        self.matchers = [None if seg == "**" else self._segment_matcher(seg) for seg in segments]
+        self.final = len(segments)
+        self.start = self._closure({0})
+        last = segments[-1]
+        # 含'**'时层级剪枝失效，末段为字面量则改为从名称索引出发
+        has_globstar = None in self.matchers
+        self.literal_leaf = last if has_globstar and last != "**" and not any(ch in last for ch in "*?[") else None
+
+    @staticmethod
+    def _segment_matcher(segment: str):
+        if not any(ch in segment for ch in "*?["):
+            return segment.__eq__
+        return re.compile(fnmatch.translate(segment)).match
+
+    def _closure(self, states) -> frozenset:
+        # 中间的'**'可以匹配零个segment；末尾的'**'只匹配后代，不含自身
+        result = set(states)
+        for state in list(result):
+            while state < self.final - 1 and self.matchers[state] is None:
+                state += 1
+                result.add(state)
+        return frozenset(result)
+
+    def advance(self, states: frozenset, name: str) -> frozenset:
+        result = set()
+        for state in states:
+            if state == self.final:
+                continue
+            matcher = self.matchers[state]
+            if matcher is None:
+                result.add(state)
+                if state == self.final - 1:
+                    result.add(self.final)
+            elif matcher(name):
+                result.add(state + 1)
+        return self._closure(result) if result else frozenset()